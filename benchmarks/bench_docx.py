@@ -0,0 +1,82 @@
+"""
+Streaming DOCX extraction versus the python-docx object model.
+
+Builds template-style resumes (header, two-column tables, a text box per
+section) of increasing size, then reports time, peak traced memory and how
+much text each path recovers. python-docx's Document.paragraphs only sees
+top-level body paragraphs, which is what parse_resume used to read.
+
+    python -m benchmarks.bench_docx
+"""
+import io
+import time
+import tracemalloc
+
+from docx import Document
+from docx.oxml import parse_xml
+
+from utils.file_parser import iter_docx_paragraphs
+
+SECTION_COUNTS = (10, 100, 1000)
+TEXT_BOX = (
+    '<w:r xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+    ' xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"'
+    ' xmlns:wps="http://schemas.microsoft.com/office/word/2010/wordprocessingShape"'
+    ' xmlns:v="urn:schemas-microsoft-com:vml">'
+    '<mc:AlternateContent><mc:Choice Requires="wps"><w:drawing><wps:wsp><wps:txbx><w:txbxContent>'
+    '<w:p><w:r><w:t>{text}</w:t></w:r></w:p>'
+    '</w:txbxContent></wps:txbx></wps:wsp></w:drawing></mc:Choice>'
+    '<mc:Fallback><w:pict><v:shape><v:textbox><w:txbxContent>'
+    '<w:p><w:r><w:t>{text}</w:t></w:r></w:p>'
+    '</w:txbxContent></v:textbox></v:shape></w:pict></mc:Fallback></mc:AlternateContent></w:r>'
+)
+
+
+def make_docx(sections):
+    document = Document()
+    document.sections[0].header.paragraphs[0].text = "Jane Doe | jane@example.com | 555-123-4567"
+    for section in range(sections):
+        document.add_paragraph(f"EXPERIENCE {section}")
+        table = document.add_table(rows=4, cols=2)
+        for row in table.rows:
+            row.cells[0].text = "2019 - 2023"
+            row.cells[1].text = f"Led Python and Kubernetes migration {section}, cutting costs 30%"
+        paragraph = document.add_paragraph()
+        paragraph._p.append(parse_xml(TEXT_BOX.format(text=f"Skills: Python, SQL, Docker {section}")))
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def python_docx_text(data):
+    return '\n'.join(paragraph.text for paragraph in Document(io.BytesIO(data)).paragraphs)
+
+
+def streaming_text(data):
+    return '\n'.join(iter_docx_paragraphs(io.BytesIO(data)))
+
+
+def measure(func, data):
+    """Return (seconds, peak traced bytes, characters); timed without tracing"""
+    start = time.perf_counter()
+    text = func(data)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func(data)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak, len(text)
+
+
+def main():
+    print(f"{'sections':>9}{'size KB':>9} | {'python-docx ms':>15}{'MB':>7}{'chars':>9} | "
+          f"{'streaming ms':>13}{'MB':>7}{'chars':>9}")
+    for sections in SECTION_COUNTS:
+        data = make_docx(sections)
+        row = measure(python_docx_text, data) + measure(streaming_text, data)
+        print(f"{sections:>9}{len(data) / 1024:>9.0f} | {row[0] * 1e3:>15.1f}{row[1] / 2**20:>7.1f}{row[2]:>9} | "
+              f"{row[3] * 1e3:>13.1f}{row[4] / 2**20:>7.1f}{row[5]:>9}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""
+sklearn RandomForestClassifier versus the array-backed FlatForest.
+
+Fits a 100-tree forest on 1000 TF-IDF features like MLScorer's, checks
+that FlatForest's probabilities are bit-identical, and reports
+single-request latency, batch throughput and artifact load time.
+
+    python -m benchmarks.bench_forest
+"""
+import os
+import random
+import tempfile
+import time
+
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from utils.forest_engine import FlatForest
+from utils.model_artifact import ModelArtifact, write_artifact
+
+VOCAB = [f'term{i}' for i in range(4000)]
+
+
+def make_docs(n, rng):
+    return [' '.join(rng.choice(VOCAB) for _ in range(rng.randint(150, 500))) for _ in range(n)]
+
+
+def timed(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    rng = random.Random(7)
+    train = make_docs(2000, rng)
+    vectorizer = TfidfVectorizer(max_features=1000, ngram_range=(1, 2)).fit(train)
+    forest = RandomForestClassifier(n_estimators=100, random_state=42)
+    forest.fit(vectorizer.transform(train), [rng.randint(0, 1) for _ in train])
+    flat = FlatForest.from_sklearn(forest)
+
+    batch = vectorizer.transform(make_docs(1024, rng))
+    single = batch[:1]
+    identical = np.array_equal(forest.predict_proba(batch), flat.predict_proba(batch))
+    print(f"bit-identical probabilities on 1024 resumes: {identical}\n")
+
+    print(f"{'':<22}{'sklearn':>12}{'flat':>12}{'speedup':>9}")
+    sk = timed(lambda: forest.predict_proba(single), 200)
+    fl = timed(lambda: flat.predict_proba(single), 200)
+    print(f"{'1 resume latency ms':<22}{sk * 1e3:>12.3f}{fl * 1e3:>12.3f}{sk / fl:>8.1f}x")
+    sk = timed(lambda: forest.predict_proba(batch), 5)
+    fl = timed(lambda: flat.predict_proba(batch), 5)
+    print(f"{'1024 batch resumes/s':<22}{1024 / sk:>12.0f}{1024 / fl:>12.0f}{sk / fl:>8.1f}x")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'forest.atsm')
+        write_artifact(path, {'model': forest, 'forest': flat})
+        sk = timed(lambda: ModelArtifact(path).load('model'), 5)
+        fl = timed(lambda: ModelArtifact(path).load('forest'), 5)
+        print(f"{'artifact load ms':<22}{sk * 1e3:>12.2f}{fl * 1e3:>12.2f}{sk / fl:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""
+Cold-import budget for the analyzer.
+
+Imports utils.ats_analyzer in fresh interpreters and reports the median
+cumulative import time from -X importtime. Exits non-zero when the median
+exceeds the budget, so it can gate CI.
+
+    python -m benchmarks.bench_import [--budget-ms 250]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+MODULE = 'utils.ats_analyzer'
+
+
+def import_time_ms(module):
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            capture_output=True, text=True, check=True)
+    for line in result.stderr.splitlines():
+        fields = [field.strip() for field in line.split('|')]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1]) / 1000
+    raise RuntimeError(f"{module} not found in importtime output")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--budget-ms', type=float, default=250)
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    times = [import_time_ms(MODULE) for _ in range(args.runs)]
+    median = statistics.median(times)
+    print(f"import {MODULE}: median {median:.1f} ms over {args.runs} runs "
+          f"(min {min(times):.1f}, max {max(times):.1f}), budget {args.budget_ms:.0f} ms")
+    return 0 if median <= args.budget_ms else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
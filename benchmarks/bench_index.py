@@ -0,0 +1,66 @@
+"""
+Candidate index build and query latency over synthetic analysis results.
+
+Indexes N results (12 skills each from a 500-skill vocabulary, random
+education, experience and leadership), then times structured queries and
+reopening the index from disk. Pass N as the first argument (default 1000000).
+
+    python -m benchmarks.bench_index 1000000
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from utils.candidate_index import CandidateIndex
+
+SKILLS = [f'skill{i}' for i in range(500)] + ['python', 'kubernetes', 'sql', 'docker']
+LEVELS = ["Associate's", "Bachelor's", "Master's", 'Doctorate', None]
+QUERIES = (
+    "python AND kubernetes, education >= Master's, experience >= 5",
+    "python",
+    "score >= 90, leadership = strong",
+)
+
+
+def make_analysis(rng):
+    level = rng.choice(LEVELS)
+    return {
+        'overall_score': rng.uniform(20, 95),
+        'hr_snapshot': {'Quick Stats': {
+            'Skills': {'Technical': rng.sample(SKILLS, 12)},
+            'Experience': f"{rng.randint(0, 20)} years (2000 - 2020)",
+            'Education': {'level': level} if level else "Education details not found",
+            'Leadership Indicators': rng.choice(['None', 'Limited', 'Strong'])
+        }}
+    }
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(7)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'candidates.sqlite')
+        index = CandidateIndex(path)
+        start = time.perf_counter()
+        for batch in range(0, n, 10_000):
+            index.add_many([(f'resume{i}.pdf', make_analysis(rng))
+                            for i in range(batch, min(n, batch + 10_000))])
+        print(f"indexed {len(index)} results in {time.perf_counter() - start:.1f}s")
+
+        for query in QUERIES:
+            start = time.perf_counter()
+            for _ in range(20):
+                hits = index.search(query, limit=10)
+            print(f"{(time.perf_counter() - start) / 20 * 1e3:8.2f} ms  {len(hits):>3} hits  {query}")
+
+        index.remove(hits[0]['source'])
+        index.close()
+        start = time.perf_counter()
+        CandidateIndex(path).close()
+        print(f"reopen: {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+Per-text versus batched MLScorer inference.
+
+Fits a scorer on a small synthetic corpus, then scores batches of 1, 64 and
+1024 resumes both with repeated predict_score calls and with one
+predict_scores call, reporting resumes per second.
+
+    python -m benchmarks.bench_ml_batch
+"""
+import contextlib
+import io
+import random
+import time
+
+import numpy as np
+
+from utils.ml_scorer import MLScorer, STAT_FEATURES
+
+BATCH_SIZES = [1, 64, 1024]
+VOCAB = ['python', 'java', 'kubernetes', 'led', 'team', 'managed', 'developed', 'project',
+         'experience', 'education', 'university', 'skills', 'sql', 'aws', 'increased',
+         'revenue', 'customer', 'design', 'analysis', 'report', '2019', '2021', 'senior']
+
+
+def make_texts(n, rng):
+    return [' '.join(rng.choice(VOCAB) for _ in range(rng.randint(150, 600))) for _ in range(n)]
+
+
+def fitted_scorer(rng):
+    scorer = MLScorer()
+    texts = make_texts(200, rng)
+    processed, stats = zip(*(scorer.preprocess_text(text) for text in texts))
+    scorer.vectorizer.fit(processed)
+    scorer.model.fit(scorer.vectorizer.transform(processed), [rng.randint(0, 1) for _ in texts])
+    scorer.scaler.fit(np.array([[s[name] for name in STAT_FEATURES] for s in stats], dtype=float))
+    return scorer
+
+
+def rate(func, texts, min_seconds=1.0):
+    runs, start = 0, time.perf_counter()
+    while True:
+        func(texts)
+        runs += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return runs * len(texts) / elapsed
+
+
+def main():
+    rng = random.Random(0)
+    # Preprocessing warnings (e.g. missing NLTK data) would swamp the table
+    with contextlib.redirect_stdout(io.StringIO()):
+        scorer = fitted_scorer(rng)
+    print(f"{'batch':>6}{'per-text/s':>14}{'batched/s':>12}{'speedup':>9}")
+    for size in BATCH_SIZES:
+        texts = make_texts(size, rng)
+        with contextlib.redirect_stdout(io.StringIO()):
+            single = rate(lambda batch: [scorer.predict_score(t) for t in batch], texts)
+            batched = rate(scorer.predict_scores, texts)
+        print(f"{size:>6}{single:>14.1f}{batched:>12.1f}{batched / single:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+PDF extraction time per backend and page count.
+
+Renders synthetic resumes of 2, 20 and 100 pages with reportlab, then times
+parse_resume with every installed backend (PyPDF2, pypdf, pdfminer.six) and
+PyPDF2 split across worker processes. Limits are lifted so every page is read.
+
+    python -m benchmarks.bench_pdf_backends
+"""
+import io
+import time
+
+from reportlab.lib.pagesizes import letter
+from reportlab.pdfgen import canvas
+
+from utils.file_parser import PDF_BACKENDS, ParseLimits, parse_resume
+
+PAGE_COUNTS = (2, 20, 100)
+NO_LIMITS = ParseLimits(max_bytes=1 << 30, max_pages=1 << 20, max_chars=1 << 30)
+
+
+class Upload(io.BytesIO):
+    """In-memory stand-in for a Streamlit upload"""
+    name = 'resume.pdf'
+
+
+def make_pdf(pages):
+    buffer = io.BytesIO()
+    pdf = canvas.Canvas(buffer, pagesize=letter)
+    for page in range(pages):
+        y = 740
+        pdf.drawString(72, y, "EXPERIENCE" if page % 2 == 0 else "PROJECTS")
+        for line in range(45):
+            y -= 15
+            pdf.drawString(72, y, f"Led migration of service {page}-{line} to Python and Kubernetes, "
+                                  f"cutting latency by {line}%")
+        pdf.showPage()
+    pdf.save()
+    return buffer.getvalue()
+
+
+def timed(data, repeat, **kwargs):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        parse_resume(Upload(data), limits=NO_LIMITS, **kwargs)
+    return (time.perf_counter() - start) / repeat
+
+
+def available_backends():
+    for name, backend in PDF_BACKENDS.items():
+        try:
+            backend(io.BytesIO(make_pdf(1)))
+        except ImportError:
+            print(f"skipping {name}: not installed")
+            continue
+        yield name
+
+
+def main():
+    backends = list(available_backends())
+    columns = backends + ['pypdf2 x4']
+    print(f"{'pages':>6}" + ''.join(f"{name:>14}" for name in columns) + "   (ms)")
+    for pages in PAGE_COUNTS:
+        data = make_pdf(pages)
+        repeat = max(1, 40 // pages)
+        row = [timed(data, repeat, pdf_backend=name) for name in backends]
+        row.append(timed(data, repeat, pdf_backend='pypdf2', workers=4))
+        print(f"{pages:>6}" + ''.join(f"{seconds * 1e3:>14.1f}" for seconds in row))
+
+
+if __name__ == '__main__':
+    main()
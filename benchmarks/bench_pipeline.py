@@ -0,0 +1,193 @@
+"""
+End-to-end and per-stage benchmark over the synthetic corpus.
+
+Renders the corpus from benchmarks.corpus as PDF and DOCX, trains a scorer
+on it, then times parse_resume, ResumeDocument, every ats_analyzer rule,
+MLScorer.predict_score, create_pdf_report and the full parse + analyze path
+one call at a time. Reports calls/s, p50 and p99 per stage and compares
+them with a stored baseline, exiting non-zero on a regression.
+
+    python -m benchmarks.bench_pipeline --save-baseline   # record this machine's numbers
+    python -m benchmarks.bench_pipeline                   # compare against them
+"""
+import os
+import tempfile
+
+# The benchmark trains its own model; point the analyzer at it before the
+# scorer's module-level configuration is read
+os.environ['ATS_MODEL_PATH'] = os.path.join(tempfile.mkdtemp(), 'scorer.atsm')
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import sys
+import time
+
+import numpy as np
+
+from benchmarks.corpus import generate_resumes, render_docx, render_pdf
+from utils import ats_analyzer
+from utils.ats_analyzer import analyze_resume, get_ml_scorer
+from utils.file_parser import parse_resume
+from utils.ml_scorer import MODEL_PATH, MLScorer
+from utils.pdf_generator import create_pdf_report
+from utils.resume_document import ResumeDocument
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+# Rules that take only the document
+DOC_RULES = ('analyze_format', 'analyze_content', 'analyze_keywords', 'check_format',
+             'check_contact_info', 'check_experience', 'check_education', 'check_skills',
+             'generate_hr_snapshot', 'estimate_experience_years', 'identify_education_level',
+             'identify_key_skills', 'check_missing_sections', 'check_leadership_indicators')
+
+
+class Upload(io.BytesIO):
+    """In-memory stand-in for a Streamlit upload"""
+    def __init__(self, data, name):
+        super().__init__(data)
+        self.name = name
+
+
+def train_scorer(texts):
+    """Fit and save a small scorer so the ML stage does real work"""
+    labels = [int('Leadership' in text or len(text) > 1500) for text in texts]
+    labels[:2] = [0, 1]
+    with contextlib.redirect_stdout(io.StringIO()):
+        MLScorer(preprocessing='fast').fit(texts, labels).save_artifact(MODEL_PATH)
+        get_ml_scorer()
+
+
+def build_stages(resumes):
+    """Return {stage: (setup, call)}; setup builds per-call inputs outside the timed region"""
+    texts = [resume.text for resume in resumes]
+    pdfs = [render_pdf(text) for text in texts]
+    docxs = [render_docx(text, table_skills=i % 2 == 1) for i, text in enumerate(texts)]
+    with contextlib.redirect_stdout(io.StringIO()):
+        analyses = [analyze_resume(text) for text in texts]
+    scorer = get_ml_scorer()
+
+    stages = {
+        'parse_resume[pdf]': (lambda i: Upload(pdfs[i], 'r.pdf'), parse_resume),
+        'parse_resume[docx]': (lambda i: Upload(docxs[i], 'r.docx'), parse_resume),
+        'ResumeDocument': (lambda i: texts[i], ResumeDocument),
+    }
+    for name in DOC_RULES:
+        stages[name] = (lambda i: ResumeDocument(texts[i]), getattr(ats_analyzer, name))
+
+    def recommendation_inputs(i):
+        doc = ResumeDocument(texts[i])
+        content = {"Contact Information": ats_analyzer.check_contact_info(doc),
+                   "Experience": ats_analyzer.check_experience(doc),
+                   "Education": ats_analyzer.check_education(doc),
+                   "Skills": ats_analyzer.check_skills(doc)}
+        return doc, ats_analyzer.check_format(doc), content
+    stages['generate_recommendations'] = (recommendation_inputs,
+                                          lambda args: ats_analyzer.generate_recommendations(*args))
+    stages['MLScorer.predict_score'] = (lambda i: texts[i], scorer.predict_score)
+    stages['analyze_resume'] = (lambda i: texts[i], analyze_resume)
+    stages['create_pdf_report'] = (lambda i: analyses[i], create_pdf_report)
+    stages['end_to_end[pdf]'] = (lambda i: Upload(pdfs[i], 'r.pdf'),
+                                 lambda upload: analyze_resume(parse_resume(upload)[0]))
+    stages['end_to_end[docx]'] = (lambda i: Upload(docxs[i], 'r.docx'),
+                                  lambda upload: analyze_resume(parse_resume(upload)[0]))
+    return stages
+
+
+def run_stage(setup, call, n, repeat):
+    """Time call once per corpus item, repeat times; returns per-call seconds"""
+    samples = []
+    for _ in range(repeat):
+        for i in range(n):
+            argument = setup(i)
+            start = time.perf_counter()
+            call(argument)
+            samples.append(time.perf_counter() - start)
+    return np.array(samples)
+
+
+def summarize(samples):
+    return {
+        'calls_per_s': round(len(samples) / samples.sum(), 2),
+        'p50_ms': round(float(np.percentile(samples, 50)) * 1e3, 4),
+        'p99_ms': round(float(np.percentile(samples, 99)) * 1e3, 4),
+    }
+
+
+def compare(results, baseline, tolerance, min_delta_ms):
+    """
+    Return the names of stages whose p50 or p99 got slower than the baseline
+    allows. Slowdowns under min_delta_ms are timer noise on microsecond stages.
+    """
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        if any(result[key] > previous[key] * (1 + tolerance) and result[key] - previous[key] > min_delta_ms
+               for key in ('p50_ms', 'p99_ms')):
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the analysis pipeline stage by stage")
+    parser.add_argument('-n', type=int, default=40, help="regular synthetic resumes")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3, help="passes over the corpus per stage")
+    parser.add_argument('--no-pathological', action='store_true', help="leave out the edge-case inputs")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="baseline JSON to compare against")
+    parser.add_argument('--save-baseline', action='store_true', help="write this run as the baseline")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="allowed slowdown of p50/p99 before a stage is flagged (default 25%%)")
+    parser.add_argument('--min-delta-ms', type=float, default=0.5,
+                        help="ignore slowdowns smaller than this many milliseconds")
+    args = parser.parse_args()
+
+    resumes = list(generate_resumes(args.n, args.seed, pathological=not args.no_pathological))
+    train_scorer([resume.text for resume in resumes if resume.profile != 'pathological'])
+    stages = build_stages(resumes)
+
+    baseline = {}
+    if not args.save_baseline and os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)['stages']
+
+    results = {}
+    print(f"{len(resumes)} resumes x {args.repeat} passes")
+    print(f"{'stage':<30}{'calls/s':>10}{'p50 ms':>11}{'p99 ms':>11}{'vs baseline p50/p99':>22}")
+    for name, (setup, call) in stages.items():
+        with contextlib.redirect_stdout(io.StringIO()):
+            results[name] = summarize(run_stage(setup, call, len(resumes), args.repeat))
+        result, previous = results[name], baseline.get(name)
+        delta = ''
+        if previous:
+            delta = '/'.join(f"{result[key] / previous[key] - 1:+.0%}" if previous[key] else 'n/a'
+                             for key in ('p50_ms', 'p99_ms'))
+        print(f"{name:<30}{result['calls_per_s']:>10.1f}{result['p50_ms']:>11.3f}"
+              f"{result['p99_ms']:>11.3f}{delta:>22}")
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump({
+                'config': {'n': args.n, 'seed': args.seed, 'repeat': args.repeat,
+                           'pathological': not args.no_pathological,
+                           'python': platform.python_version(), 'machine': platform.machine()},
+                'stages': results
+            }, f, indent=2)
+        print(f"\nWrote baseline {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance, args.min_delta_ms)
+    if regressions:
+        print(f"\nRegressions beyond {args.tolerance:.0%}: {', '.join(regressions)}")
+        return 1
+    if baseline:
+        print(f"\nNo regressions beyond {args.tolerance:.0%}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
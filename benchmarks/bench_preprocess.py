@@ -0,0 +1,84 @@
+"""
+Agreement and speed of MLScorer's fast preprocessing against the NLTK path.
+
+For each statistical feature, reports the mean relative difference and the
+correlation between the 'fast' and 'full' modes over a synthetic corpus,
+then the per-resume time of each mode. It reports only: no agreement floor
+has been measured yet, so nothing is gated on these numbers. The full path
+needs the NLTK data from `python cli.py nltk-data`; without it only the fast
+timings are shown.
+
+    python -m benchmarks.bench_preprocess
+"""
+import random
+import sys
+import time
+
+import numpy as np
+
+from utils.ml_scorer import MLScorer, STAT_FEATURES, load_nltk
+
+SENTENCES = [
+    "Managed a team of {n} engineers delivering {skill} services to {n} customers.",
+    "Developed and maintained {skill} pipelines, increasing throughput by {n}%.",
+    "Led the migration of legacy systems to {skill}, reducing costs by ${n}k.",
+    "Senior Software Engineer at Acme Corp, {year} - {year}.",
+    "Bachelor of Science in Computer Science from State University, {year}.",
+    "Collaborated with product managers to design scalable {skill} APIs.",
+    "Mentored junior developers and conducted code reviews for the {skill} team.",
+    "Skills: {skill}, {skill}, {skill}, project management, communication.",
+    "Won the company's innovation award for an automated {skill} reporting tool.",
+    "Responsible for on-call rotation; didn't miss an SLA in {n} months."
+]
+SKILLS = ['python', 'java', 'kubernetes', 'aws', 'react', 'sql', 'docker', 'terraform', 'node.js']
+
+
+def make_resume(rng):
+    lines = []
+    for _ in range(rng.randint(15, 60)):
+        lines.append(rng.choice(SENTENCES).format(
+            n=rng.randint(2, 90), skill=rng.choice(SKILLS), year=rng.randint(1995, 2024)))
+    return '\n'.join(lines)
+
+
+def features(scorer, texts):
+    start = time.perf_counter()
+    rows = [[stats[name] for name in STAT_FEATURES]
+            for _, stats in (scorer.preprocess_text(text) for text in texts)]
+    return np.array(rows, dtype=float), (time.perf_counter() - start) / len(texts)
+
+
+def make_corpus(n=300, seed=1):
+    rng = random.Random(seed)
+    return [make_resume(rng) for _ in range(n)]
+
+
+def agreement(fast, full):
+    """Return {feature: (mean relative difference, correlation)} of two feature arrays"""
+    report = {}
+    for i, name in enumerate(STAT_FEATURES):
+        rel = np.abs(fast[:, i] - full[:, i]) / np.maximum(np.abs(full[:, i]), 1)
+        report[name] = (float(rel.mean()), float(np.corrcoef(fast[:, i], full[:, i])[0, 1]))
+    return report
+
+
+def main():
+    texts = make_corpus()
+
+    fast, fast_time = features(MLScorer(preprocessing='fast'), texts)
+    if load_nltk() is None:
+        print(f"fast: {fast_time * 1e3:.2f} ms/resume (full path unavailable: NLTK data missing)")
+        return 0
+
+    full, full_time = features(MLScorer(preprocessing='full'), texts)
+    report = agreement(fast, full)
+    print(f"{'feature':<18}{'mean rel diff':>15}{'correlation':>13}")
+    for name, (rel, corr) in report.items():
+        print(f"{name:<18}{rel:>14.1%}{corr:>13.3f}")
+    print(f"\nfull: {full_time * 1e3:.2f} ms/resume  fast: {fast_time * 1e3:.2f} ms/resume  "
+          f"speedup {full_time / fast_time:.1f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
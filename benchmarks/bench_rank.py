@@ -0,0 +1,56 @@
+"""
+Job-description ranking latency over a synthetic resume corpus.
+
+Builds a JobMatcher over N resumes drawn from a Zipf-like vocabulary plus a
+handful of skill terms, then times rank() for a job description and the
+artifact round trip. Pass N as the first argument (default 100000).
+
+    python -m benchmarks.bench_rank 100000
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from utils.job_matcher import JobMatcher
+
+SKILLS = ('python java kubernetes docker aws sql react golang terraform spark '
+          'kafka airflow pandas django flask linux').split()
+JOB_DESCRIPTION = ("Senior backend engineer: Python, Kubernetes, Docker, AWS and Terraform. "
+                   "Experience with Kafka streaming is a plus.")
+
+
+def make_texts(n, rng):
+    vocab = [f'term{i}' for i in range(3000)] + SKILLS
+    weights = [1.0 / (i + 1) for i in range(len(vocab))]
+    return [' '.join(rng.choices(vocab, weights, k=150) + rng.sample(SKILLS, 4)) for _ in range(n)]
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    texts = make_texts(n, random.Random(7))
+
+    start = time.perf_counter()
+    matcher = JobMatcher(min_df=2).fit(range(n), texts)
+    print(f"built {matcher.matrix.shape[0]} x {matcher.matrix.shape[1]} corpus matrix "
+          f"in {time.perf_counter() - start:.1f}s")
+
+    repeat = 20
+    start = time.perf_counter()
+    for _ in range(repeat):
+        top = matcher.rank(JOB_DESCRIPTION, k=10)
+    print(f"rank top-10 of {n}: {(time.perf_counter() - start) / repeat * 1e3:.1f} ms")
+    print(f"best match: {top[0]}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'corpus.atsm')
+        matcher.save(path)
+        start = time.perf_counter()
+        loaded = JobMatcher.load(path)
+        print(f"load corpus artifact: {time.perf_counter() - start:.2f}s "
+              f"(same ranking: {loaded.rank(JOB_DESCRIPTION, k=10) == top})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+Throughput of PDF report rendering.
+
+Analyzes a synthetic corpus once, then renders reports for it three ways:
+create_pdf_report with its styles rebuilt on every call (the old
+behaviour), create_pdf_report with the cached styles, and write_report_zip
+streaming into one archive across 1..N worker processes. Reports per
+second and the parent's peak RSS growth are printed for each.
+
+    python -m benchmarks.bench_reports -n 500 --workers 1,2,4
+"""
+import argparse
+import contextlib
+import io
+import os
+import resource
+import tempfile
+import time
+
+from benchmarks.corpus import generate_resumes
+from utils.ats_analyzer import analyze_resume
+from utils.pdf_generator import create_pdf_report, report_styles, write_report_zip
+
+
+def peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batch PDF report rendering")
+    parser.add_argument('-n', type=int, default=300, help="reports to render")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', default=f'1,{os.cpu_count()}',
+                        help="comma-separated pool sizes for write_report_zip")
+    args = parser.parse_args()
+
+    resumes = list(generate_resumes(min(args.n, 100), args.seed, pathological=False))
+    with contextlib.redirect_stdout(io.StringIO()):
+        analyses = [(resume.name, analyze_resume(resume.text)) for resume in resumes]
+    items = [analyses[i % len(analyses)] for i in range(args.n)]
+    print(f"{args.n} reports on {os.cpu_count()} CPU(s)")
+
+    start = time.perf_counter()
+    for _, analysis in items:
+        report_styles.cache_clear()
+        create_pdf_report(analysis)
+    elapsed = time.perf_counter() - start
+    print(f"  {'create_pdf_report, styles rebuilt':<40}{args.n / elapsed:8.1f} reports/s")
+
+    start = time.perf_counter()
+    for _, analysis in items:
+        create_pdf_report(analysis)
+    elapsed = time.perf_counter() - start
+    print(f"  {'create_pdf_report, cached styles':<40}{args.n / elapsed:8.1f} reports/s")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for workers in [int(w) for w in args.workers.split(',')]:
+            path = os.path.join(tmp, f'reports-{workers}.zip')
+            rss = peak_rss_mb()
+            start = time.perf_counter()
+            written = write_report_zip(iter(items), path, workers=workers)
+            elapsed = time.perf_counter() - start
+            label = f"write_report_zip, {workers} worker(s)"
+            print(f"  {label:<40}{written / elapsed:8.1f} reports/s  "
+                  f"zip {os.path.getsize(path) / 1e6:6.1f} MB  "
+                  f"parent peak RSS +{peak_rss_mb() - rss:5.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""
+Streamlit rerun latency of the web app.
+
+Runs main.py under streamlit's AppTest, uploads a synthetic resume, then
+times the reruns a widget interaction triggers with the same upload in
+place. The first run (parse + analyze) is reported separately.
+
+AppTest compiles the script afresh on every run, which a real server does
+once, so the compile time is measured on its own and subtracted to give
+the app's own cost per rerun.
+
+    python -m benchmarks.bench_rerun
+    python -m benchmarks.bench_rerun --script path/to/older/main.py   # compare two versions
+"""
+import os
+import tempfile
+
+# Keep the on-disk result cache out of the measurement
+os.environ.setdefault('ATS_CACHE_PATH', os.path.join(tempfile.mkdtemp(), 'results.sqlite'))
+
+import argparse
+import logging
+import time
+
+import numpy as np
+from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+from streamlit.testing.v1 import AppTest
+
+from benchmarks.corpus import generate_resumes, render_pdf
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def timed_run(app):
+    wall, cpu = time.perf_counter(), time.process_time()
+    app.run(timeout=120)
+    return time.perf_counter() - wall, time.process_time() - cpu
+
+
+def compile_seconds(script, repeat=10):
+    """Median time AppTest spends compiling the script on each run"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        ScriptCache().get_bytecode(script)
+        samples.append(time.perf_counter() - start)
+    return float(np.median(samples))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time Streamlit reruns with a resume uploaded")
+    parser.add_argument('--script', default='main.py', help="app script to run")
+    parser.add_argument('--reruns', type=int, default=30)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    # Streamlit logs a stack trace for the upload widget's empty label on every run
+    logging.getLogger('streamlit').setLevel(logging.ERROR)
+
+    script = os.path.abspath(args.script)
+    # The app reads assets/ relative to the working directory
+    os.chdir(ROOT)
+    resume = next(generate_resumes(1, args.seed, pathological=False))
+    data = render_pdf(resume.text)
+
+    app = AppTest.from_file(script, default_timeout=120)
+    app.run()
+    app.file_uploader[0].set_value(('resume.pdf', data, 'application/pdf'))
+    first_wall, first_cpu = timed_run(app)
+    if app.exception:
+        raise SystemExit(f"App raised: {app.exception[0].value}")
+
+    walls, cpus = np.array([timed_run(app) for _ in range(args.reruns)]).T
+    compile_ms = compile_seconds(script) * 1e3
+    print(os.path.relpath(script, ROOT))
+    print(f"  first run:        {first_wall * 1e3:8.1f} ms wall {first_cpu * 1e3:8.1f} ms cpu")
+    print(f"  reruns (n={args.reruns}):   p50 {np.percentile(walls, 50) * 1e3:6.1f} ms, "
+          f"p99 {np.percentile(walls, 99) * 1e3:6.1f} ms wall, mean {cpus.mean() * 1e3:6.1f} ms cpu")
+    print(f"  script compile:   {compile_ms:8.1f} ms (per AppTest run only)")
+    print(f"  rerun minus compile: p50 {np.percentile(walls, 50) * 1e3 - compile_ms:6.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""
+Worst-case scaling benchmark for the resume section segmenter.
+
+Compares segment_sections against the lazy DOTALL section regexes it
+replaced on adversarial inputs of growing size. Linear scaling shows up as
+a flat ns/char column.
+
+    python -m benchmarks.bench_sections
+"""
+import re
+import time
+
+from utils.resume_document import segment_sections
+
+LEGACY_PATTERNS = [
+    re.compile(r'(?i)experience.*?(?=education|skills|$)', re.DOTALL),
+    re.compile(r'(?i)education.*?(?=experience|skills|$)', re.DOTALL),
+    re.compile(r'(?i)skills.*?(?=experience|education|$)', re.DOTALL)
+]
+
+# Each case builds a resume-like text of roughly n characters
+CASES = {
+    'keyword-dense lines': lambda n: '\n'.join(
+        ['Experienced engineer with experience in experience design'] * (n // 58)),
+    'single unbroken line': lambda n: 'experience ' * (n // 11),
+    'heading storm': lambda n: '\n'.join(
+        ['EXPERIENCE', 'Skills: python', 'Education'] * (n // 36)),
+    'no headings, no keywords': lambda n: '\n'.join(['x' * 79] * (n // 80))
+}
+
+SIZES = [10_000, 100_000, 1_000_000, 4_000_000]
+
+
+def legacy_segment(text):
+    return [pattern.search(text) for pattern in LEGACY_PATTERNS]
+
+
+def best_time(func, text, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    print(f"{'case':<26}{'chars':>10}{'segmenter ms':>14}{'ns/char':>9}"
+          f"{'legacy ms':>12}{'ns/char':>9}")
+    for name, build in CASES.items():
+        for size in SIZES:
+            text = build(size)
+            new = best_time(segment_sections, text)
+            old = best_time(legacy_segment, text)
+            print(f"{name:<26}{len(text):>10}{new * 1e3:>14.2f}{new / len(text) * 1e9:>9.1f}"
+                  f"{old * 1e3:>12.2f}{old / len(text) * 1e9:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""
+Skill matching cost versus taxonomy size.
+
+Builds synthetic taxonomies on top of the shipped one and times matching a
+resume-sized text. Per-resume time should stay flat as the taxonomy grows.
+
+    python -m benchmarks.bench_skills
+"""
+import random
+import time
+
+from utils.skill_matcher import SkillMatcher, read_taxonomy, SKILL_TAXONOMY_PATH
+
+SIZES = [0, 1_000, 10_000, 50_000]
+WORDS = ['data', 'cloud', 'platform', 'engine', 'analytics', 'stream', 'graph', 'secure',
+         'mobile', 'quantum', 'network', 'vision', 'script', 'flow', 'lake', 'studio']
+
+
+def build_matcher(extra, rng):
+    matcher = SkillMatcher()
+    for skill, category, aliases in read_taxonomy(SKILL_TAXONOMY_PATH):
+        matcher.add(skill, category, aliases)
+    for i in range(extra):
+        phrase = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(1, 3))) + f' x{i}'
+        matcher.add(phrase, rng.choice(['Technical', 'Soft Skills', 'Tools']), [f'alias{i}'])
+    return matcher
+
+
+def build_resume(rng, words=1500):
+    vocab = WORDS + ['python', 'kubernetes', 'k8s', 'node', 'rest', 'api', 'project',
+                     'management', 'led', 'team', 'with', 'and', 'the', '2019']
+    return ' '.join(rng.choice(vocab) for _ in range(words))
+
+
+def main():
+    rng = random.Random(42)
+    text = build_resume(rng)
+    print(f"{'extra skills':>12}{'build s':>10}{'match ms/resume':>18}")
+    for size in SIZES:
+        start = time.perf_counter()
+        matcher = build_matcher(size, rng)
+        built = time.perf_counter() - start
+
+        runs = 200
+        start = time.perf_counter()
+        for _ in range(runs):
+            matcher.match(text)
+        per_resume = (time.perf_counter() - start) / runs
+        print(f"{size:>12}{built:>10.2f}{per_resume * 1e3:>18.3f}")
+
+
+if __name__ == '__main__':
+    main()
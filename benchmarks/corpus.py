@@ -0,0 +1,201 @@
+"""
+Deterministic synthetic resume corpus.
+
+generate_resumes(n, seed) yields the same resumes for the same arguments:
+varied length, section layout, non-ASCII content and skill density, with a
+fixed set of pathological cases mixed in. Each can be rendered as plain
+text, PDF or DOCX. To write a corpus to disk:
+
+    python -m benchmarks.corpus ./corpus -n 200
+"""
+import argparse
+import io
+import json
+import os
+import random
+import zipfile
+from collections import namedtuple
+from datetime import datetime
+
+SyntheticResume = namedtuple('SyntheticResume', ['name', 'profile', 'text'])
+
+FIRST_NAMES = ['Jane', 'Omar', 'Wei', 'Priya', 'Lukas', 'Ana', 'Kwame', 'Sofia', 'Hiro', 'Maya']
+LAST_NAMES = ['Doe', 'Haddad', 'Zhang', 'Raman', 'Becker', 'Souza', 'Mensah', 'Rossi', 'Tanaka', 'Levi']
+SKILLS = ['Python', 'Java', 'SQL', 'Kubernetes', 'Docker', 'AWS', 'React', 'Excel', 'Tableau',
+          'Leadership', 'Communication', 'Project Management', 'Git', 'Jira', 'Machine Learning',
+          'Terraform', 'Go', 'C++', 'Salesforce', 'Figma']
+VERBS = ['Led', 'Managed', 'Developed', 'Improved', 'Increased', 'Designed', 'Built', 'Supported']
+OBJECTS = ['a data platform', 'the billing service', 'customer onboarding', 'the analytics team',
+           'a mobile app', 'CI pipelines', 'quarterly reporting', 'a migration to the cloud']
+DEGREES = ["Master of Science in Computer Science", "Bachelor of Arts in Economics",
+           "PhD in Physics", "Associate's Degree in Business", "MBA"]
+SCHOOLS = ['State University', 'Institute of Technology', 'City College', 'Universidad de Chile']
+NON_ASCII = ['José Müller', 'Zoë Łukasiewicz', '王伟', 'Ærøskøbing', 'naïve café résumé', '— • →', '😀 🚀']
+
+# Document timestamp used for every rendered file, so output is reproducible
+FIXED_TIME = datetime(2024, 1, 1)
+
+# Heading spellings per layout; 'plain' writes no headings at all
+LAYOUTS = {
+    'standard': {'summary': 'SUMMARY', 'experience': 'EXPERIENCE', 'education': 'EDUCATION',
+                 'skills': 'SKILLS'},
+    'titled': {'summary': 'Professional Summary', 'experience': 'Work History',
+               'education': 'Academic Background', 'skills': 'Core Competencies'},
+    'labels': {'summary': 'Profile:', 'experience': 'Employment:', 'education': 'Education:',
+               'skills': 'Technical Skills:'},
+    'plain': None
+}
+
+
+def _bullet(rng):
+    return (f"{rng.choice(VERBS)} {rng.choice(OBJECTS)}, improving results by "
+            f"{rng.randint(5, 80)}% across {rng.randint(2, 40)} teams")
+
+
+def _regular(rng, index):
+    """One ordinary resume with randomized shape"""
+    layout_name = rng.choice(list(LAYOUTS))
+    layout = LAYOUTS[layout_name]
+    jobs = rng.choice([1, 2, 4, 8])
+    density = rng.choice([0, 3, 8, 20])
+    non_ascii = rng.random() < 0.25
+
+    name = rng.choice(NON_ASCII[:4]) if non_ascii else f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    sections = {
+        'summary': [f"Engineer with {rng.randint(1, 25)} years of experience"
+                    + (f" — {rng.choice(NON_ASCII)}" if non_ascii else "")],
+        'experience': [],
+        'education': [f"{rng.choice(DEGREES)} from {rng.choice(SCHOOLS)}, {rng.randint(1995, 2022)}"],
+        'skills': [', '.join(rng.sample(SKILLS, min(density, len(SKILLS))))] if density else []
+    }
+    year = 2024
+    for _ in range(jobs):
+        start = year - rng.randint(1, 5)
+        sections['experience'].append(f"Senior Engineer at Company {rng.randint(1, 999)} ({start} - {year})")
+        sections['experience'].extend(f"• {_bullet(rng)}" for _ in range(rng.randint(2, 6)))
+        year = start
+
+    order = ['summary', 'experience', 'education', 'skills']
+    if rng.random() < 0.3:
+        rng.shuffle(order)
+    lines = [name, f"{name.split()[0].lower()}@example.com | 555-{rng.randint(100, 999)}-{rng.randint(1000, 9999)}"]
+    for section in order:
+        if not sections[section]:
+            continue
+        if layout:
+            lines.append(layout[section])
+        lines.extend(sections[section])
+    profile = f"{layout_name}/{jobs}jobs/{density}skills" + ('/non-ascii' if non_ascii else '')
+    return SyntheticResume(f"resume{index:05d}", profile, '\n'.join(lines))
+
+
+def _pathological(rng):
+    """Inputs at the edges of what the parsers and rules see in practice"""
+    bullets = '\n'.join(_bullet(rng) for _ in range(2000))
+    return [
+        ('empty', ''),
+        ('whitespace', ' \n\t\n   \n'),
+        ('one-long-line', ' '.join(_bullet(rng) for _ in range(3000))),
+        ('huge', 'EXPERIENCE\n' + bullets * 3),
+        ('heading-storm', '\n'.join(['EXPERIENCE', 'EDUCATION', 'SKILLS', 'PROJECTS'] * 500)),
+        ('year-storm', ' '.join(str(rng.randint(1950, 2030)) for _ in range(20000))),
+        ('regex-bait', 'EDUCATION\n' + 'in ' * 5000 + 'of ' * 5000 + 'at ' * 5000),
+        ('non-ascii-only', '\n'.join(rng.choice(NON_ASCII) for _ in range(2000))),
+        ('skill-dump', 'SKILLS\n' + ', '.join(rng.choice(SKILLS) for _ in range(20000))),
+    ]
+
+
+def generate_resumes(n, seed=0, pathological=True):
+    """Yield n regular synthetic resumes followed by the pathological cases"""
+    rng = random.Random(seed)
+    for index in range(n):
+        yield _regular(rng, index)
+    if pathological:
+        for name, text in _pathological(rng):
+            yield SyntheticResume(f"pathological-{name}", 'pathological', text)
+
+
+def render_pdf(text):
+    """Render text as a letter-size PDF, one line per text line"""
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+    from reportlab.pdfgen import canvas
+
+    buffer = io.BytesIO()
+    pdf = canvas.Canvas(buffer, pagesize=letter, invariant=1)
+    y = 740
+    for line in text.split('\n'):
+        # Wrap long lines by width so nothing is drawn off the page
+        while True:
+            cut = min(len(line), 120)
+            while cut > 1 and stringWidth(line[:cut], 'Helvetica', 10) > 468:
+                cut = cut * 3 // 4
+            pdf.setFont('Helvetica', 10)
+            pdf.drawString(72, y, line[:cut])
+            y -= 13
+            if y < 60:
+                pdf.showPage()
+                y = 740
+            line = line[cut:]
+            if not line:
+                break
+    pdf.save()
+    return buffer.getvalue()
+
+
+def render_docx(text, table_skills=False):
+    """Render text as a DOCX; table_skills puts lines after a skills heading in a table"""
+    from docx import Document
+
+    document = Document()
+    table = None
+    for line in text.split('\n'):
+        if table_skills and table is not None:
+            table.add_row().cells[0].text = line
+            continue
+        document.add_paragraph(line)
+        if table_skills and 'skill' in line.lower() and len(line) < 40:
+            table = document.add_table(rows=0, cols=1)
+    document.core_properties.created = document.core_properties.modified = FIXED_TIME
+    buffer = io.BytesIO()
+    document.save(buffer)
+
+    # Rewrite the archive with fixed entry timestamps so output is byte-stable
+    repacked = io.BytesIO()
+    with zipfile.ZipFile(buffer) as source, zipfile.ZipFile(repacked, 'w', zipfile.ZIP_DEFLATED) as target:
+        for info in source.infolist():
+            target.writestr(zipfile.ZipInfo(info.filename, date_time=FIXED_TIME.timetuple()[:6]),
+                            source.read(info), compress_type=zipfile.ZIP_DEFLATED)
+    return repacked.getvalue()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a synthetic resume corpus")
+    parser.add_argument('out', help="output directory")
+    parser.add_argument('-n', type=int, default=100, help="regular resumes (pathological cases are added)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--formats', default='txt,pdf,docx', help="comma-separated: txt, pdf, docx")
+    args = parser.parse_args()
+
+    formats = args.formats.split(',')
+    os.makedirs(args.out, exist_ok=True)
+    manifest = []
+    for resume in generate_resumes(args.n, args.seed):
+        for extension in formats:
+            path = os.path.join(args.out, f"{resume.name}.{extension}")
+            if extension == 'txt':
+                data = resume.text.encode('utf-8')
+            elif extension == 'pdf':
+                data = render_pdf(resume.text)
+            else:
+                data = render_docx(resume.text, table_skills=resume.name.endswith(('3', '7')))
+            with open(path, 'wb') as f:
+                f.write(data)
+            manifest.append({'path': path, 'profile': resume.profile})
+    with open(os.path.join(args.out, 'manifest.jsonl'), 'w') as f:
+        f.writelines(json.dumps(entry) + '\n' for entry in manifest)
+    print(f"Wrote {len(manifest)} files to {args.out}")
+
+
+if __name__ == '__main__':
+    main()
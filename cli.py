@@ -0,0 +1,355 @@
+"""
+Command-line entry point for headless resume scoring.
+
+    python cli.py score ./resumes --jobs 16 --out results.jsonl
+"""
+import argparse
+import json
+import os
+import sys
+from multiprocessing import Pool
+
+from utils import metrics
+from utils.analysis_store import DEFAULT_STORE_PATH, AnalysisStore
+from utils.ats_analyzer import analyze_resumes
+from utils.candidate_index import DEFAULT_INDEX_PATH, CandidateIndex, parse_query
+from utils.dedup import DuplicateIndex
+from utils.file_parser import parse_resume
+from utils.job_matcher import CORPUS_PATH, JobMatcher
+from utils.ml_scorer import DEFAULT_PREPROCESSING, MODEL_PATH, NLTK_DATA_DIR, MLScorer, download_nltk_data
+from utils.online_scorer import ONLINE_MODEL_PATH, OnlineScorer
+from utils.pdf_generator import write_report_zip
+
+RESUME_EXTENSIONS = ('.pdf', '.doc', '.docx')
+# Results written to the analysis store per transaction
+STORE_BATCH_SIZE = 500
+
+
+def iter_resume_paths(inputs, list_file=None):
+    """Yield resume paths from files, directories (walked recursively) and a path list"""
+    for item in inputs:
+        if os.path.isdir(item):
+            for root, dirs, files in os.walk(item):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.lower().endswith(RESUME_EXTENSIONS):
+                        yield os.path.join(root, name)
+        else:
+            yield item
+    if list_file:
+        with (sys.stdin if list_file == '-' else open(list_file)) as f:
+            for line in f:
+                path = line.strip()
+                if path:
+                    yield path
+
+
+def load_done_sources(out_path):
+    """
+    Return the sources already recorded in an output file.
+
+    A trailing partial line left by an interrupted run is truncated so
+    appended records start on a fresh line.
+    """
+    done = set()
+    if not os.path.exists(out_path):
+        return done
+    good_size = 0
+    with open(out_path, 'rb') as f:
+        for line in f:
+            if not line.endswith(b'\n'):
+                break
+            try:
+                done.add(json.loads(line)['source'])
+            except (ValueError, KeyError):
+                pass
+            good_size += len(line)
+    if good_size != os.path.getsize(out_path):
+        with open(out_path, 'r+b') as f:
+            f.truncate(good_size)
+    return done
+
+
+def score(args):
+    """Score every resume and stream one JSON line per result"""
+    done = load_done_sources(args.out) if args.resume else set()
+    paths = (p for p in iter_resume_paths(args.inputs, args.list) if p not in done)
+
+    scored = errors = collapsed = 0
+    dedup = DuplicateIndex() if args.dedup else None
+    store = AnalysisStore(args.store) if args.store else None
+    batch = []
+    if args.metrics:
+        metrics.enable()
+    with open(args.out, 'a' if args.resume else 'w', encoding='utf-8') as out:
+        results = analyze_resumes(paths, workers=args.jobs, chunksize=args.chunksize, ordered=False,
+                                  dedup=dedup, collapse_duplicates=args.dedup == 'collapse',
+                                  timings=args.timings)
+        for record in results:
+            record.pop('index')
+            if args.dedup == 'collapse' and record['duplicate_of'] is not None:
+                collapsed += 1
+                continue
+            out.write(json.dumps(record, default=str) + '\n')
+            out.flush()
+            scored += 1
+            errors += record['error'] is not None
+            if store is not None and record['analysis']:
+                batch.append((record['source'], record['analysis']))
+                if len(batch) >= STORE_BATCH_SIZE:
+                    store.add_many(batch)
+                    batch = []
+
+    if store is not None:
+        store.add_many(batch)
+        store.close()
+
+    if args.metrics:
+        metrics.write_prometheus(args.metrics)
+    print(f"Scored {scored} resumes ({errors} errors, {len(done)} skipped, {collapsed} duplicates dropped)",
+          file=sys.stderr)
+    return 0
+
+
+def read_training_corpus(path):
+    """
+    Yield (text, label) pairs from a JSONL corpus whose lines hold a label
+    and either the resume "text" or a "path" to a resume file. Lines
+    without a label are skipped with a warning.
+    """
+    with open(path, encoding='utf-8') as f:
+        for number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            example = json.loads(line)
+            if example.get('label') is None:
+                print(f"Warning: skipping unlabeled line {number} of {path}", file=sys.stderr)
+                continue
+            if 'text' in example:
+                text = example['text']
+            else:
+                with open(example['path'], 'rb') as resume:
+                    text, _ = parse_resume(resume)
+            yield text, int(example['label'])
+
+
+def train(args):
+    """Fit the ML scorer on a labeled corpus and write the model artifact"""
+    examples = list(read_training_corpus(args.corpus))
+    if len({label for _, label in examples}) < 2:
+        print(f"{args.corpus} needs labeled examples of both classes (1 = strong, 0 = weak) to train on",
+              file=sys.stderr)
+        return 1
+    texts, labels = zip(*examples)
+    scorer = MLScorer(preprocessing=args.preprocessing).fit(texts, labels)
+    scorer.save_artifact(args.out, metadata={'training_examples': len(texts),
+                                             'corpus': os.path.basename(args.corpus)})
+    print(f"Trained on {len(texts)} resumes, wrote {args.out}", file=sys.stderr)
+    return 0
+
+
+def feedback(args):
+    """Fold recruiter decisions into the online scorer and checkpoint it"""
+    scorer = OnlineScorer(preprocessing=args.preprocessing, batch_size=args.batch_size)
+    scorer.load_artifact(args.model)
+    before = scorer.updates
+    for text, label in read_training_corpus(args.decisions):
+        scorer.add_feedback(text, label)
+    scorer.save_artifact(args.model)
+    print(f"Applied {scorer.updates - before} decisions ({scorer.updates} total), wrote {args.model}",
+          file=sys.stderr)
+    return 0
+
+
+def read_resume_text(path):
+    """Return (path, text) for a resume file, or (path, None) if it cannot be parsed"""
+    try:
+        with open(path, 'rb') as f:
+            return path, parse_resume(f)[0]
+    except Exception as e:
+        print(f"Warning: skipping {path}: {e}", file=sys.stderr)
+        return path, None
+
+
+def build_corpus(args):
+    """Parse resumes and write the corpus matrix used by rank"""
+    paths = iter_resume_paths(args.inputs, args.list)
+    with Pool(processes=args.jobs) as pool:
+        parsed = [(path, text) for path, text in pool.imap(read_resume_text, paths, chunksize=16)
+                  if text is not None]
+    if not parsed:
+        print("No resumes could be parsed", file=sys.stderr)
+        return 1
+    ids, texts = zip(*parsed)
+    JobMatcher(min_df=args.min_df).fit(ids, texts).save(args.out)
+    print(f"Indexed {len(ids)} resumes, wrote {args.out}", file=sys.stderr)
+    return 0
+
+
+def rank(args):
+    """Print the best-matching resumes for a job description as JSON lines"""
+    with open(args.job_description, encoding='utf-8') as f:
+        job_description = f.read()
+    for result in JobMatcher.load(args.corpus).rank(job_description, k=args.top):
+        print(json.dumps(result))
+    return 0
+
+
+def index(args):
+    """Add scored results to the candidate index, or remove sources from it"""
+    candidates = CandidateIndex(args.index)
+    removed = sum(candidates.remove(source) for source in args.remove)
+    added = 0
+    for path in args.results:
+        with open(path, encoding='utf-8') as f:
+            batch = []
+            for line in f:
+                record = json.loads(line)
+                if record.get('analysis'):
+                    batch.append((record['source'], record['analysis']))
+                if len(batch) >= 10_000:
+                    candidates.add_many(batch)
+                    added, batch = added + len(batch), []
+            candidates.add_many(batch)
+            added += len(batch)
+    candidates.close()
+    print(f"Indexed {added} resumes, removed {removed}, wrote {args.index}", file=sys.stderr)
+    return 0
+
+
+def search(args):
+    """Print the indexed resumes matching a query as JSON lines; terms match taxonomy skills only"""
+    try:
+        query = parse_query(args.query)
+    except ValueError as e:
+        print(f"Invalid query: {e}", file=sys.stderr)
+        return 1
+    candidates = CandidateIndex(args.index)
+    for hit in candidates.search(query, limit=args.limit):
+        print(json.dumps(hit))
+    candidates.close()
+    return 0
+
+
+def iter_scored_analyses(paths):
+    """Yield (source, analysis) from score-command JSONL files, skipping failed records"""
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                record = json.loads(line)
+                if record.get('analysis'):
+                    yield record['source'], record['analysis']
+
+
+def reports(args):
+    """Render a PDF report per scored resume into one zip archive"""
+    written = write_report_zip(iter_scored_analyses(args.results), args.out, workers=args.jobs)
+    print(f"Wrote {written} reports to {args.out}", file=sys.stderr)
+    return 0
+
+
+def nltk_data(args):
+    """Provision the NLTK corpora the ML scorer reads at runtime"""
+    failed = download_nltk_data(args.path)
+    if failed:
+        print(f"Could not download: {', '.join(failed)}", file=sys.stderr)
+        return 1
+    print(f"NLTK data installed in {args.path}", file=sys.stderr)
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='ats-analyze', description="ATS resume analyzer")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    score_parser = commands.add_parser('score', help="score resumes into a JSONL file")
+    score_parser.add_argument('inputs', nargs='*', help="resume files or directories")
+    score_parser.add_argument('--list', metavar='FILE',
+                              help="file with one resume path per line ('-' for stdin)")
+    score_parser.add_argument('--out', required=True, help="JSONL output file")
+    score_parser.add_argument('--jobs', type=int, default=os.cpu_count(),
+                              help="worker processes (default: CPU count)")
+    score_parser.add_argument('--chunksize', type=int, default=4,
+                              help="resumes handed to a worker at a time")
+    score_parser.add_argument('--resume', action='store_true',
+                              help="append to --out, skipping resumes already in it")
+    score_parser.add_argument('--dedup', choices=['flag', 'collapse'],
+                              help="mark near-duplicate resumes with duplicate_of, or leave them out")
+    score_parser.add_argument('--timings', action='store_true',
+                              help="add per-stage milliseconds to each analysis")
+    score_parser.add_argument('--metrics', metavar='FILE',
+                              help="write per-stage metrics in Prometheus text format")
+    score_parser.add_argument('--store', nargs='?', const=DEFAULT_STORE_PATH, metavar='PATH',
+                              help=f"also save results to the analysis history (default: {DEFAULT_STORE_PATH})")
+    score_parser.set_defaults(func=score)
+
+    train_parser = commands.add_parser('train', help="fit the ML scorer on a labeled corpus")
+    train_parser.add_argument('corpus', help="JSONL file of {label, text | path} examples")
+    train_parser.add_argument('--out', default=MODEL_PATH, help=f"artifact path (default: {MODEL_PATH})")
+    train_parser.add_argument('--preprocessing', choices=['full', 'fast'], default=DEFAULT_PREPROCESSING,
+                              help="feature extraction mode the model is trained with")
+    train_parser.set_defaults(func=train)
+
+    feedback_parser = commands.add_parser('feedback', help="update the online scorer from recruiter decisions")
+    feedback_parser.add_argument('decisions', help="JSONL file of {label, text | path} decisions (1 = accept)")
+    feedback_parser.add_argument('--model', default=ONLINE_MODEL_PATH,
+                                 help=f"online model checkpoint (default: {ONLINE_MODEL_PATH})")
+    feedback_parser.add_argument('--batch-size', type=int, default=64, help="decisions per model update")
+    feedback_parser.add_argument('--preprocessing', choices=['full', 'fast'], default=DEFAULT_PREPROCESSING,
+                                 help="feature extraction mode for a new model")
+    feedback_parser.set_defaults(func=feedback)
+
+    corpus_parser = commands.add_parser('build-corpus', help="index resumes for job-description ranking")
+    corpus_parser.add_argument('inputs', nargs='*', help="resume files or directories")
+    corpus_parser.add_argument('--list', metavar='FILE',
+                               help="file with one resume path per line ('-' for stdin)")
+    corpus_parser.add_argument('--out', default=CORPUS_PATH, help=f"corpus path (default: {CORPUS_PATH})")
+    corpus_parser.add_argument('--jobs', type=int, default=os.cpu_count(),
+                               help="worker processes (default: CPU count)")
+    corpus_parser.add_argument('--min-df', type=int, default=2,
+                               help="ignore terms found in fewer resumes than this")
+    corpus_parser.set_defaults(func=build_corpus)
+
+    rank_parser = commands.add_parser('rank', help="rank indexed resumes against a job description")
+    rank_parser.add_argument('job_description', help="text file holding the job description")
+    rank_parser.add_argument('--corpus', default=CORPUS_PATH, help=f"corpus path (default: {CORPUS_PATH})")
+    rank_parser.add_argument('--top', type=int, default=10, help="number of resumes to return")
+    rank_parser.set_defaults(func=rank)
+
+    index_parser = commands.add_parser('index', help="add scored results to the candidate index")
+    index_parser.add_argument('results', nargs='*', help="JSONL files written by the score command")
+    index_parser.add_argument('--remove', nargs='+', default=[], metavar='SOURCE',
+                              help="drop these resumes from the index")
+    index_parser.add_argument('--index', default=DEFAULT_INDEX_PATH,
+                              help=f"index path (default: {DEFAULT_INDEX_PATH})")
+    index_parser.set_defaults(func=index)
+
+    search_parser = commands.add_parser('search', help="query the candidate index")
+    search_parser.add_argument('query', help="e.g. \"python AND kubernetes, education >= Master's, experience >= 5\"")
+    search_parser.add_argument('--limit', type=int, default=50, help="maximum results, best score first")
+    search_parser.add_argument('--index', default=DEFAULT_INDEX_PATH,
+                               help=f"index path (default: {DEFAULT_INDEX_PATH})")
+    search_parser.set_defaults(func=search)
+
+    reports_parser = commands.add_parser('reports', help="render PDF reports for scored resumes into a zip")
+    reports_parser.add_argument('results', nargs='+', help="JSONL files written by the score command")
+    reports_parser.add_argument('--out', required=True, help="zip file to write")
+    reports_parser.add_argument('--jobs', type=int, default=os.cpu_count(),
+                                help="worker processes (default: CPU count)")
+    reports_parser.set_defaults(func=reports)
+
+    nltk_parser = commands.add_parser('nltk-data', help="download NLTK corpora for offline use")
+    nltk_parser.add_argument('--path', default=NLTK_DATA_DIR,
+                             help=f"target directory (default: {NLTK_DATA_DIR})")
+    nltk_parser.set_defaults(func=nltk_data)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
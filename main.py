@@ -1,10 +1,24 @@
 import streamlit as st
 import pandas as pd
-from utils.file_parser import parse_resume
-from utils.ats_analyzer import analyze_resume
+from utils.analysis_store import get_analysis_store
+from utils.ats_analyzer import get_ml_scorer
+from utils.dedup import DuplicateIndex, minhash
+from utils.parse_pool import PARSE_WORKERS
+from utils.pdf_generator import report_bytes
+from utils.result_cache import analyze_upload, get_result_cache
+from utils.skill_matcher import load_skill_matcher
 from utils.visualizer import create_score_chart, create_section_breakdown
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
-import base64
+from functools import partial
+import io
+import os
+
+# Uploads analyzed at once across all sessions; parsing inside each runs
+# in the isolated parse workers, so more threads than those mostly wait
+UPLOAD_WORKERS = int(os.environ.get('ATS_UPLOAD_WORKERS', PARSE_WORKERS))
+# Stored analyses shown per page of the history
+HISTORY_PAGE_SIZE = 20
 
 st.set_page_config(
     page_title="ATS Resume Analyzer",
@@ -14,16 +28,307 @@ st.set_page_config(
 )
 
 # Initialize session state
-if 'upload_history' not in st.session_state:
-    st.session_state.upload_history = []
-if 'analysis_results' not in st.session_state:
-    st.session_state.analysis_results = {}
+if 'jobs' not in st.session_state:
+    st.session_state.jobs = {}
+if 'duplicates' not in st.session_state:
+    st.session_state.duplicates = {}
 
-def local_css(file_name):
+@st.cache_resource(show_spinner="Loading the scoring model...")
+def load_analyzer():
+    """Load the scorer, skill matcher, result cache and analysis store once per server process"""
+    load_skill_matcher()
+    get_result_cache()
+    get_analysis_store()
+    return get_ml_scorer()
+
+@st.cache_resource(show_spinner=False)
+def get_duplicate_index():
+    """Near-duplicate index over every stored analysis, shared by all sessions"""
+    index = DuplicateIndex()
+    for analysis_id, signature in get_analysis_store().signatures():
+        index.add(analysis_id, signature)
+    return index
+
+@st.cache_data
+def read_css(file_name):
     with open(file_name) as f:
-        st.markdown(f'<style>{f.read()}</style>', unsafe_allow_html=True)
+        return f.read()
+
+@st.cache_resource
+def get_upload_executor():
+    """Bounded thread pool shared by every session"""
+    return ThreadPoolExecutor(max_workers=UPLOAD_WORKERS, thread_name_prefix='ats-upload')
+
+def analyze_file(data, file_name):
+    """Parse and analyze upload bytes (repeat uploads come from the result cache)"""
+    upload = io.BytesIO(data)
+    upload.name = file_name
+    return analyze_upload(upload)
+
+def submit_uploads(uploaded_files):
+    """
+    Start analyzing uploads not already in flight and return {file_id: future}.
+
+    Futures live in session state, so a rerun (any widget interaction)
+    picks up running and finished analyses instead of starting over.
+    """
+    jobs = {}
+    for uploaded_file in uploaded_files:
+        job = st.session_state.jobs.get(uploaded_file.file_id)
+        if job is None:
+            job = get_upload_executor().submit(analyze_file, uploaded_file.getvalue(), uploaded_file.name)
+        jobs[uploaded_file.file_id] = job
+    # Files removed from the uploader are dropped; ones not yet started are cancelled
+    for file_id, job in st.session_state.jobs.items():
+        if file_id not in jobs:
+            job.cancel()
+    st.session_state.jobs = jobs
+    return jobs
+
+def iter_completed(jobs):
+    """Yield file ids in upload order for finished jobs, then as the rest finish"""
+    pending = set()
+    for file_id, job in jobs.items():
+        if job.done():
+            yield file_id
+        else:
+            pending.add(file_id)
+    while pending:
+        done, _ = wait([jobs[file_id] for file_id in pending], return_when=FIRST_COMPLETED)
+        for file_id in [file_id for file_id in pending if jobs[file_id] in done]:
+            pending.discard(file_id)
+            yield file_id
+
+def record_result(uploaded_file, resume_text, analysis_results):
+    """Check a newly finished upload for duplicates and add it to the stored history, once"""
+    if uploaded_file.file_id in st.session_state.duplicates:
+        return
+    store = get_analysis_store()
+    analysis_id = store.add(uploaded_file.name, analysis_results)
+    signature = minhash(resume_text)
+    match = None
+    if signature is not None:
+        store.set_signature(analysis_id, signature)
+        match = get_duplicate_index().check(analysis_id, signature=signature)
+    st.session_state.duplicates[uploaded_file.file_id] = (store.source(match[0]), match[1]) if match else None
+
+def render_summary(placeholder, rows):
+    """Redraw the summary table; columns sort by clicking their headers"""
+    placeholder.dataframe(
+        pd.DataFrame(rows),
+        column_config={
+            "File": "File Name",
+            "Overall": st.column_config.ProgressColumn(
+                "ATS Score",
+                min_value=0,
+                max_value=100,
+                format="%d%%"
+            )
+        },
+        hide_index=True,
+        use_container_width=True
+    )
+
+def render_downloads(file_name, analysis_results, key):
+    """
+    PDF and JSON download buttons. Reports are built only when clicked
+    (and then cached per result), so the page carries no report data.
+    """
+    stem = file_name.rsplit('.', 1)[0]
+    col1, col2 = st.columns(2)
+    with col1:
+        st.download_button(
+            f"📥 {file_name} (PDF report)",
+            data=partial(report_bytes, analysis_results, 'pdf'),
+            file_name=f"{stem}_ats_report.pdf",
+            mime="application/pdf",
+            key=f"pdf_{key}",
+            on_click="ignore"
+        )
+    with col2:
+        st.download_button(
+            f"📥 {file_name} (JSON data)",
+            data=partial(report_bytes, analysis_results, 'json'),
+            file_name=f"{stem}_analysis.json",
+            mime="application/json",
+            key=f"json_{key}",
+            on_click="ignore"
+        )
+
+def render_analysis(key, analysis_results):
+    """Render one resume's full analysis; key keeps its charts distinct from other cards"""
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("### Overall ATS Compliance")
+        create_score_chart(analysis_results['overall_score'], key=f"score_{key}")
+
+    with col2:
+        st.markdown("### Detailed Breakdown")
+        create_section_breakdown(analysis_results['section_scores'], key=f"sections_{key}")
+
+    # HR Quick View with improved styling
+    st.markdown("## 💼 HR Quick View")
+    hr_snapshot = analysis_results['hr_snapshot']
+    quick_stats = hr_snapshot['Quick Stats']
+
+    # Experience and Leadership in cards
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("💫 Experience", quick_stats['Experience'])
+    with col2:
+        st.metric("👥 Leadership", quick_stats['Leadership Indicators'])
+
+    # Education section
+    st.markdown("### 🎓 Education Details")
+    edu_details = quick_stats['Education']
+    if isinstance(edu_details, dict):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Degree", edu_details['level'])
+        with col2:
+            st.metric("Field", edu_details['major'])
+        with col3:
+            st.metric("Institution", edu_details['institution'])
+    else:
+        st.info(edu_details)
+
+    # Skills section with improved layout
+    st.markdown("### 🛠️ Skills Profile")
+    skills = quick_stats['Skills']
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.markdown("**💻 Technical**")
+        if skills['Technical']:
+            for skill in skills['Technical']:
+                st.markdown(f"• {skill.title()}")
+        else:
+            st.info("No technical skills identified")
+
+    with col2:
+        st.markdown("**🤝 Soft Skills**")
+        if skills['Soft Skills']:
+            for skill in skills['Soft Skills']:
+                st.markdown(f"• {skill.title()}")
+        else:
+            st.info("No soft skills identified")
+
+    with col3:
+        st.markdown("**🔧 Tools & Platforms**")
+        if skills['Tools']:
+            for tool in skills['Tools']:
+                st.markdown(f"• {tool.title()}")
+        else:
+            st.info("No tools/platforms identified")
+
+    # Overview section
+    st.markdown("## 📋 Key Insights")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("### ✅ Strengths")
+        for impression in hr_snapshot['Initial Impressions']:
+            st.markdown(f"• {impression}")
+
+    with col2:
+        st.markdown("### ⚠️ Areas for Improvement")
+        for flag in hr_snapshot['Potential Red Flags']:
+            st.markdown(f"• {flag}")
+
+    # Detailed Analysis Tabs
+    st.markdown("## 🔍 Detailed Analysis")
+    tabs = st.tabs([
+        "Format Analysis",
+        "Content Analysis",
+        "Recommendations",
+        "Raw Data"
+    ])
+
+    with tabs[0]:
+        st.markdown("### Format Compliance")
+        for item in analysis_results['format_analysis']:
+            st.markdown(f"• {item}")
+
+    with tabs[1]:
+        st.markdown("### Content Analysis")
+        for section, details in analysis_results['content_analysis'].items():
+            st.markdown(f"**{section}**")
+            for detail in details:
+                st.markdown(f"• {detail}")
+
+    with tabs[2]:
+        st.markdown("### Recommendations")
+        for category, recommendations in analysis_results['recommendations'].items():
+            st.markdown(f"**{category}**")
+            for rec in recommendations:
+                st.markdown(f"• {rec}")
+
+    with tabs[3]:
+        st.markdown("### 📝 Raw Analysis Data")
+        st.json(analysis_results)
+
+def render_history():
+    """Paginated history of stored analyses with score and skill aggregates"""
+    store = get_analysis_store()
+    total = len(store)
+    if not total:
+        return
+    with st.expander(f"📊 Analysis History ({total})", expanded=False):
+        pages = -(-total // HISTORY_PAGE_SIZE)
+        page = st.number_input("Page", min_value=1, max_value=pages, value=1, key="history_page")
+        history = store.history(HISTORY_PAGE_SIZE, offset=(page - 1) * HISTORY_PAGE_SIZE)
+
+        history_df = pd.DataFrame([{
+            "filename": entry["source"],
+            "timestamp": datetime.fromtimestamp(entry["created_at"]),
+            "score": entry["overall"],
+            "Format": entry["format"],
+            "Content": entry["content"],
+            "Keywords": entry["keywords"],
+            "ML Score": entry["ml"]
+        } for entry in history])
+        st.dataframe(
+            history_df,
+            column_config={
+                "filename": "File Name",
+                "timestamp": st.column_config.DatetimeColumn(
+                    "Upload Time", 
+                    format="DD/MM/YY HH:mm"
+                ),
+                "score": st.column_config.ProgressColumn(
+                    "ATS Score",
+                    min_value=0,
+                    max_value=100,
+                    format="%d%%"
+                )
+            },
+            hide_index=True,
+            use_container_width=True
+        )
+
+        # One pair of buttons for the selected entry keeps the page the same size
+        entries = {entry["id"]: entry["source"] for entry in history}
+        analysis_id = st.selectbox("Download a report", list(entries), format_func=entries.get,
+                                   key="history_download")
+        render_downloads(entries[analysis_id], store.get(analysis_id), key="history")
+
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("**Score Distribution**")
+            distribution = store.score_distribution()
+            st.bar_chart(pd.DataFrame(
+                {"Resumes": [count for _, _, count in distribution]},
+                index=[f"{low:.0f}-{high:.0f}" for low, high, _ in distribution]
+            ))
+        with col2:
+            st.markdown("**Most Common Skills**")
+            st.bar_chart(pd.DataFrame(store.skill_counts(10), columns=["Skill", "Resumes"]).set_index("Skill"))
+
+def local_css(file_name):
+    st.markdown(f'<style>{read_css(file_name)}</style>', unsafe_allow_html=True)
 
 local_css("assets/style.css")
+load_analyzer()
 
 # Display enhanced logo using SVG
 st.markdown("""
@@ -51,189 +356,55 @@ st.markdown("""
 # Main container
 with st.container():
     # Upload section with improved styling
-    st.markdown("### 📤 Upload Your Resume")
-    st.markdown("_Supported formats: PDF, DOC, DOCX_")
-
-    uploaded_file = st.file_uploader("", type=['pdf', 'doc', 'docx'])
-
-    if uploaded_file is not None:
-        try:
-            with st.spinner('Analyzing your resume...'):
-                # Parse and analyze the resume
-                resume_text, file_format = parse_resume(uploaded_file)
-                analysis_results = analyze_resume(resume_text)
-
-                # Store results
-                st.session_state.analysis_results[uploaded_file.name] = analysis_results
-                st.session_state.upload_history.append({
-                    "filename": uploaded_file.name,
-                    "timestamp": datetime.now(),
-                    "score": analysis_results['overall_score']
-                })
-                st.session_state.upload_history = st.session_state.upload_history[-5:]
-
-            # Show recent uploads in collapsible section
-            if st.session_state.upload_history:
-                with st.expander("📊 Recent Uploads", expanded=False):
-                    history_data = [{
-                        "filename": entry["filename"],
-                        "timestamp": entry["timestamp"],
-                        "score": entry["score"],
-                        "download": f"📥 {entry['filename']}"
-                    } for entry in st.session_state.upload_history]
-
-                    history_df = pd.DataFrame(history_data)
-                    st.dataframe(
-                        history_df,
-                        column_config={
-                            "filename": "File Name",
-                            "timestamp": st.column_config.DatetimeColumn(
-                                "Upload Time", 
-                                format="DD/MM/YY HH:mm"
-                            ),
-                            "score": st.column_config.ProgressColumn(
-                                "ATS Score",
-                                min_value=0,
-                                max_value=100,
-                                format="%d%%"
-                            ),
-                            "download": st.column_config.LinkColumn(
-                                "Download Report",
-                                help="Click to download the analysis report"
-                            )
-                        },
-                        hide_index=True,
-                        use_container_width=True
-                    )
-
-            # Results section with enhanced layout
-            st.markdown("---")
-            st.markdown("## 📊 Analysis Results")
-
-            col1, col2 = st.columns(2)
-            with col1:
-                st.markdown("### Overall ATS Compliance")
-                create_score_chart(analysis_results['overall_score'])
-
-            with col2:
-                st.markdown("### Detailed Breakdown")
-                create_section_breakdown(analysis_results['section_scores'])
-
-            # HR Quick View with improved styling
-            st.markdown("## 💼 HR Quick View")
-            hr_snapshot = analysis_results['hr_snapshot']
-            quick_stats = hr_snapshot['Quick Stats']
-
-            # Experience and Leadership in cards
-            col1, col2 = st.columns(2)
-            with col1:
-                st.metric("💫 Experience", quick_stats['Experience'])
-            with col2:
-                st.metric("👥 Leadership", quick_stats['Leadership Indicators'])
-
-            # Education section
-            st.markdown("### 🎓 Education Details")
-            edu_details = quick_stats['Education']
-            if isinstance(edu_details, dict):
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric("Degree", edu_details['level'])
-                with col2:
-                    st.metric("Field", edu_details['major'])
-                with col3:
-                    st.metric("Institution", edu_details['institution'])
-            else:
-                st.info(edu_details)
-
-            # Skills section with improved layout
-            st.markdown("### 🛠️ Skills Profile")
-            skills = quick_stats['Skills']
-            col1, col2, col3 = st.columns(3)
-
-            with col1:
-                st.markdown("**💻 Technical**")
-                if skills['Technical']:
-                    for skill in skills['Technical']:
-                        st.markdown(f"• {skill.title()}")
-                else:
-                    st.info("No technical skills identified")
+    st.markdown("### 📤 Upload Your Resumes")
+    st.markdown("_Supported formats: PDF, DOC, DOCX. Drop several files to compare candidates._")
 
-            with col2:
-                st.markdown("**🤝 Soft Skills**")
-                if skills['Soft Skills']:
-                    for skill in skills['Soft Skills']:
-                        st.markdown(f"• {skill.title()}")
-                else:
-                    st.info("No soft skills identified")
+    uploaded_files = st.file_uploader("", type=['pdf', 'doc', 'docx'], accept_multiple_files=True)
+    # Filled last, so it includes resumes finished during this run
+    history_section = st.container()
+
+    if uploaded_files:
+        files = {uploaded_file.file_id: uploaded_file for uploaded_file in uploaded_files}
+        jobs = submit_uploads(uploaded_files)
+
+        progress = st.progress(0.0, text=f"Analyzing {len(jobs)} resume(s)...")
+        summary = st.empty()
 
-            with col3:
-                st.markdown("**🔧 Tools & Platforms**")
-                if skills['Tools']:
-                    for tool in skills['Tools']:
-                        st.markdown(f"• {tool.title()}")
+        # Results section with enhanced layout
+        st.markdown("---")
+        st.markdown("## 📊 Analysis Results")
+
+        # Cards render as each resume finishes; other analyses keep running
+        rows = []
+        for completed, file_id in enumerate(iter_completed(jobs), 1):
+            uploaded_file = files[file_id]
+            progress.progress(completed / len(jobs), text=f"Analyzed {completed} of {len(jobs)} resume(s)")
+            try:
+                resume_text, file_format, analysis_results = jobs[file_id].result()
+                record_result(uploaded_file, resume_text, analysis_results)
+
+                if len(files) > 1:
+                    rows.append({
+                        "File": uploaded_file.name,
+                        "Overall": analysis_results['overall_score'],
+                        **analysis_results['section_scores']
+                    })
+                    render_summary(summary, rows)
+                    label = f"📄 {uploaded_file.name} — {analysis_results['overall_score']:.0f}%"
+                    card = st.expander(label, expanded=False)
                 else:
-                    st.info("No tools/platforms identified")
-
-            # Overview section
-            st.markdown("## 📋 Key Insights")
-            col1, col2 = st.columns(2)
-
-            with col1:
-                st.markdown("### ✅ Strengths")
-                for impression in hr_snapshot['Initial Impressions']:
-                    st.markdown(f"• {impression}")
-
-            with col2:
-                st.markdown("### ⚠️ Areas for Improvement")
-                for flag in hr_snapshot['Potential Red Flags']:
-                    st.markdown(f"• {flag}")
-
-            # Detailed Analysis Tabs
-            st.markdown("## 🔍 Detailed Analysis")
-            tabs = st.tabs([
-                "Format Analysis",
-                "Content Analysis",
-                "Recommendations",
-                "Raw Data"
-            ])
-
-            with tabs[0]:
-                st.markdown("### Format Compliance")
-                for item in analysis_results['format_analysis']:
-                    st.markdown(f"• {item}")
-
-            with tabs[1]:
-                st.markdown("### Content Analysis")
-                for section, details in analysis_results['content_analysis'].items():
-                    st.markdown(f"**{section}**")
-                    for detail in details:
-                        st.markdown(f"• {detail}")
-
-            with tabs[2]:
-                st.markdown("### Recommendations")
-                for category, recommendations in analysis_results['recommendations'].items():
-                    st.markdown(f"**{category}**")
-                    for rec in recommendations:
-                        st.markdown(f"• {rec}")
-
-            with tabs[3]:
-                st.markdown("### 📝 Raw Analysis Data")
-                st.json(analysis_results)
-
-        except Exception as e:
-            st.error(f"An error occurred while processing your file: {str(e)}")
-
-# Handle downloads through markdown
-if st.session_state.upload_history:
-    for entry in st.session_state.upload_history:
-        analysis_data = str(st.session_state.analysis_results.get(entry['filename'], {}))
-        b64_data = base64.b64encode(analysis_data.encode()).decode()
-        st.markdown(f"""
-            <div style="display: none;">
-                <a id="download_{entry['filename']}" 
-                   href="data:text/plain;base64,{b64_data}" 
-                   download="{entry['filename']}_analysis.txt">
-                </a>
-            </div>""",
-            unsafe_allow_html=True
-        )
\ No newline at end of file
+                    card = st.container()
+
+                with card:
+                    duplicate = st.session_state.duplicates[file_id]
+                    if duplicate:
+                        st.warning(f"This resume is a near-duplicate of {duplicate[0]} "
+                                   f"({duplicate[1]:.0%} similar)")
+                    render_downloads(uploaded_file.name, analysis_results, key=file_id)
+                    render_analysis(file_id, analysis_results)
+
+            except Exception as e:
+                st.error(f"An error occurred while processing {uploaded_file.name}: {str(e)}")
+
+    with history_section:
+        render_history()
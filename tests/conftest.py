@@ -0,0 +1,23 @@
+import pytest
+
+GOOD_RESUMES = [
+    "Senior software engineer. Led a team of 6 developers building Python and AWS services. "
+    "Experience: 2015 - 2023 at Acme Corp. Education: Master's in Computer Science.",
+    "Data engineer with Kubernetes, Docker and SQL experience. Managed pipelines processing "
+    "2 million records daily. Skills: Python, Spark, leadership.",
+    "Engineering manager. Directed a department of 40. Improved delivery by 30%. "
+    "Bachelor's degree in Engineering from State University.",
+]
+WEAK_RESUMES = [
+    "Cashier at a retail store. Handled the till.",
+    "Barista. Made coffee for customers.",
+    "Looking for any job. Hard worker.",
+]
+
+
+@pytest.fixture
+def training_set():
+    """A tiny labeled corpus (1 = good fit) for fitting scorers"""
+    texts = (GOOD_RESUMES + WEAK_RESUMES) * 3
+    labels = ([1] * len(GOOD_RESUMES) + [0] * len(WEAK_RESUMES)) * 3
+    return texts, labels
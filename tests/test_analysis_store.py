@@ -0,0 +1,82 @@
+import json
+
+import numpy as np
+import pytest
+
+import cli
+from benchmarks.corpus import render_pdf
+from utils.analysis_store import AnalysisStore
+from utils.ats_analyzer import analyze_resume
+
+
+def test_signatures_round_trip(tmp_path):
+    path = str(tmp_path / 'analyses.sqlite')
+    store = AnalysisStore(path)
+    signature = np.arange(128, dtype=np.uint32)
+    store.set_signature(7, signature)
+    store.close()
+
+    [(analysis_id, stored)] = AnalysisStore(path).signatures()
+    assert analysis_id == 7
+    assert np.array_equal(stored, signature)
+
+
+def result(overall, skills=('Python',)):
+    """A stored-analysis shaped dict with the given overall score and skills"""
+    analysis = analyze_resume("Jane Doe\nSkills\n" + ', '.join(skills))
+    return {**analysis, 'overall_score': overall}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = AnalysisStore(str(tmp_path / 'analyses.sqlite'))
+    yield store
+    store.close()
+
+
+def test_history_pages_newest_first(store):
+    ids = store.add_many([(f'r{i}.pdf', result(i * 10.25), 1_700_000_000 + i) for i in range(7)])
+    first = store.history(limit=3)
+    assert [entry['id'] for entry in first] == ids[::-1][:3]
+    assert first[0]['overall'] == 61.5 and first[0]['created_at'] == 1_700_000_006
+    # Keyset paging returns the same pages as OFFSET paging
+    assert store.history(limit=3, before_id=first[-1]['id']) == store.history(limit=3, offset=3)
+    assert [entry['source'] for entry in store.history(limit=3, offset=6)] == ['r0.pdf']
+
+
+def test_full_results_survive_reopening(store, tmp_path):
+    analysis = result(72.34)
+    analysis_id = store.add('a.pdf', analysis)
+    store.close()
+    reopened = AnalysisStore(str(tmp_path / 'analyses.sqlite'))
+    assert len(reopened) == 1
+    assert reopened.get(analysis_id) == json.loads(json.dumps(analysis, default=str))
+    assert reopened.history()[0]['overall'] == 72.3
+    reopened.close()
+
+
+def test_distribution_and_skill_counts(store):
+    store.add_many([('a.pdf', result(5, ['Python', 'SQL'])), ('b.pdf', result(55, ['Python'])),
+                    ('c.pdf', result(100, ['Python', 'Docker']))])
+    distribution = store.score_distribution(bins=4)
+    assert [count for _, _, count in distribution] == [1, 0, 1, 1]
+    assert distribution[-1][:2] == (75.0, 100.0)
+    assert store.skill_counts(limit=2) == [('python', 3), ('docker', 1)]
+
+
+def test_remove_drops_skills_and_signature(store):
+    analysis_id = store.add('a.pdf', result(50, ['Python']))
+    store.set_signature(analysis_id, np.zeros(128, dtype=np.uint32))
+    assert store.remove(analysis_id) and not store.remove(analysis_id)
+    assert store.skill_counts() == [] and store.signatures() == []
+
+
+def test_score_subcommand_saves_to_the_store(tmp_path):
+    (tmp_path / 'a.pdf').write_bytes(render_pdf("Jane Doe\nExperience\nLed a team, 2019 - 2023\nSkills\nPython"))
+    (tmp_path / 'broken.pdf').write_bytes(b'not a pdf')
+    path = str(tmp_path / 'analyses.sqlite')
+    assert cli.main(['score', str(tmp_path), '--out', str(tmp_path / 'results.jsonl'), '--jobs', '1',
+                     '--store', path]) == 0
+    store = AnalysisStore(path)
+    assert [entry['source'].split('/')[-1] for entry in store.history()] == ['a.pdf']
+    store.close()
@@ -0,0 +1,129 @@
+import os
+from functools import lru_cache
+
+import pytest
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+from benchmarks.corpus import generate_resumes, render_docx, render_pdf
+from utils import analysis_store, parse_pool, result_cache
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    """The Streamlit app with its history and result cache in tmp_path"""
+    monkeypatch.chdir(ROOT)
+    monkeypatch.setattr(analysis_store, 'get_analysis_store',
+                        lru_cache(maxsize=1)(lambda: analysis_store.AnalysisStore(str(tmp_path / 'store.sqlite'))))
+    monkeypatch.setattr(result_cache, 'get_result_cache',
+                        lru_cache(maxsize=1)(lambda: result_cache.ResultCache(str(tmp_path / 'cache.sqlite'))))
+    st.cache_resource.clear()
+    st.cache_data.clear()
+    yield AppTest.from_file(os.path.join(ROOT, 'main.py'), default_timeout=60)
+    st.cache_resource.clear()
+
+
+def data_snapshot():
+    """Names, sizes and mtimes under the repository's default data directory"""
+    data = os.path.join(ROOT, 'data')
+    if not os.path.isdir(data):
+        return None
+    return sorted((entry.name, entry.stat().st_size, entry.stat().st_mtime_ns) for entry in os.scandir(data))
+
+
+@pytest.fixture(scope='module')
+def uploads():
+    resumes = list(generate_resumes(2, 11, pathological=False))
+    return [('first.pdf', render_pdf(resumes[0].text), 'application/pdf'),
+            ('second.docx', render_docx(resumes[1].text),
+             'application/vnd.openxmlformats-officedocument.wordprocessingml.document')]
+
+
+@pytest.fixture
+def analyzed(monkeypatch):
+    """Names of the uploads analyze_upload actually ran for"""
+    names = []
+    analyze_upload = result_cache.analyze_upload
+
+    def counting(uploaded_file, cache=None):
+        names.append(uploaded_file.name)
+        return analyze_upload(uploaded_file, cache)
+
+    monkeypatch.setattr(result_cache, 'analyze_upload', counting)
+    return names
+
+
+def test_reruns_reuse_the_running_analysis(app, uploads, analyzed):
+    app.run()
+    app.file_uploader[0].set_value(uploads[0]).run()
+    assert not app.exception
+    assert any('Overall ATS Compliance' in markdown.value for markdown in app.markdown)
+    # Any widget interaction reruns the script
+    app.run()
+    app.run()
+    assert not app.exception
+    assert analyzed == ['first.pdf']
+
+
+def test_scorer_is_loaded_once_for_all_sessions(app, monkeypatch):
+    from utils import ats_analyzer
+
+    loads = []
+    get_ml_scorer = ats_analyzer.get_ml_scorer
+    monkeypatch.setattr(ats_analyzer, 'get_ml_scorer', lambda: loads.append(1) or get_ml_scorer())
+    app.run()
+    app.run()
+    AppTest.from_file(os.path.join(ROOT, 'main.py'), default_timeout=60).run()
+    assert len(loads) == 1
+
+
+def result_cards(app):
+    return [expander.label for expander in app.expander if expander.label.startswith('📄')]
+
+
+def test_several_uploads_get_a_summary_and_a_card_each(app, uploads, analyzed):
+    app.run()
+    app.file_uploader[0].set_value(uploads).run()
+    assert not app.exception and not app.error
+    summary, = [frame.value for frame in app.dataframe if 'File' in frame.value]
+    assert sorted(summary['File']) == ['first.pdf', 'second.docx']
+    assert sorted(label.split(' — ')[0] for label in result_cards(app)) == ['📄 first.pdf', '📄 second.docx']
+    assert sorted(analyzed) == ['first.pdf', 'second.docx']
+
+
+def test_removed_uploads_are_dropped_from_the_results(app, uploads):
+    app.run()
+    app.file_uploader[0].set_value(uploads).run()
+    app.file_uploader[0].set_value(uploads[1:]).run()
+    assert not app.exception
+    assert len(app.session_state['jobs']) == 1
+    # A single upload is shown without a summary or collapsed cards
+    assert not result_cards(app)
+    assert any('Overall ATS Compliance' in markdown.value for markdown in app.markdown)
+
+
+def test_downloads_are_not_rendered_until_clicked(app, uploads, monkeypatch):
+    from utils import pdf_generator
+
+    rendered = []
+    monkeypatch.setattr(pdf_generator, 'report_bytes', lambda *args: rendered.append(args))
+    app.run()
+    app.file_uploader[0].set_value(uploads).run()
+    assert not app.exception
+    # Two per result card, plus the history's for the selected entry
+    assert len(app.get('download_button')) == 6
+    assert rendered == []
+
+
+def test_parse_workers_never_run_the_app_script(app, uploads):
+    # Start fresh workers while main.py is the running script; one that
+    # re-ran it would open the default store under data/
+    parse_pool.get_parse_pool().close()
+    parse_pool.get_parse_pool.cache_clear()
+    before = data_snapshot()
+    app.run()
+    app.file_uploader[0].set_value(uploads).run()
+    assert not app.exception
+    assert data_snapshot() == before
@@ -0,0 +1,34 @@
+import pytest
+
+from benchmarks.corpus import generate_resumes, render_docx, render_pdf
+from utils.ats_analyzer import analyze_resumes
+
+
+@pytest.fixture(scope='module')
+def items():
+    resumes = list(generate_resumes(4, 3, pathological=False))
+    items = [(f'r{i}.pdf', render_pdf(resume.text)) for i, resume in enumerate(resumes[:2])]
+    items += [(f'r{i}.docx', render_docx(resume.text)) for i, resume in enumerate(resumes[2:], 2)]
+    items.append(('broken.pdf', b'not a pdf'))
+    return items
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_records_come_back_in_input_order(items, workers):
+    records = list(analyze_resumes(items, workers=workers))
+    assert [record['index'] for record in records] == list(range(len(items)))
+    assert [record['source'] for record in records] == [name for name, _ in items]
+    assert [record['file_type'] for record in records[:4]] == ['pdf', 'pdf', 'docx', 'docx']
+
+
+def test_a_bad_file_yields_an_error_record(items):
+    *good, broken = analyze_resumes(items, workers=2)
+    assert all(record['error'] is None and record['analysis'] for record in good)
+    assert broken['analysis'] is None and 'PDF' in broken['error']
+
+
+def test_unordered_results_match_single_file_analysis(items):
+    records = {record['source']: record for record in analyze_resumes(items[:2], workers=2, ordered=False)}
+    single = list(analyze_resumes(items[:1], workers=1))[0]
+    assert records['r0.pdf']['analysis'] == single['analysis']
+
@@ -0,0 +1,26 @@
+from benchmarks.bench_pipeline import compare
+from benchmarks.corpus import generate_resumes, render_docx, render_pdf
+
+
+def test_corpus_is_reproducible():
+    first = list(generate_resumes(5, seed=3))
+    assert first == list(generate_resumes(5, seed=3))
+    assert first != list(generate_resumes(5, seed=4))
+    assert [resume.name for resume in first[5:]][:2] == ['pathological-empty', 'pathological-whitespace']
+
+
+def test_rendered_files_are_byte_identical():
+    text = next(generate_resumes(1, seed=3)).text
+    assert render_pdf(text) == render_pdf(text)
+    assert render_docx(text, table_skills=True) == render_docx(text, table_skills=True)
+
+
+def test_compare_flags_only_real_slowdowns():
+    baseline = {'parse': {'p50_ms': 10.0, 'p99_ms': 20.0},
+                'rule': {'p50_ms': 0.01, 'p99_ms': 0.02}}
+    results = {'parse': {'p50_ms': 10.5, 'p99_ms': 30.0},
+               'rule': {'p50_ms': 0.05, 'p99_ms': 0.08},
+               'new_stage': {'p50_ms': 99.0, 'p99_ms': 99.0}}
+    # parse's p99 is 50% slower; rule is 5x slower but by microseconds
+    assert compare(results, baseline, tolerance=0.2, min_delta_ms=0.5) == ['parse']
+    assert compare(results, baseline, tolerance=0.6, min_delta_ms=0.5) == []
@@ -0,0 +1,93 @@
+import json
+
+import pytest
+
+import cli
+from utils.ats_analyzer import analyze_resume
+from utils.candidate_index import CandidateIndex
+
+SENIOR = """Jane Doe
+jane@example.com | 555-123-4567
+
+Experience
+Platform Engineer, Acme Corp, 2014 - 2023
+Led migration of Python services to Kubernetes.
+
+Education
+Master of Science in Computer Science, State University, 2013
+
+Skills
+Python, Kubernetes, Docker
+"""
+JUNIOR = SENIOR.replace('2014 - 2023', '2020 - 2023')
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = CandidateIndex(str(tmp_path / 'candidates.sqlite'))
+    index.add_many([('senior.pdf', analyze_resume(SENIOR)), ('junior.pdf', analyze_resume(JUNIOR))])
+    yield index
+    index.close()
+
+
+def test_experience_is_read_from_the_year_range():
+    assert analyze_resume(SENIOR)['hr_snapshot']['Quick Stats']['Experience'].startswith('9 years')
+
+
+def test_search_filters_on_experience(index):
+    query = "python AND kubernetes, education >= Master's, experience >= 5"
+    assert [hit['source'] for hit in index.search(query)] == ['senior.pdf']
+    assert {hit['source'] for hit in index.search("python, experience >= 3")} == {'senior.pdf', 'junior.pdf'}
+
+
+def test_index_survives_reopening(index, tmp_path):
+    index.close()
+    reopened = CandidateIndex(str(tmp_path / 'candidates.sqlite'))
+    assert len(reopened) == 2
+    assert [hit['source'] for hit in reopened.search("experience >= 5")] == ['senior.pdf']
+    assert reopened.remove('senior.pdf')
+    assert reopened.search("experience >= 5") == []
+
+
+@pytest.mark.parametrize('query', [
+    "python and kubernetes, experience >= 5",
+    "Python AND K8s, experience >= 5",
+    "python3, k8s, experience >= 5",
+])
+def test_query_terms_are_case_insensitive_and_alias_aware(index, query):
+    assert [hit['source'] for hit in index.search(query)] == ['senior.pdf']
+
+
+def test_unknown_term_matches_nothing(index):
+    assert index.search("python AND cobol") == []
+
+
+def test_index_and_search_subcommands(tmp_path, capsys):
+    results = tmp_path / 'results.jsonl'
+    with open(results, 'w') as f:
+        for source, text in (('senior.pdf', SENIOR), ('junior.pdf', JUNIOR)):
+            f.write(json.dumps({'source': source, 'analysis': analyze_resume(text), 'error': None}) + '\n')
+        f.write(json.dumps({'source': 'broken.pdf', 'analysis': None, 'error': "Error parsing PDF file"}) + '\n')
+    path = str(tmp_path / 'candidates.sqlite')
+
+    assert cli.main(['index', str(results), '--index', path]) == 0
+    assert "Indexed 2 resumes, removed 0" in capsys.readouterr().err
+    assert cli.main(['search', 'python, experience >= 5', '--index', path]) == 0
+    assert [json.loads(line)['source'] for line in capsys.readouterr().out.splitlines()] == ['senior.pdf']
+
+    assert cli.main(['index', '--remove', 'senior.pdf', '--index', path]) == 0
+    assert "removed 1" in capsys.readouterr().err
+    assert cli.main(['search', 'python', '--index', path]) == 0
+    assert [json.loads(line)['source'] for line in capsys.readouterr().out.splitlines()] == ['junior.pdf']
+
+
+@pytest.mark.parametrize('query, message', [
+    ("python, experience >= five", "Expected a number, got 'five'"),
+    ("education >= Masters degree", "Unknown value 'Masters degree'"),
+    ("leadership = Excellent", "Unknown value 'Excellent'"),
+])
+def test_search_reports_an_unreadable_filter(tmp_path, capsys, query, message):
+    assert cli.main(['search', query, '--index', str(tmp_path / 'candidates.sqlite')]) == 1
+    err = capsys.readouterr().err
+    assert err.startswith("Invalid query: ") and message in err
+    assert len(err.splitlines()) == 1
@@ -0,0 +1,103 @@
+import json
+
+import pytest
+
+import cli
+from benchmarks.corpus import generate_resumes, render_docx, render_pdf
+from utils.ml_scorer import MLScorer
+from utils.online_scorer import OnlineScorer
+
+
+@pytest.fixture(scope='module')
+def resume_dir(tmp_path_factory):
+    """Three resumes, a broken PDF and a file the walk should skip"""
+    root = tmp_path_factory.mktemp('resumes')
+    (root / 'nested').mkdir()
+    resumes = list(generate_resumes(3, 5, pathological=False))
+    (root / 'a.pdf').write_bytes(render_pdf(resumes[0].text))
+    (root / 'b.docx').write_bytes(render_docx(resumes[1].text))
+    (root / 'nested' / 'c.pdf').write_bytes(render_pdf(resumes[2].text))
+    (root / 'broken.pdf').write_bytes(b'not a pdf')
+    (root / 'notes.txt').write_text('not a resume')
+    return root
+
+
+def read_jsonl(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+def run(*argv):
+    return cli.main([str(arg) for arg in argv])
+
+
+def test_score_writes_one_line_per_resume(resume_dir, tmp_path, capsys):
+    out = tmp_path / 'results.jsonl'
+    assert run('score', resume_dir, '--out', out, '--jobs', 2) == 0
+    records = {record['source'].split('/')[-1]: record for record in read_jsonl(out)}
+    assert sorted(records) == ['a.pdf', 'b.docx', 'broken.pdf', 'c.pdf']
+    assert records['broken.pdf']['error'] and records['broken.pdf']['analysis'] is None
+    assert 0 <= records['a.pdf']['analysis']['overall_score'] <= 100
+    assert "Scored 4 resumes (1 errors, 0 skipped" in capsys.readouterr().err
+
+
+def test_score_resume_skips_done_sources_and_drops_a_partial_line(resume_dir, tmp_path, capsys):
+    out = tmp_path / 'results.jsonl'
+    run('score', resume_dir / 'a.pdf', '--out', out, '--jobs', 1)
+    with open(out, 'a') as f:
+        f.write('{"source": "interrupted')
+    assert run('score', resume_dir, '--out', out, '--jobs', 1, '--resume') == 0
+    sources = [record['source'].split('/')[-1] for record in read_jsonl(out)]
+    assert sorted(sources) == ['a.pdf', 'b.docx', 'broken.pdf', 'c.pdf']
+    assert "1 skipped" in capsys.readouterr().err
+
+
+def test_score_reads_a_path_list(resume_dir, tmp_path):
+    paths = tmp_path / 'paths.txt'
+    paths.write_text(f"{resume_dir / 'a.pdf'}\n\n{resume_dir / 'b.docx'}\n")
+    out = tmp_path / 'results.jsonl'
+    run('score', '--list', paths, '--out', out, '--jobs', 1)
+    assert len(read_jsonl(out)) == 2
+
+
+def test_train_writes_a_loadable_artifact(training_set, tmp_path, capsys):
+    corpus = tmp_path / 'corpus.jsonl'
+    with open(corpus, 'w') as f:
+        for text, label in zip(*training_set):
+            f.write(json.dumps({'text': text, 'label': label}) + '\n')
+    out = tmp_path / 'scorer.atsm'
+    assert run('train', corpus, '--out', out, '--preprocessing', 'fast') == 0
+    scorer = MLScorer()
+    assert scorer.load_artifact(str(out))
+    assert scorer.preprocessing == 'fast'
+    assert scorer.metadata['training_examples'] == len(training_set[0])
+    assert "Trained on 18 resumes" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize('lines', [
+    [],
+    [{'text': 'Python developer'}, {'text': 'Java developer', 'label': None}],
+    [{'text': 'Python developer', 'label': 1}, {'text': 'Java developer', 'label': 1}],
+])
+def test_train_refuses_a_corpus_without_both_labels(tmp_path, capsys, lines):
+    corpus = tmp_path / 'corpus.jsonl'
+    corpus.write_text(''.join(json.dumps(line) + '\n' for line in lines))
+    out = tmp_path / 'scorer.atsm'
+    assert run('train', corpus, '--out', out) == 1
+    assert "needs labeled examples of both classes" in capsys.readouterr().err
+    assert not out.exists()
+
+
+def test_feedback_creates_and_then_updates_the_checkpoint(training_set, tmp_path, capsys):
+    decisions = tmp_path / 'decisions.jsonl'
+    with open(decisions, 'w') as f:
+        for text, label in zip(*training_set):
+            f.write(json.dumps({'text': text, 'label': label}) + '\n')
+    model = tmp_path / 'online.atsm'
+    for _ in range(2):
+        assert run('feedback', decisions, '--model', model, '--batch-size', 4,
+                   '--preprocessing', 'fast') == 0
+    scorer = OnlineScorer()
+    assert scorer.load_artifact(str(model))
+    assert scorer.updates == 2 * len(training_set[0])
+    assert "Applied 18 decisions (36 total)" in capsys.readouterr().err
@@ -0,0 +1,93 @@
+import json
+
+import pytest
+
+import cli
+from benchmarks.corpus import render_docx, render_pdf
+from utils import ats_analyzer
+from utils.ats_analyzer import analyze_resumes
+from utils.dedup import DuplicateIndex, minhash
+
+RESUME = ("Jane Doe, senior data engineer. Eight years building Python and Spark pipelines at "
+          "Acme Corp, led a team of five, cut warehouse costs by 30 percent, AWS certified, "
+          "Master's in Computer Science from State University.")
+OTHER = ("John Smith, retail store manager. Twelve years running a grocery branch, hired and "
+         "trained forty staff, ran weekly inventory and scheduling, Bachelor's in Business "
+         "Administration from City College.")
+
+
+def test_edited_resubmission_is_flagged():
+    index = DuplicateIndex()
+    assert index.check('original.pdf', RESUME) is None
+    match = index.check('resubmitted.pdf', RESUME.replace('Jane Doe', 'Jane A. Doe'))
+    assert match is not None and match[0] == 'original.pdf'
+    assert index.check('other.pdf', OTHER) is None
+
+
+def test_short_texts_get_no_signature():
+    for text in ["", "   \n\t ", "Jane Doe", "scanned page one of two"]:
+        assert minhash(text) is None
+
+
+def test_blank_uploads_are_not_duplicates_of_each_other():
+    index = DuplicateIndex()
+    for key, text in [('empty.pdf', ''), ('whitespace.docx', '  \n '), ('empty.docx', ''),
+                      ('stub.pdf', 'Curriculum vitae')]:
+        assert index.check(key, text) is None
+    assert len(index) == 0
+
+
+def test_rechecking_the_same_key_does_not_match_itself():
+    index = DuplicateIndex()
+    index.check('resume.pdf', RESUME)
+    assert index.check('resume.pdf', RESUME) is None
+    assert len(index) == 1
+
+
+@pytest.fixture
+def resubmissions():
+    # render_pdf wraps lines mid-word, so the text-bearing files are DOCX
+    return [('original.docx', render_docx(RESUME)),
+            ('other.docx', render_docx(OTHER)),
+            ('resubmitted.docx', render_docx(RESUME.replace('Jane Doe', 'Jane A. Doe'))),
+            ('blank.pdf', render_pdf('')),
+            ('blank.docx', render_docx(''))]
+
+
+def test_batch_records_name_the_earlier_duplicate(resubmissions):
+    records = analyze_resumes(resubmissions, workers=1, dedup=DuplicateIndex())
+    assert [record['duplicate_of'] for record in records] == [None, None, 'original.docx', None, None]
+
+
+@pytest.mark.parametrize('mode, kept', [('flag', 5), ('collapse', 4)])
+def test_score_subcommand_dedup(resubmissions, tmp_path, mode, kept):
+    for name, data in resubmissions:
+        (tmp_path / name).write_bytes(data)
+    out = tmp_path / 'results.jsonl'
+    assert cli.main(['score', str(tmp_path), '--out', str(out), '--jobs', '1', '--dedup', mode]) == 0
+    with open(out) as f:
+        records = [json.loads(line) for line in f]
+    assert len(records) == kept
+    assert sum(record['duplicate_of'] is not None for record in records) == (mode == 'flag')
+
+
+@pytest.mark.parametrize('isolate', [True, False])
+def test_collapsed_duplicates_are_not_analyzed(resubmissions, monkeypatch, isolate):
+    analyzed = []
+    analyze_resume = ats_analyzer.analyze_resume
+    monkeypatch.setattr(ats_analyzer, 'analyze_resume', lambda text, **kwargs: analyzed.append(text) or
+                        analyze_resume(text, **kwargs))
+    records = list(analyze_resumes(resubmissions, workers=1, dedup=DuplicateIndex(),
+                                   collapse_duplicates=True, isolate=isolate))
+    assert [record['index'] for record in records] == list(range(len(resubmissions)))
+    assert records[2]['duplicate_of'] == 'original.docx' and records[2]['analysis'] is None
+    assert len(analyzed) == len(resubmissions) - 1
+
+
+@pytest.mark.parametrize('collapse', [True, False])
+def test_the_first_copy_in_input_order_is_the_original(resubmissions, collapse):
+    copies = [(f'copy{i}.docx', resubmissions[0][1]) for i in range(6)]
+    records = analyze_resumes(copies, workers=2, chunksize=1, ordered=False,
+                              dedup=DuplicateIndex(), collapse_duplicates=collapse)
+    originals = {record['source']: record['duplicate_of'] for record in records}
+    assert originals == {'copy0.docx': None, **{f'copy{i}.docx': 'copy0.docx' for i in range(1, 6)}}
@@ -0,0 +1,99 @@
+import io
+import zipfile
+
+import pytest
+
+from benchmarks.corpus import render_pdf
+from utils import file_parser
+from utils.file_parser import DEFAULT_LIMITS, ResumeLimitError, parse_resume
+
+# About 52 lines fit on a rendered page, so this is four pages long
+LINES = [f"Line {number} of the resume" for number in range(200)]
+
+
+def upload(name, data):
+    stream = io.BytesIO(data)
+    stream.name = name
+    return stream
+
+
+@pytest.fixture(scope='module')
+def pdf():
+    return render_pdf('\n'.join(LINES))
+
+
+@pytest.mark.parametrize('backend', sorted(file_parser.PDF_BACKENDS))
+def test_every_backend_extracts_all_pages(pdf, backend):
+    text, file_type = parse_resume(upload('resume.pdf', pdf), pdf_backend=backend)
+    assert file_type == 'pdf'
+    assert "Line 0 of" in text and "Line 199 of" in text
+
+
+def test_upload_over_max_bytes_is_rejected(pdf):
+    limits = DEFAULT_LIMITS._replace(max_bytes=len(pdf) - 1)
+    with pytest.raises(ResumeLimitError):
+        parse_resume(upload('resume.pdf', pdf), limits=limits)
+
+
+def test_pages_past_max_pages_are_not_read(pdf):
+    text, _ = parse_resume(upload('resume.pdf', pdf), limits=DEFAULT_LIMITS._replace(max_pages=1))
+    assert "Line 0 of" in text and "Line 60 of" not in text
+
+
+def test_text_is_cut_at_max_chars(pdf):
+    text, _ = parse_resume(upload('resume.pdf', pdf), limits=DEFAULT_LIMITS._replace(max_chars=100))
+    assert len(text) <= 100 and text.startswith("Line 0 of")
+
+
+def test_parallel_page_extraction_matches_sequential(pdf, monkeypatch):
+    sequential, _ = parse_resume(upload('resume.pdf', pdf))
+    monkeypatch.setattr(file_parser, 'PARALLEL_PAGE_THRESHOLD', 2)
+    parallel, _ = parse_resume(upload('resume.pdf', pdf), workers=2)
+    assert parallel == sequential
+
+
+def test_broken_pdf_raises_a_parse_error():
+    with pytest.raises(Exception, match="Error parsing PDF file"):
+        parse_resume(upload('resume.pdf', b'not a pdf'))
+
+
+W = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+MC = 'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"'
+
+
+def docx_archive(body, header=None):
+    """A minimal DOCX holding the given body XML and optional header XML"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        archive.writestr('word/document.xml', f'<w:document {W} {MC}><w:body>{body}</w:body></w:document>')
+        if header:
+            archive.writestr('word/header1.xml', f'<w:hdr {W}>{header}</w:hdr>')
+            archive.writestr('word/header2.xml', f'<w:hdr {W}>{header}</w:hdr>')
+    return buffer.getvalue()
+
+
+def paragraph(text):
+    return f'<w:p><w:r><w:t>{text}</w:t></w:r></w:p>'
+
+
+def test_docx_table_cells_are_read():
+    from benchmarks.corpus import render_docx
+
+    text, file_type = parse_resume(upload('resume.docx', render_docx("Name\nSkills\nPython\nSQL", table_skills=True)))
+    assert file_type == 'docx'
+    assert text.split('\n') == ["Name", "Skills", "Python", "SQL"]
+
+
+def test_docx_text_box_is_read_once_and_kept_out_of_its_anchor():
+    box = (f'<w:p><w:r><w:t>Anchor</w:t></w:r><w:r><mc:AlternateContent>'
+           f'<mc:Choice Requires="wps"><w:txbxContent>{paragraph("Boxed skills")}</w:txbxContent></mc:Choice>'
+           f'<mc:Fallback><w:txbxContent>{paragraph("Boxed skills")}</w:txbxContent></mc:Fallback>'
+           f'</mc:AlternateContent></w:r></w:p>')
+    paragraphs = list(file_parser.iter_docx_paragraphs(io.BytesIO(docx_archive(box))))
+    assert paragraphs == ["Boxed skills", "Anchor"]
+
+
+def test_docx_repeated_headers_are_read_once_before_the_body():
+    body = paragraph("Experience") + '<w:p><w:r><w:t>a</w:t><w:tab/><w:t>b</w:t><w:br/><w:t>c</w:t></w:r></w:p>'
+    paragraphs = list(file_parser.iter_docx_paragraphs(io.BytesIO(docx_archive(body, paragraph("Jane Doe")))))
+    assert paragraphs == ["Jane Doe", "Experience", "a\tb\nc"]
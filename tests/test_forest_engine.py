@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+from scipy import sparse
+from sklearn.ensemble import RandomForestClassifier
+
+from utils.forest_engine import FlatForest
+from utils.ml_scorer import MLScorer
+
+
+@pytest.fixture(scope='module')
+def data():
+    rng = np.random.default_rng(0)
+    X = rng.random((300, 40))
+    # Mostly-zero columns, like TF-IDF features
+    X[X < 0.6] = 0.0
+    y = (X[:, 0] + X[:, 1] > X[:, 2]).astype(int)
+    return X, y
+
+
+@pytest.mark.parametrize('n_classes', [2, 3])
+def test_probabilities_are_bit_identical(data, n_classes):
+    X, y = data
+    if n_classes == 3:
+        y = y + (X[:, 3] > 0.8)
+    forest = RandomForestClassifier(n_estimators=25, random_state=0).fit(X[:200], y[:200])
+    flat = FlatForest.from_sklearn(forest)
+    assert np.array_equal(flat.predict_proba(X[200:]), forest.predict_proba(X[200:]))
+    assert np.array_equal(flat.predict_proba(sparse.csr_matrix(X[200:])),
+                          forest.predict_proba(X[200:]))
+    assert np.array_equal(flat.apply(X[200:]) - flat.roots, forest.apply(X[200:]))
+
+
+def test_flat_backend_scores_match_sklearn(training_set, tmp_path):
+    path = str(tmp_path / 'scorer.atsm')
+    MLScorer(preprocessing='fast').fit(*training_set).save_artifact(path)
+    texts = training_set[0][:6] + ["", "Python developer"]
+    reference = MLScorer(backend='sklearn')
+    flat = MLScorer(backend='flat')
+    assert reference.load_artifact(path) and flat.load_artifact(path)
+    assert isinstance(flat.model, FlatForest)
+    assert flat.predict_scores(texts) == reference.predict_scores(texts)
@@ -0,0 +1,25 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def imported_after(statement, modules):
+    code = f"import sys; {statement}; print(' '.join(m for m in {modules!r} if m in sys.modules))"
+    result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return result.stdout.split()
+
+
+def test_analyzer_import_leaves_the_ml_stack_unloaded():
+    assert imported_after('import utils.ats_analyzer', ('sklearn', 'nltk', 'scipy')) == []
+
+
+def test_missing_nltk_data_is_not_downloaded(tmp_path):
+    env = {**os.environ, 'ATS_NLTK_DATA': str(tmp_path)}
+    code = ("import nltk; nltk.download = None; "
+            "from utils.ml_scorer import load_nltk; print(load_nltk() is None)")
+    result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, env=env,
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.strip().endswith('True')
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,58 @@
+import json
+import re
+
+import numpy as np
+import pytest
+
+import cli
+from benchmarks.corpus import generate_resumes, render_pdf
+from utils.job_matcher import JobMatcher
+
+JOB_DESCRIPTION = "Backend engineer: Python, Kubernetes and PostgreSQL, leading a small team."
+
+
+@pytest.fixture(scope='module')
+def resumes():
+    return {f"r{number}": resume.text for number, resume in enumerate(generate_resumes(40, 3, pathological=False))}
+
+
+@pytest.fixture(scope='module')
+def matcher(resumes):
+    return JobMatcher().fit(resumes.keys(), resumes.values())
+
+
+def test_ranking_matches_brute_force_cosine(matcher, resumes):
+    query = matcher.vectorizer.transform([JOB_DESCRIPTION])
+    similarity = (matcher.matrix.tocsr() @ query.T).toarray().ravel()
+    expected = [matcher.ids[row] for row in np.argsort(-similarity, kind='stable')[:5] if similarity[row] > 0]
+
+    results = matcher.rank(JOB_DESCRIPTION, k=5)
+    assert [result['id'] for result in results] == expected
+    assert results[0]['score'] == pytest.approx(similarity.max() * 100, abs=0.05)
+    # Matched terms are words and word pairs of the description
+    words = set(re.findall(r'\w+', JOB_DESCRIPTION.lower()))
+    assert all(set(term.split()) <= words for term in results[0]['matched_terms'])
+
+
+def test_unrelated_description_returns_nothing(matcher):
+    assert matcher.rank("zyxwv qwerty", k=5) == []
+
+
+def test_corpus_round_trip(matcher, tmp_path):
+    path = str(tmp_path / 'corpus.atsm')
+    matcher.save(path)
+    assert JobMatcher.load(path).rank(JOB_DESCRIPTION, k=5) == matcher.rank(JOB_DESCRIPTION, k=5)
+
+
+def test_build_corpus_and_rank_subcommands(resumes, tmp_path, capsys):
+    for name in ('r0', 'r1', 'r2'):
+        (tmp_path / f'{name}.pdf').write_bytes(render_pdf(resumes[name]))
+    corpus = tmp_path / 'corpus.atsm'
+    assert cli.main(['build-corpus', str(tmp_path), '--out', str(corpus), '--jobs', '1', '--min-df', '1']) == 0
+    job = tmp_path / 'job.txt'
+    job.write_text(JOB_DESCRIPTION)
+    capsys.readouterr()
+    assert cli.main(['rank', str(job), '--corpus', str(corpus), '--top', '2']) == 0
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert 1 <= len(lines) <= 2
+    assert all(line['id'].endswith('.pdf') for line in lines)
@@ -0,0 +1,93 @@
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import cli
+from benchmarks.corpus import generate_resumes, render_docx, render_pdf
+from utils import metrics
+from utils.ats_analyzer import analyze_resume
+
+
+@pytest.fixture
+def recording(monkeypatch):
+    """Process-wide metrics switched on, starting from empty totals"""
+    monkeypatch.setattr(metrics, 'ENABLED', True)
+    monkeypatch.setattr(metrics, '_stats', {})
+
+
+def sample(text, stage, suffix='count', le=None):
+    label = f'stage="{stage}"' + (f',le="{le}"' if le else '')
+    match = re.search(rf'^ats_stage_duration_seconds_{suffix}{{{re.escape(label)}}} (\S+)$', text, re.M)
+    return float(match.group(1)) if match else None
+
+
+def test_stages_are_a_no_op_when_nothing_is_recording(monkeypatch):
+    monkeypatch.setattr(metrics, 'ENABLED', False)
+    monkeypatch.setattr(metrics, '_stats', {})
+    with metrics.stage('parse', 10):
+        pass
+    assert metrics.stage('parse') is metrics._NULL_STAGE
+    assert metrics._stats == {}
+
+
+def test_prometheus_histogram_counts_calls_errors_and_sizes(recording):
+    metrics.record('parse', 0.002, size=100)
+    metrics.record('parse', 0.3, size=50)
+    with pytest.raises(ValueError):
+        with metrics.stage('parse', 25):
+            raise ValueError
+    text = metrics.render_prometheus()
+    assert sample(text, 'parse', 'bucket', le='0.005') >= 2
+    assert sample(text, 'parse', 'bucket', le='0.25') == sample(text, 'parse', 'bucket', le='0.005')
+    assert sample(text, 'parse', 'bucket', le='+Inf') == sample(text, 'parse') == 3
+    assert 'ats_stage_errors_total{stage="parse"} 1' in text
+    assert 'ats_stage_input_size_total{stage="parse"} 175' in text
+
+
+def test_collected_observations_stay_with_their_request(recording):
+    with metrics.collect() as outer:
+        with metrics.stage('outer'):
+            with metrics.collect() as inner:
+                with metrics.stage('inner'):
+                    pass
+    assert [name for name, *_ in inner] == ['inner']
+    assert [name for name, *_ in outer] == ['outer']
+    assert metrics.current_observations() is None
+
+
+def test_analysis_timings_cover_every_rule():
+    timings = analyze_resume("Jane Doe\nSkills\nPython", timings=True)['timings']
+    assert {'document', 'analyze_format', 'check_skills', 'generate_hr_snapshot'} <= set(timings)
+    assert all(ms >= 0 for ms in timings.values())
+    assert 'timings' not in analyze_resume("Jane Doe\nSkills\nPython")
+
+
+def test_score_subcommand_writes_timings_and_metrics(recording, tmp_path):
+    resumes = list(generate_resumes(3, 9, pathological=False))
+    (tmp_path / 'a.pdf').write_bytes(render_pdf(resumes[0].text))
+    (tmp_path / 'b.pdf').write_bytes(render_pdf(resumes[1].text))
+    (tmp_path / 'c.docx').write_bytes(render_docx(resumes[2].text))
+    out, prom = tmp_path / 'results.jsonl', tmp_path / 'ats.prom'
+    assert cli.main(['score', str(tmp_path), '--out', str(out), '--jobs', '2',
+                     '--timings', '--metrics', str(prom)]) == 0
+    assert out.read_text().count('"parse_resume":') == 3
+    # Stages recorded in worker processes are folded into the parent's totals
+    text = prom.read_text()
+    assert sample(text, 'parse_resume') >= 3
+    assert sample(text, 'check_skills') == 3
+
+
+def test_concurrent_exports_do_not_collide(recording, tmp_path):
+    path = str(tmp_path / 'ats.prom')
+    metrics.record('parse', 0.01)
+
+    def export(_):
+        for _ in range(50):
+            metrics.write_prometheus(path)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(export, range(8)))
+    assert sample(open(path).read(), 'parse') == 1
+    assert os.listdir(tmp_path) == ['ats.prom']
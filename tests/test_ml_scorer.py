@@ -0,0 +1,52 @@
+import json
+import math
+
+import pytest
+
+from utils import ats_analyzer
+from utils.ml_scorer import MLScorer
+
+BLANK_TEXTS = ["", "   \n\t ", "the and of it"]
+
+
+@pytest.mark.parametrize('preprocessing', ['fast', 'full'])
+def test_blank_text_scores_are_finite(training_set, preprocessing):
+    scorer = MLScorer(preprocessing=preprocessing).fit(*training_set)
+    scores = scorer.predict_scores(BLANK_TEXTS)
+    assert all(math.isfinite(score) and 0 <= score <= 100 for score in scores)
+
+
+def test_analyze_empty_resume_with_trained_artifact(training_set, tmp_path, monkeypatch):
+    path = str(tmp_path / 'scorer.atsm')
+    MLScorer(preprocessing='fast').fit(*training_set).save_artifact(path)
+    scorer = MLScorer()
+    assert scorer.load_artifact(path)
+    monkeypatch.setattr(ats_analyzer, 'get_ml_scorer', lambda: scorer)
+
+    for text in BLANK_TEXTS:
+        analysis = ats_analyzer.analyze_resume(text)
+        assert math.isfinite(analysis['overall_score'])
+        json.dumps(analysis, allow_nan=False)
+
+
+def test_artifact_round_trip(training_set, tmp_path):
+    path = str(tmp_path / 'scorer.atsm')
+    trained = MLScorer(preprocessing='fast').fit(*training_set)
+    trained.save_artifact(path, {'source': 'test'})
+
+    loaded = MLScorer(preprocessing='full')
+    assert loaded.load_artifact(path)
+    assert loaded.preprocessing == 'fast'
+    assert loaded.metadata['source'] == 'test'
+    assert loaded.predict_scores(training_set[0]) == trained.predict_scores(training_set[0])
+
+
+def test_load_artifact_missing_file(tmp_path):
+    assert not MLScorer().load_artifact(str(tmp_path / 'missing.atsm'))
+
+
+def test_batch_scores_match_single_scores(training_set):
+    texts = training_set[0][:6]
+    scorer = MLScorer(preprocessing='fast').fit(*training_set)
+    assert scorer.predict_scores(texts) == pytest.approx([scorer.predict_score(text) for text in texts])
+    assert scorer.predict_scores([]) == []
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from utils.model_artifact import ALIGNMENT, MAGIC, ModelArtifact, write_artifact
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / 'model.atsm')
+
+
+def test_round_trip_maps_arrays_without_copying(path):
+    weights = np.arange(1000, dtype=np.float64).reshape(100, 10)
+    write_artifact(path, {'weights': weights, 'config': {'ids': ['a', 'b'], 'bias': weights[0]}},
+                   metadata={'model_version': 'v1'})
+
+    artifact = ModelArtifact(path)
+    assert artifact.metadata == {'model_version': 'v1'}
+    assert 'weights' in artifact and 'missing' not in artifact
+    loaded = artifact.load('weights')
+    assert np.array_equal(loaded, weights)
+    assert not loaded.flags.owndata and not loaded.flags.writeable
+    # Array buffers start on aligned offsets in the file
+    address = loaded.__array_interface__['data'][0]
+    base = np.frombuffer(artifact.mmap, dtype=np.uint8).__array_interface__['data'][0]
+    assert (address - base) % ALIGNMENT == 0
+    config = artifact.load('config')
+    assert config['ids'] == ['a', 'b'] and np.array_equal(config['bias'], weights[0])
+
+
+def test_rewrite_replaces_the_file_atomically(path):
+    write_artifact(path, {'weights': np.zeros(4)})
+    old = ModelArtifact(path)
+    write_artifact(path, {'weights': np.ones(4)})
+    # A reader that mapped the old file keeps seeing it
+    assert old.load('weights').sum() == 0
+    assert ModelArtifact(path).load('weights').sum() == 4
+
+
+def test_other_files_are_rejected(path):
+    with open(path, 'wb') as f:
+        f.write(b'not a model artifact at all')
+    with pytest.raises(ValueError, match="not a model artifact"):
+        ModelArtifact(path)
+
+    write_artifact(path, {'weights': np.zeros(4)})
+    with open(path, 'r+b') as f:
+        f.seek(len(MAGIC))
+        f.write((99).to_bytes(4, 'little'))
+    with pytest.raises(ValueError, match="format 99"):
+        ModelArtifact(path)
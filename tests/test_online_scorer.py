@@ -0,0 +1,41 @@
+import numpy as np
+
+from utils.online_scorer import OnlineScorer
+
+
+def test_builds_only_the_online_model():
+    from sklearn.feature_extraction.text import HashingVectorizer
+    from sklearn.linear_model import SGDClassifier
+
+    scorer = OnlineScorer()
+    assert isinstance(scorer.vectorizer, HashingVectorizer)
+    assert isinstance(scorer.model, SGDClassifier)
+
+
+def test_feedback_moves_scores_toward_the_decision(training_set):
+    texts, labels = training_set
+    scorer = OnlineScorer(preprocessing='fast', batch_size=4).fit(texts, labels)
+    text = texts[0]
+    before = scorer.predict_score(text)
+    for _ in range(8):
+        scorer.add_feedback(text, accepted=False)
+    assert scorer.predict_score(text) < before
+    assert scorer.updates == len(texts) + 8
+
+
+def test_checkpoint_round_trip_and_update_after_loading(training_set, tmp_path):
+    texts, labels = training_set
+    path = str(tmp_path / 'online.atsm')
+    scorer = OnlineScorer(preprocessing='fast', batch_size=4).fit(texts, labels)
+    scorer.add_feedback(texts[0], accepted=True)
+    scorer.save_artifact(path)
+
+    loaded = OnlineScorer()
+    assert loaded.load_artifact(path)
+    assert loaded.updates == scorer.updates
+    assert np.allclose(loaded.predict_scores(texts), scorer.predict_scores(texts))
+    # Weights stay mapped from the artifact until feedback needs to change them
+    assert not loaded.model.coef_.flags.writeable
+    loaded.partial_fit(texts[:2], labels[:2])
+    assert loaded.model.coef_.flags.writeable
+    assert loaded.updates == scorer.updates + 2
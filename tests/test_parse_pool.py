@@ -0,0 +1,73 @@
+import os
+import resource
+import time
+
+import pytest
+
+from utils.parse_pool import ParseMemoryError, ParsePool, ParseTimeoutError
+
+
+def fake_parser(upload):
+    """Parser for worker tests; the file name picks the behaviour"""
+    if upload.name == 'hang.pdf':
+        time.sleep(60)
+    elif upload.name == 'bomb.pdf':
+        # Far past the cap
+        bytearray(1024 ** 3)
+    elif upload.name == 'crash.pdf':
+        os._exit(3)
+    elif upload.name == 'limit.pdf':
+        return str(resource.getrlimit(resource.RLIMIT_AS)[0]), 'pdf'
+    return upload.read().decode(), 'pdf'
+
+
+@pytest.fixture
+def pool():
+    pool = ParsePool(workers=1, timeout=2, max_rss=256 * 1024 * 1024, parser=fake_parser)
+    yield pool
+    pool.close()
+
+
+def test_parses_in_worker(pool):
+    assert pool.parse(b'resume text', 'ok.pdf') == ('resume text', 'pdf')
+
+
+def test_hanging_file_times_out_and_worker_is_replaced(pool):
+    start = time.monotonic()
+    with pytest.raises(ParseTimeoutError):
+        pool.parse(b'', 'hang.pdf')
+    assert time.monotonic() - start < 10
+    assert pool.parse(b'next', 'ok.pdf') == ('next', 'pdf')
+
+
+def test_large_allocation_hits_the_address_space_cap(pool):
+    with pytest.raises(ParseMemoryError):
+        pool.parse(b'', 'bomb.pdf')
+    assert pool.parse(b'next', 'ok.pdf') == ('next', 'pdf')
+
+
+def test_crashing_worker_is_reported_and_replaced(pool):
+    with pytest.raises(Exception, match='exited with code 3'):
+        pool.parse(b'', 'crash.pdf')
+    assert pool.parse(b'next', 'ok.pdf') == ('next', 'pdf')
+
+
+def test_worker_address_space_is_capped(pool):
+    limit = int(pool.parse(b'', 'limit.pdf')[0])
+    assert limit != resource.RLIM_INFINITY
+    # Room for the interpreter and parsers plus the 256 MB budget
+    assert limit < 2 * 1024 ** 3
+
+
+def test_batch_parses_through_the_pool():
+    from benchmarks.corpus import render_pdf
+    from utils.ats_analyzer import analyze_resumes
+
+    items = [('resume.pdf', render_pdf("Jane Doe\njane@example.com\nExperience\nPython developer")),
+             ('broken.pdf', b'%PDF-1.4 not really')]
+    isolated = list(analyze_resumes(items, workers=1, isolate=True, timings=True))
+    in_process = list(analyze_resumes(items, workers=1, isolate=False))
+    assert [r['error'] is None for r in isolated] == [True, False]
+    assert isolated[1]['error'] == in_process[1]['error']
+    assert isolated[0]['analysis']['overall_score'] == in_process[0]['analysis']['overall_score']
+    assert 'parse_resume' in isolated[0]['analysis']['timings']
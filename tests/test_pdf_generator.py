@@ -0,0 +1,95 @@
+import copy
+import json
+import zipfile
+
+import pytest
+
+import cli
+from utils import pdf_generator
+from utils.ats_analyzer import analyze_resume
+from utils.pdf_generator import report_bytes, result_hash, write_report_zip
+
+RESUME = "Jane Doe\njane@example.com\nExperience\nLed a team of 5 engineers, 2018 - 2023\nSkills\nPython, SQL"
+
+
+@pytest.fixture
+def analysis():
+    return analyze_resume(RESUME)
+
+
+@pytest.fixture
+def renders(monkeypatch):
+    """Results create_pdf_report was called for, with an empty report cache"""
+    monkeypatch.setattr(pdf_generator, '_report_cache', pdf_generator.OrderedDict())
+    calls = []
+    create_pdf_report = pdf_generator.create_pdf_report
+
+    def counting(analysis_results):
+        calls.append(analysis_results)
+        return create_pdf_report(analysis_results)
+
+    monkeypatch.setattr(pdf_generator, 'create_pdf_report', counting)
+    return calls
+
+
+def test_reports_are_rendered_once_per_result_content(analysis, renders):
+    pdf = report_bytes(analysis)
+    assert pdf.startswith(b'%PDF')
+    # An equal result from another session or rerun reuses the report
+    assert report_bytes(copy.deepcopy(analysis)) is pdf
+    assert len(renders) == 1
+    assert result_hash(analysis) == result_hash(copy.deepcopy(analysis))
+
+
+def test_json_and_unknown_formats(analysis, renders):
+    assert report_bytes(analysis, 'json').startswith(b'{')
+    with pytest.raises(ValueError):
+        report_bytes(analysis, 'html')
+    assert renders == []
+
+
+def test_report_cache_is_bounded(analysis, renders, monkeypatch):
+    monkeypatch.setattr(pdf_generator, 'REPORT_CACHE_SIZE', 2)
+    for score in range(3):
+        report_bytes({**analysis, 'overall_score': score}, 'json')
+    assert len(pdf_generator._report_cache) == 2
+
+
+def zip_entries(path):
+    with zipfile.ZipFile(path) as archive:
+        return {name: archive.read(name) for name in archive.namelist()}
+
+
+@pytest.fixture
+def items(analysis):
+    return [('dir/jane.pdf', analysis), ('other/jane.docx', analysis), ('jane', analysis),
+            ('', {**analysis, 'overall_score': 1})]
+
+
+def test_report_zip_names_are_unique(items, tmp_path):
+    path = tmp_path / 'reports.zip'
+    assert write_report_zip(iter(items), str(path), workers=1) == 4
+    entries = zip_entries(path)
+    assert list(entries) == ['jane_ats_report.pdf', 'jane_ats_report-2.pdf', 'jane_ats_report-3.pdf',
+                             'resume_ats_report.pdf']
+    assert all(data.startswith(b'%PDF') for data in entries.values())
+
+
+def test_report_zip_over_a_pool_matches_serial(items, tmp_path):
+    serial, pooled = tmp_path / 'serial.zip', tmp_path / 'pooled.zip'
+    write_report_zip(items, str(serial), workers=1)
+    # A window smaller than the batch exercises writing while rendering
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(pdf_generator, 'REPORTS_IN_FLIGHT_PER_WORKER', 1)
+        assert write_report_zip(items, str(pooled), workers=2) == 4
+    assert list(zip_entries(pooled)) == list(zip_entries(serial))
+
+
+def test_reports_subcommand(analysis, tmp_path, capsys):
+    results = tmp_path / 'results.jsonl'
+    results.write_text(json.dumps({'source': 'a.pdf', 'analysis': analysis, 'error': None}) + '\n' +
+                       json.dumps({'source': 'broken.pdf', 'analysis': None, 'error': "bad"}) + '\n')
+    out = tmp_path / 'reports.zip'
+    assert cli.main(['reports', str(results), '--out', str(out), '--jobs', '1']) == 0
+    assert list(zip_entries(out)) == ['a_ats_report.pdf']
+    assert "Wrote 1 reports" in capsys.readouterr().err
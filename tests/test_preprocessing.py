@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from benchmarks import bench_preprocess
+from benchmarks.bench_preprocess import agreement, features, make_corpus
+from utils import ml_scorer
+from utils.ml_scorer import MLScorer, load_nltk, load_stopwords
+
+TEXT = "Led 12 engineers; didn't miss deadlines. Developed scalable Python services and managed AWS costs."
+
+
+def test_stopwords_are_bundled():
+    stop_words = load_stopwords()
+    assert len(stop_words) == 198
+    assert {'the', 'and', "don't"} <= stop_words
+
+
+def test_fast_mode_reads_no_installed_data(monkeypatch):
+    def unavailable():
+        raise AssertionError("fast mode must not depend on NLTK data")
+    monkeypatch.setattr(ml_scorer, 'load_nltk', unavailable)
+    ml_scorer.fast_pos_tag.cache_clear()
+
+    processed, stats = MLScorer(preprocessing='fast').preprocess_text(TEXT)
+    assert processed == "led 12 engineers ; n't miss deadlines . developed scalable python services managed aws costs ."
+    assert stats == {'word_count': 16, 'avg_word_length': 4.9375, 'noun_count': 9,
+                     'verb_count': 2, 'number_count': 1}
+
+
+@pytest.mark.skipif(load_nltk() is None, reason="needs NLTK data (python cli.py nltk-data)")
+def test_fast_features_agree_with_full():
+    texts = make_corpus(100)
+    fast, _ = features(MLScorer(preprocessing='fast'), texts)
+    full, _ = features(MLScorer(preprocessing='full'), texts)
+    for name, (_, correlation) in agreement(fast, full).items():
+        assert np.isfinite(correlation), name
+
+
+def test_agreement_reports_relative_difference_and_correlation():
+    full = np.array([[10, 4.0, 5, 2, 0], [20, 5.0, 8, 4, 2], [40, 6.0, 12, 6, 4]])
+    fast = full * [1.1, 1, 1, 0.5, 1] + [0, 0, 1, 0, 0]
+    report = agreement(fast, full)
+    assert list(report) == ['word_count', 'avg_word_length', 'noun_count', 'verb_count', 'number_count']
+    assert report['word_count'] == pytest.approx((0.1, 1.0))
+    assert report['avg_word_length'] == pytest.approx((0.0, 1.0))
+    assert report['noun_count'][0] == pytest.approx((1 / 5 + 1 / 8 + 1 / 12) / 3)
+    assert report['verb_count'] == pytest.approx((0.5, 1.0))
+    # Zero counts are compared on an absolute scale rather than dividing by zero
+    assert report['number_count'] == pytest.approx((0.0, 1.0))
+
+
+def test_benchmark_reports_without_nltk_data(monkeypatch, capsys):
+    monkeypatch.setattr(bench_preprocess, 'load_nltk', lambda: None)
+    monkeypatch.setattr(bench_preprocess, 'make_corpus', lambda: make_corpus(5))
+    assert bench_preprocess.main() == 0
+    assert 'full path unavailable' in capsys.readouterr().out
@@ -0,0 +1,79 @@
+import os
+import shutil
+
+import pytest
+
+from utils import result_cache
+from utils.result_cache import RULE_FILES, ResultCache, analysis_fingerprint
+
+
+@pytest.fixture
+def rule_tree(tmp_path, monkeypatch):
+    """A copy of the rule sources the fingerprint can be pointed at"""
+    for name in RULE_FILES:
+        os.makedirs(tmp_path / os.path.dirname(name), exist_ok=True)
+        shutil.copy(os.path.join(result_cache.PACKAGE_ROOT, name), tmp_path / name)
+    monkeypatch.setattr(result_cache, 'PACKAGE_ROOT', str(tmp_path))
+    return tmp_path
+
+
+def test_scoring_modules_are_fingerprinted():
+    for name in ('forest_engine', 'model_artifact', 'online_scorer', 'ml_scorer'):
+        assert f'utils/{name}.py' in RULE_FILES
+
+
+@pytest.mark.parametrize('name', RULE_FILES)
+def test_editing_a_rule_file_changes_the_fingerprint(rule_tree, name):
+    before = analysis_fingerprint()
+    with open(rule_tree / name, 'a') as f:
+        f.write('\n# edited\n')
+    assert analysis_fingerprint() != before
+
+
+def test_results_from_another_fingerprint_are_dropped(tmp_path):
+    path = str(tmp_path / 'results.sqlite')
+    cache = ResultCache(path, version='old')
+    key = cache.key_for(b'resume bytes', 'resume.pdf')
+    cache.put(key, {'text': 'resume', 'file_type': 'pdf', 'analysis': {'overall_score': 50}})
+    assert ResultCache(path, version='old').get(key)['analysis'] == {'overall_score': 50}
+    assert ResultCache(path, version='new').get(key) is None
+
+
+def test_memory_tier_keeps_the_most_recently_used_entries():
+    cache = ResultCache(':memory:', max_entries=2, version='v')
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.get('a')
+    cache.put('c', 3)
+    assert list(cache.memory) == ['a', 'c']
+    # 'b' left memory but is still served from disk
+    assert cache.get('b') == 2
+
+
+def test_disk_tier_evicts_least_recently_accessed_entries_over_budget(monkeypatch):
+    clock = iter(range(1000))
+    monkeypatch.setattr(result_cache.time, 'time', lambda: next(clock))
+    value = 'x' * 1000
+    size = len(result_cache.zlib.compress(result_cache.json.dumps(value).encode()))
+    cache = ResultCache(':memory:', max_entries=1, max_bytes=3 * size, version='v')
+    for key in 'abc':
+        cache.put(key, value)
+    cache.get('a')
+    cache.put('d', value)
+
+    keys = {row[0] for row in cache.db.execute("SELECT key FROM results")}
+    assert keys == {'a', 'c', 'd'}
+    assert cache.total_bytes == 3 * size
+
+
+def test_byte_total_tracks_replaced_entries_and_reopening(tmp_path):
+    path = str(tmp_path / 'results.sqlite')
+    cache = ResultCache(path, version='v')
+    cache.put('a', 'short')
+    cache.put('a', 'a much longer value ' * 50)
+    cache.put('b', 'other')
+
+    def stored():
+        return cache.db.execute("SELECT SUM(size) FROM results").fetchone()[0]
+    assert cache.total_bytes == stored()
+    assert ResultCache(path, version='v').total_bytes == stored()
@@ -0,0 +1,31 @@
+import re
+
+from utils.ats_analyzer import analyze_resume
+from utils.resume_document import ResumeDocument
+
+RESUME = """Jane Doe
+jane.doe@example.com | 555-123-4567
+
+Experience
+Data Engineer, Acme Corp, 2018 - 2023
+
+Education
+B.S. in Computer Science, State University
+"""
+
+
+def test_flags_are_computed_once_from_the_text():
+    doc = ResumeDocument(RESUME)
+    assert doc.has_email and doc.has_phone and doc.has_year
+    assert not doc.has_non_ascii
+    assert doc.line_count == len(RESUME.split('\n'))
+    assert doc.contains(re.compile(r'data engineer'))
+    assert not doc.contains(re.compile(r'kubernetes'))
+
+
+def test_analysis_is_the_same_from_text_or_document():
+    assert analyze_resume(RESUME) == analyze_resume(ResumeDocument(RESUME))
+
+
+def test_missing_section_is_none():
+    assert ResumeDocument(RESUME).section('projects') is None
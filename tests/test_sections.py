@@ -0,0 +1,34 @@
+from utils.resume_document import detect_heading, segment_sections
+
+RESUME = """Jane Doe
+PROFESSIONAL SUMMARY
+Engineer who ships.
+Work Experience
+Acme Corp, 2018 - 2023
+Skills: Python, SQL
+Education
+State University
+"""
+
+
+def test_headings_and_inline_labels():
+    assert detect_heading('WORK EXPERIENCE') == 'experience'
+    assert detect_heading('Skills: python, sql') == 'skills'
+    assert detect_heading('Areas of Expertise') == 'skills'
+    assert detect_heading('Experienced in leading large teams across three continents') is None
+
+
+def test_sections_run_to_the_next_heading():
+    spans = segment_sections(RESUME)
+    text = {name: RESUME[start:end] for name, (start, end) in spans.items()}
+    assert text['summary'] == "PROFESSIONAL SUMMARY\nEngineer who ships.\n"
+    assert text['experience'] == "Work Experience\nAcme Corp, 2018 - 2023\n"
+    assert text['skills'] == "Skills: Python, SQL\n"
+    assert text['education'].startswith("Education\nState University")
+
+
+def test_keyword_fallback_without_heading_lines():
+    text = "Jane Doe experience at Acme 2018-2023 education State University skills python"
+    spans = segment_sections(text)
+    assert text[slice(*spans['experience'])] == "experience at Acme 2018-2023 "
+    assert text[slice(*spans['skills'])] == "skills python"
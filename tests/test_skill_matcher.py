@@ -0,0 +1,36 @@
+from utils.skill_matcher import SkillMatcher, load_skill_matcher
+
+
+def make_matcher():
+    matcher = SkillMatcher()
+    matcher.add('kubernetes', 'Technical', ['k8s'])
+    matcher.add('machine learning', 'Technical', ['ml'])
+    matcher.add('c++', 'Technical')
+    matcher.add('ci/cd', 'Tools')
+    matcher.add('communication', 'Soft Skills')
+    return matcher
+
+
+def test_matches_whole_words_phrases_and_aliases():
+    found = make_matcher().match("deployed to k8s; machine learning in c++ with ci-cd pipelines")
+    assert found == {'Technical': ['c++', 'kubernetes', 'machine learning'],
+                     'Tools': ['ci/cd'], 'Soft Skills': []}
+
+
+def test_does_not_match_inside_words():
+    assert make_matcher().find("html and mlops and communications") == set()
+
+
+def test_canonical_names_whole_phrases_only():
+    matcher = make_matcher()
+    assert matcher.canonical('K8s') == 'kubernetes'
+    assert matcher.canonical('machine learning') == 'machine learning'
+    assert matcher.canonical('machine') is None
+    assert matcher.canonical('') is None
+
+
+def test_bundled_taxonomy_loads_once():
+    matcher = load_skill_matcher()
+    assert matcher is load_skill_matcher()
+    assert matcher.skill_count > 0
+    assert 'python' in matcher.match('python3 developer')['Technical']
@@ -0,0 +1,190 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from functools import lru_cache
+
+import numpy as np
+
+from utils.candidate_index import snapshot_fields
+from utils.ml_scorer import PACKAGE_ROOT
+
+DEFAULT_STORE_PATH = os.environ.get('ATS_STORE_PATH', os.path.join(PACKAGE_ROOT, 'data', 'analyses.sqlite'))
+
+# Score columns and the section score each holds; scores are stored as
+# integer tenths of a point, which SQLite packs into one or two bytes
+# where a REAL always takes eight
+SCORE_COLUMNS = {
+    'overall': None,
+    'format': 'Format',
+    'content': 'Content',
+    'keywords': 'Keywords',
+    'ml': 'ML Score'
+}
+SUMMARY_COLUMNS = ('id', 'source', 'created_at') + tuple(SCORE_COLUMNS) + ('experience', 'education', 'leadership')
+
+
+def _tenths(score):
+    return None if score is None else int(round(float(score) * 10))
+
+
+class AnalysisStore:
+    """
+    Persistent history of analysis results in SQLite (WAL mode).
+
+    Each result is one row of compact integer columns (scores, experience,
+    education and leadership) plus its full analysis as a zlib-compressed
+    JSON blob, and one row per skill in a separate table. History pages
+    walk the primary key, and score distributions and skill counts are
+    answered from covering indexes, so neither loads the blobs. MinHash
+    signatures are kept alongside so near-duplicate checks can span
+    sessions and restarts. Safe to share between threads.
+    """
+    def __init__(self, path=DEFAULT_STORE_PATH):
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS analyses (
+                id INTEGER PRIMARY KEY,
+                source TEXT NOT NULL,
+                created_at INTEGER NOT NULL,
+                overall INTEGER NOT NULL,
+                format INTEGER,
+                content INTEGER,
+                keywords INTEGER,
+                ml INTEGER,
+                experience INTEGER,
+                education INTEGER NOT NULL,
+                leadership INTEGER NOT NULL,
+                details BLOB NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS analyses_overall ON analyses (overall);
+            CREATE TABLE IF NOT EXISTS analysis_skills (
+                skill TEXT NOT NULL,
+                analysis_id INTEGER NOT NULL,
+                PRIMARY KEY (skill, analysis_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS analysis_skills_id ON analysis_skills (analysis_id);
+            CREATE TABLE IF NOT EXISTS analysis_signatures (
+                analysis_id INTEGER PRIMARY KEY,
+                signature BLOB NOT NULL
+            );
+        """)
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        with self.lock:
+            return self.db.execute("SELECT COUNT(*) FROM analyses").fetchone()[0]
+
+    def add(self, source, analysis, created_at=None):
+        """Store one analyze_resume result; returns its id"""
+        return self.add_many([(source, analysis, created_at)])[0]
+
+    def add_many(self, items):
+        """Store many (source, analysis[, created_at]) items in one transaction; returns their ids"""
+        ids = []
+        with self.lock, self.db:
+            for item in items:
+                source, analysis = item[0], item[1]
+                created_at = item[2] if len(item) > 2 and item[2] is not None else time.time()
+                skills, _, experience, education, leadership = snapshot_fields(analysis)
+                scores = [_tenths(analysis['overall_score'])]
+                scores += [_tenths(analysis['section_scores'].get(name)) for name in list(SCORE_COLUMNS.values())[1:]]
+                details = zlib.compress(json.dumps(analysis, default=str).encode())
+                cursor = self.db.execute(
+                    "INSERT INTO analyses (source, created_at, overall, format, content, keywords, ml, "
+                    "experience, education, leadership, details) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (source, int(created_at), *scores, None if np.isnan(experience) else int(experience),
+                     education, leadership, details)
+                )
+                ids.append(cursor.lastrowid)
+                self.db.executemany("INSERT INTO analysis_skills (skill, analysis_id) VALUES (?, ?)",
+                                    [(skill, cursor.lastrowid) for skill in skills])
+        return ids
+
+    def get(self, analysis_id):
+        """Return the full analysis stored under an id, or None"""
+        with self.lock:
+            row = self.db.execute("SELECT details FROM analyses WHERE id = ?", (analysis_id,)).fetchone()
+        return None if row is None else json.loads(zlib.decompress(row[0]))
+
+    def source(self, analysis_id):
+        """Return the file name a result was stored under, or None"""
+        with self.lock:
+            row = self.db.execute("SELECT source FROM analyses WHERE id = ?", (analysis_id,)).fetchone()
+        return None if row is None else row[0]
+
+    def set_signature(self, analysis_id, signature):
+        """Store a result's MinHash signature for near-duplicate checks"""
+        with self.lock, self.db:
+            self.db.execute("INSERT OR REPLACE INTO analysis_signatures (analysis_id, signature) VALUES (?, ?)",
+                            (analysis_id, np.asarray(signature, dtype=np.uint32).tobytes()))
+
+    def signatures(self):
+        """Return (id, signature) for every stored result that has one"""
+        with self.lock:
+            rows = self.db.execute("SELECT analysis_id, signature FROM analysis_signatures").fetchall()
+        return [(analysis_id, np.frombuffer(signature, dtype=np.uint32)) for analysis_id, signature in rows]
+
+    def remove(self, analysis_id):
+        """Delete one stored result; returns whether it existed"""
+        with self.lock, self.db:
+            self.db.execute("DELETE FROM analysis_skills WHERE analysis_id = ?", (analysis_id,))
+            self.db.execute("DELETE FROM analysis_signatures WHERE analysis_id = ?", (analysis_id,))
+            return self.db.execute("DELETE FROM analyses WHERE id = ?", (analysis_id,)).rowcount > 0
+
+    def history(self, limit=20, offset=0, before_id=None):
+        """
+        Return one page of stored results, newest first, as dicts of the
+        summary columns (no details). Pass the last id of a page as
+        before_id to fetch the next one without an OFFSET scan.
+        """
+        query = f"SELECT {', '.join(SUMMARY_COLUMNS)} FROM analyses"
+        params = []
+        if before_id is not None:
+            query += " WHERE id < ?"
+            params.append(before_id)
+        query += " ORDER BY id DESC LIMIT ? OFFSET ?"
+        with self.lock:
+            rows = self.db.execute(query, params + [limit, offset]).fetchall()
+        page = []
+        for row in rows:
+            entry = dict(zip(SUMMARY_COLUMNS, row))
+            for name in SCORE_COLUMNS:
+                if entry[name] is not None:
+                    entry[name] /= 10
+            page.append(entry)
+        return page
+
+    def score_distribution(self, bins=10):
+        """Return (low, high, count) per overall-score bucket, 0-100 split into bins"""
+        # At most 1001 distinct scores in tenths, grouped in index order
+        with self.lock:
+            rows = self.db.execute("SELECT overall, COUNT(*) FROM analyses GROUP BY overall").fetchall()
+        counts = [0] * bins
+        for overall, count in rows:
+            counts[min(max(overall * bins // 1000, 0), bins - 1)] += count
+        width = 100 / bins
+        return [(round(i * width, 1), round((i + 1) * width, 1), count) for i, count in enumerate(counts)]
+
+    def skill_counts(self, limit=20):
+        """Return (skill, number of stored results mentioning it), most common first"""
+        with self.lock:
+            return self.db.execute(
+                "SELECT skill, COUNT(*) FROM analysis_skills GROUP BY skill ORDER BY 2 DESC, skill LIMIT ?",
+                (limit,)
+            ).fetchall()
+
+    def close(self):
+        self.db.close()
+
+
+@lru_cache(maxsize=1)
+def get_analysis_store():
+    """Return the process-wide analysis store"""
+    return AnalysisStore()
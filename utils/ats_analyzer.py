@@ -1,20 +1,98 @@
+import io
+import os
 import re
-from utils.ml_scorer import MLScorer
-
-# Initialize ML scorer
-ml_scorer = MLScorer()
-
-def analyze_resume(text):
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from contextlib import nullcontext
+from multiprocessing import Pool
+from utils import metrics
+from utils.file_parser import parse_resume
+from utils.ml_scorer import DEFAULT_SCORER, MLScorer
+from utils.online_scorer import OnlineScorer
+from utils.parse_pool import PARSE_ISOLATION, ParsePool
+from utils.resume_document import ResumeDocument, YEAR_PATTERN
+from utils.skill_matcher import load_skill_matcher
+
+SCORERS = {'forest': MLScorer, 'online': OnlineScorer}
+
+# A batch item already parsed in the parent process; error is the
+# exception parsing raised, observations its parse-stage timings
+ParsedItem = namedtuple('ParsedItem', 'source text file_type error observations')
+
+@lru_cache(maxsize=1)
+def get_ml_scorer():
+    """Build the ML scorer on first use so importing the analyzer stays cheap"""
+    scorer = SCORERS[DEFAULT_SCORER]()
+    scorer.load_artifact()
+    return scorer
+
+# Rule patterns, matched against the lowercased text
+SECTION_TERMS = re.compile(r'education|experience|skills')
+EXPERIENCE_TERMS = re.compile(r'experience|work|employment')
+EDUCATION_TERMS = re.compile(r'education|degree|university|college')
+SKILLS_TERMS = re.compile(r'skills|expertise|proficiencies')
+ACTION_VERBS = re.compile(r'\b(achieved|improved|increased|led|managed|developed)\b')
+QUANTIFIERS = re.compile(r'\b\d+%|\d+\s*(million|thousand|k)\b')
+KEYWORDS = ['experience', 'project', 'skill', 'education', 'achievement', 'responsibility']
+
+EDUCATION_LEVELS = {
+    re.compile(r'\bph\.?d\.?\b|\bdoctorate\b'): 'Doctorate',
+    re.compile(r"\bmaster'?s?\b|\bm\.?b\.?a\.?\b|\bm\.?s\.?\b|\bm\.?a\.?\b"): "Master's",
+    re.compile(r"\bbachelor'?s?\b|\bb\.?s\.?\b|\bb\.?a\.?\b"): "Bachelor's",
+    re.compile(r"\bassociate'?s?\b|\ba\.?a\.?\b"): "Associate's"
+}
+MAJOR_PATTERNS = [
+    re.compile(r'(?i)in\s+([\w\s]+?)(?=from|at|,|\d|$)'),
+    re.compile(r'(?i)of\s+([\w\s]+?)(?=from|at|,|\d|$)'),
+    re.compile(r'(?i)(computer science|engineering|business|psychology|mathematics|physics|chemistry|biology|economics|finance|marketing|management|accounting|communications|english|history|philosophy|political science|sociology)([\s,]|$)')
+]
+INSTITUTION_PATTERN = re.compile(r'(?i)(?:at|from)\s+([\w\s&]+?)(?=\sin|,|\d|$)')
+
+# Categories always present in the skills breakdown, whatever the taxonomy holds
+SKILL_CATEGORIES = ('Technical', 'Soft Skills', 'Tools')
+
+STANDARD_SECTIONS = {
+    'Contact Information': re.compile(r'\b(?:phone|email|address|linkedin)\b'),
+    'Summary/Objective': re.compile(r'\b(?:summary|objective|profile|about)\b'),
+    'Experience': re.compile(r'\b(?:experience|work|employment|career)\b'),
+    'Education': re.compile(r'\b(?:education|degree|university|college)\b'),
+    'Skills': re.compile(r'\b(?:skills|expertise|competencies|proficiencies)\b'),
+    'Projects': re.compile(r'\b(?:projects|portfolio|achievements)\b')
+}
+
+LEADERSHIP_TERMS = [
+    re.compile(r'\b(managed|led|supervised|directed|coordinated)\b'),
+    re.compile(r'\b(team|group|department|division)\b'),
+    re.compile(r'\b(leadership|manager|director|supervisor|head)\b')
+]
+
+
+def analyze_resume(text, timings=False):
     """
-    Analyze resume content for ATS compliance
+    Analyze resume content for ATS compliance.
+
+    With timings=True the result gets a "timings" block of milliseconds per
+    pipeline stage, including parsing when the caller collected it.
     """
+    if timings and metrics.current_observations() is None:
+        with metrics.collect():
+            return analyze_resume(text, timings=True)
+
+    # Build the shared feature view once; every rule reads from it
+    if isinstance(text, ResumeDocument):
+        doc = text
+    else:
+        with metrics.stage('document', len(text)):
+            doc = ResumeDocument(text)
+
     # Initialize scores
-    format_score = analyze_format(text)
-    content_score = analyze_content(text)
-    keyword_score = analyze_keywords(text)
+    format_score = analyze_format(doc)
+    content_score = analyze_content(doc)
+    keyword_score = analyze_keywords(doc)
 
     # Get ML-based score
-    ml_score = ml_scorer.predict_score(text)
+    ml_score = get_ml_scorer().predict_score(doc.text)
 
     # Calculate overall score (25% each for format, content, keywords, and ML score)
     overall_score = (format_score + content_score + keyword_score + ml_score) / 4
@@ -28,23 +106,23 @@ def analyze_resume(text):
     }
 
     # Format analysis
-    format_analysis = check_format(text)
+    format_analysis = check_format(doc)
 
     # Content analysis
     content_analysis = {
-        "Contact Information": check_contact_info(text),
-        "Experience": check_experience(text),
-        "Education": check_education(text),
-        "Skills": check_skills(text)
+        "Contact Information": check_contact_info(doc),
+        "Experience": check_experience(doc),
+        "Education": check_education(doc),
+        "Skills": check_skills(doc)
     }
 
     # Generate recommendations
-    recommendations = generate_recommendations(text, format_analysis, content_analysis)
+    recommendations = generate_recommendations(doc, format_analysis, content_analysis)
 
     # Generate HR snapshot
-    hr_snapshot = generate_hr_snapshot(text)
+    hr_snapshot = generate_hr_snapshot(doc)
 
-    return {
+    results = {
         "overall_score": round(overall_score, 1),
         "section_scores": section_scores,
         "format_analysis": format_analysis,
@@ -52,101 +130,278 @@ def analyze_resume(text):
         "recommendations": recommendations,
         "hr_snapshot": hr_snapshot
     }
+    if timings:
+        results["timings"] = metrics.summarize(metrics.current_observations())
+    return results
 
-def analyze_format(text):
+def analyze_resumes(items, workers=None, chunksize=1, ordered=True, dedup=None, collapse_duplicates=False,
+                    timings=False, isolate=PARSE_ISOLATION):
+    """
+    Parse and analyze many resumes across a process pool.
+
+    items is an iterable of file paths or (filename, bytes) pairs. Yields one
+    record per item with its index, source, file_type and analysis; a file
+    that fails to parse or analyze yields a record with "error" set instead
+    of stopping the batch. Results come back in input order unless
+    ordered=False, in which case they are yielded as they complete.
+
+    Pass a DuplicateIndex as dedup to set each record's "duplicate_of" to
+    the source of an earlier near-duplicate (or None). Parsed files are
+    checked in input order before analysis, so the first copy is always the
+    original; with collapse_duplicates=True later copies are not analyzed
+    and their records carry only "duplicate_of". timings=True adds a
+    "timings" block to each analysis. Stage metrics recorded in worker
+    processes are folded into this process's metrics.
+
+    With isolate=True (unless ATS_PARSE_ISOLATION=0) files are parsed in a
+    ParsePool with the same time and memory budgets as web uploads, so a
+    file that hangs or balloons yields an error record instead of stalling
+    the batch. Otherwise they are parsed in the analysis workers, or in this
+    process when dedup needs the text first.
+    """
+    jobs = enumerate(items)
+    if isolate:
+        jobs = _parse_isolated(jobs, workers or os.cpu_count(), timings)
+    elif dedup is not None:
+        jobs = ((index, _parse_item(None, item, timings)) for index, item in jobs)
+    duplicates = collapsed = None
+    if dedup is not None:
+        duplicates, collapsed = {}, deque()
+        jobs = _check_duplicates(jobs, dedup, collapse_duplicates, duplicates, collapsed)
+    analyze = partial(_analyze_job, timings=timings, observe=metrics.ENABLED and workers != 1)
+    if workers == 1:
+        yield from _merge_records(map(analyze, jobs), duplicates, collapsed, ordered)
+        return
+
+    with Pool(processes=workers, initializer=_init_worker) as pool:
+        imap = pool.imap if ordered else pool.imap_unordered
+        yield from _merge_records(imap(analyze, jobs, chunksize=chunksize), duplicates, collapsed, ordered)
+
+def _check_duplicates(jobs, dedup, collapse, duplicates, collapsed):
+    """
+    Check parsed batch items against the duplicate index in input order,
+    noting each one's original in duplicates. Yields the jobs left to
+    analyze; collapsed duplicates become finished records in collapsed.
+    """
+    for index, parsed in jobs:
+        match = dedup.check(parsed.source, text=parsed.text) if parsed.error is None else None
+        duplicates[index] = match[0] if match else None
+        if match and collapse:
+            collapsed.append({"index": index, "source": parsed.source, "file_type": parsed.file_type,
+                              "analysis": None, "error": None, "duplicate_of": match[0]})
+        else:
+            yield index, parsed
+
+def _merge_records(records, duplicates, collapsed, ordered):
+    """
+    Finish analyzed records, slotting in the collapsed duplicates' records
+    by input order (or as soon as they are found when not ordered)
+    """
+    for record in records:
+        # Jobs are pulled ahead of their results, so every collapsed item
+        # before this record in input order has been queued by now
+        while collapsed and (not ordered or collapsed[0]["index"] < record["index"]):
+            yield collapsed.popleft()
+        yield _finish_record(record, duplicates)
+    while collapsed:
+        yield collapsed.popleft()
+
+def _finish_record(record, duplicates):
+    """Merge a worker's stage metrics and attach the record's duplicate check"""
+    metrics.record_all(record.pop("observations", ()))
+    if duplicates is not None:
+        record["duplicate_of"] = duplicates.pop(record["index"], None)
+    return record
+
+def _parse_isolated(jobs, workers, timings):
+    """Parse batch items in a ParsePool, yielding (index, ParsedItem) in input order"""
+    pool = ParsePool(workers=workers)
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # A couple of files per worker in flight keeps the pool busy
+            # without reading the whole batch into memory
+            window = deque()
+            for index, item in jobs:
+                window.append((index, executor.submit(_parse_item, pool, item, timings)))
+                if len(window) >= 2 * workers:
+                    index, future = window.popleft()
+                    yield index, future.result()
+            while window:
+                index, future = window.popleft()
+                yield index, future.result()
+    finally:
+        pool.close()
+
+def _parse_item(pool, item, timings):
+    """Parse one batch item in a ParsePool, or in this process when pool is None"""
+    source = item[0] if isinstance(item, tuple) else os.fspath(item)
+    text = file_type = error = None
+    with metrics.collect() if timings else nullcontext() as observations:
+        try:
+            upload = _open_upload(item)
+            if pool is None:
+                text, file_type = parse_resume(upload)
+            else:
+                # Timed here, since the worker process keeps its own metrics
+                with metrics.stage('parse_resume', len(upload.getvalue())):
+                    text, file_type = pool.parse(upload.getvalue(), upload.name)
+        except Exception as e:
+            error = e
+    return ParsedItem(source, text, file_type, error, observations or [])
+
+def _init_worker():
+    """Build per-process caches once per worker rather than once per task"""
+    get_ml_scorer()
+    load_skill_matcher()
+
+def _open_upload(item):
+    """Turn a batch item into a named file object that parse_resume accepts"""
+    if isinstance(item, tuple):
+        name, data = item
+    else:
+        name = os.fspath(item)
+        with open(name, 'rb') as f:
+            data = f.read()
+    upload = io.BytesIO(data)
+    upload.name = name
+    return upload
+
+def _analyze_job(job, timings=False, observe=False):
+    """
+    Analyze one batch item, capturing any failure in the record. With
+    observe=True the record carries the stage observations back to the parent.
+    """
+    index, item = job
+    parsed = item if isinstance(item, ParsedItem) else None
+    if parsed is not None:
+        source = parsed.source
+    else:
+        source = item[0] if isinstance(item, tuple) else os.fspath(item)
+    record = {"index": index, "source": source, "file_type": None, "analysis": None, "error": None}
+    with metrics.collect() if timings or observe else nullcontext() as observations:
+        # Parse timings taken in the parent count toward this file's timings
+        # block, but are already in the parent's metrics
+        parse_observations = parsed.observations if parsed is not None and observations is not None else []
+        if parse_observations:
+            observations.extend(parse_observations)
+        try:
+            if parsed is None:
+                text, record["file_type"] = parse_resume(_open_upload(item))
+            elif parsed.error is not None:
+                raise parsed.error
+            else:
+                text, record["file_type"] = parsed.text, parsed.file_type
+            record["analysis"] = analyze_resume(text, timings=timings)
+        except Exception as e:
+            record["error"] = str(e)
+    if observe:
+        record["observations"] = observations[len(parse_observations):]
+    return record
+
+def _doc_size(doc, *args):
+    return doc.length
+
+@metrics.timed('analyze_format', size=_doc_size)
+def analyze_format(doc):
     """Calculate format compliance score"""
     score = 100
 
     # Check for common format issues
-    if len(text.split('\n')) < 10:
+    if doc.line_count < 10:
         score -= 20
-    if len(text) < 200:
+    if doc.length < 200:
         score -= 20
-    if re.search(r'[^\x00-\x7F]+', text):  # Check for non-ASCII characters
+    if doc.has_non_ascii:  # Check for non-ASCII characters
         score -= 10
 
     return max(0, score)
 
-def analyze_content(text):
+@metrics.timed('analyze_content', size=_doc_size)
+def analyze_content(doc):
     """Calculate content quality score"""
     score = 100
 
     # Basic content checks
-    if not re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text):
+    if not doc.has_email:
         score -= 20
-    if not re.search(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b', text):
+    if not doc.has_phone:
         score -= 15
-    if not re.search(r'education|experience|skills', text.lower()):
+    if not doc.contains(SECTION_TERMS):
         score -= 25
 
     return max(0, score)
 
-def analyze_keywords(text):
+@metrics.timed('analyze_keywords', size=_doc_size)
+def analyze_keywords(doc):
     """Calculate keyword optimization score"""
-    keywords = ['experience', 'project', 'skill', 'education', 'achievement', 'responsibility']
     score = 100
 
-    text_lower = text.lower()
-    for keyword in keywords:
-        if keyword not in text_lower:
+    for keyword in KEYWORDS:
+        if keyword not in doc.lower:
             score -= 15
 
     return max(0, score)
 
-def check_format(text):
+@metrics.timed('check_format', size=_doc_size)
+def check_format(doc):
     """Check formatting issues"""
     issues = []
 
-    if len(text.split('\n')) < 10:
+    if doc.line_count < 10:
         issues.append("Resume seems too short or poorly structured")
-    if re.search(r'[^\x00-\x7F]+', text):
+    if doc.has_non_ascii:
         issues.append("Contains special characters that may not be ATS-friendly")
-    if len(text) < 200:
+    if doc.length < 200:
         issues.append("Content length appears insufficient")
 
     return issues if issues else ["Format appears compliant with ATS requirements"]
 
-def check_contact_info(text):
+@metrics.timed('check_contact_info', size=_doc_size)
+def check_contact_info(doc):
     """Check contact information section"""
     issues = []
 
-    if not re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text):
+    if not doc.has_email:
         issues.append("Email address not found or in incorrect format")
-    if not re.search(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b', text):
+    if not doc.has_phone:
         issues.append("Phone number not found or in incorrect format")
 
     return issues if issues else ["Contact information appears complete"]
 
-def check_experience(text):
+@metrics.timed('check_experience', size=_doc_size)
+def check_experience(doc):
     """Check experience section"""
     issues = []
 
-    if not re.search(r'experience|work|employment', text.lower()):
+    if not doc.contains(EXPERIENCE_TERMS):
         issues.append("Experience section not clearly defined")
-    if not re.search(r'(19|20)\d{2}', text):
+    if not doc.has_year:
         issues.append("Dates not found in experience section")
 
     return issues if issues else ["Experience section appears well-structured"]
 
-def check_education(text):
+@metrics.timed('check_education', size=_doc_size)
+def check_education(doc):
     """Check education section"""
     issues = []
 
-    if not re.search(r'education|degree|university|college', text.lower()):
+    if not doc.contains(EDUCATION_TERMS):
         issues.append("Education section not clearly defined")
 
     return issues if issues else ["Education section appears complete"]
 
-def check_skills(text):
+@metrics.timed('check_skills', size=_doc_size)
+def check_skills(doc):
     """Check skills section"""
     issues = []
 
-    if not re.search(r'skills|expertise|proficiencies', text.lower()):
+    if not doc.contains(SKILLS_TERMS):
         issues.append("Skills section not clearly defined")
 
     return issues if issues else ["Skills section appears well-structured"]
 
-def generate_recommendations(text, format_analysis, content_analysis):
+@metrics.timed('generate_recommendations', size=_doc_size)
+def generate_recommendations(doc, format_analysis, content_analysis):
     """Generate recommendations based on analysis"""
     recommendations = {
         "Format Improvements": [],
@@ -155,67 +410,67 @@ def generate_recommendations(text, format_analysis, content_analysis):
     }
 
     # Format recommendations
-    if len(text.split('\n')) < 10:
+    if doc.line_count < 10:
         recommendations["Format Improvements"].append("Improve resume structure with clear section headings")
-    if re.search(r'[^\x00-\x7F]+', text):
+    if doc.has_non_ascii:
         recommendations["Format Improvements"].append("Remove special characters and use standard fonts")
 
     # Content recommendations
-    if not re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text):
+    if not doc.has_email:
         recommendations["Content Enhancements"].append("Add a professional email address")
-    if not re.search(r'experience|work|employment', text.lower()):
+    if not doc.contains(EXPERIENCE_TERMS):
         recommendations["Content Enhancements"].append("Clearly label your work experience section")
 
     # Keyword recommendations
-    if not re.search(r'skills|expertise|proficiencies', text.lower()):
+    if not doc.contains(SKILLS_TERMS):
         recommendations["Keyword Optimization"].append("Add a dedicated skills section with relevant keywords")
 
     return recommendations
 
-def generate_hr_snapshot(text):
+@metrics.timed('generate_hr_snapshot', size=_doc_size)
+def generate_hr_snapshot(doc):
     """Generate a quick snapshot of what HR will look for"""
     snapshot = {
         "Quick Stats": {
-            "Experience": estimate_experience_years(text),
-            "Education": identify_education_level(text),
-            "Skills": identify_key_skills(text),
-            "Leadership Indicators": check_leadership_indicators(text)
+            "Experience": estimate_experience_years(doc),
+            "Education": identify_education_level(doc),
+            "Skills": identify_key_skills(doc),
+            "Leadership Indicators": check_leadership_indicators(doc)
         },
         "Initial Impressions": [],
         "Potential Red Flags": []
     }
 
     # Check for essential components
-    if not re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text):
+    if not doc.has_email:
         snapshot["Potential Red Flags"].append("Missing contact information")
 
     # Check for missing sections
-    missing_sections = check_missing_sections(text)
+    missing_sections = check_missing_sections(doc)
     if missing_sections:
         for section in missing_sections:
             snapshot["Potential Red Flags"].append(f"Missing {section} section")
 
     # Check for positive indicators
-    if re.search(r'\b(achieved|improved|increased|led|managed|developed)\b', text.lower()):
+    if doc.contains(ACTION_VERBS):
         snapshot["Initial Impressions"].append("Contains strong action verbs")
 
-    if re.search(r'\b\d+%|\d+\s*(million|thousand|k)\b', text.lower()):
+    if doc.contains(QUANTIFIERS):
         snapshot["Initial Impressions"].append("Includes quantifiable achievements")
 
     return snapshot
 
-def estimate_experience_years(text):
+def estimate_experience_years(doc):
     """Estimate years of experience from resume text"""
     # First look for experience section
-    exp_section = re.search(r'(?i)experience.*?(?=education|skills|$)', text, re.DOTALL)
-    if exp_section:
-        text_to_search = exp_section.group(0)
+    exp_section = doc.section('experience')
+    if exp_section is not None:
+        text_to_search = exp_section
     else:
-        text_to_search = text
+        text_to_search = doc.text
 
     # Look for year patterns
-    years_pattern = r'(19|20)\d{2}'
-    years = re.findall(years_pattern, text_to_search)
+    years = YEAR_PATTERN.findall(text_to_search)
 
     if len(years) >= 2:
         years = [int(y) for y in years]
@@ -227,13 +482,12 @@ def estimate_experience_years(text):
         return f"{latest_year - earliest_year} years ({earliest_year} - {latest_year})"
     return "Experience timeline not clear"
 
-def identify_education_level(text):
+def identify_education_level(doc):
     """Identify highest education level and details"""
-    education_section = re.search(r'(?i)education.*?(?=experience|skills|$)', text, re.DOTALL)
-    if not education_section:
+    edu_text = doc.section('education')
+    if edu_text is None:
         return "Education details not found"
 
-    edu_text = education_section.group(0)
     education_details = {
         'level': 'Not specified',
         'major': 'Not specified',
@@ -241,101 +495,53 @@ def identify_education_level(text):
     }
 
     # Check education level
-    levels = {
-        r'\bph\.?d\.?\b|\bdoctorate\b': 'Doctorate',
-        r"\bmaster'?s?\b|\bm\.?b\.?a\.?\b|\bm\.?s\.?\b|\bm\.?a\.?\b": "Master's",
-        r"\bbachelor'?s?\b|\bb\.?s\.?\b|\bb\.?a\.?\b": "Bachelor's",
-        r"\bassociate'?s?\b|\ba\.?a\.?\b": "Associate's"
-    }
-
-    for pattern, level in levels.items():
-        if re.search(pattern, edu_text.lower()):
+    edu_lower = edu_text.lower()
+    for pattern, level in EDUCATION_LEVELS.items():
+        if pattern.search(edu_lower):
             education_details['level'] = level
             break
 
     # Try to identify major
-    major_patterns = [
-        r'(?i)in\s+([\w\s]+?)(?=from|at|,|\d|$)',
-        r'(?i)of\s+([\w\s]+?)(?=from|at|,|\d|$)',
-        r'(?i)(computer science|engineering|business|psychology|mathematics|physics|chemistry|biology|economics|finance|marketing|management|accounting|communications|english|history|philosophy|political science|sociology)([\s,]|$)'
-    ]
-
-    for pattern in major_patterns:
-        major_match = re.search(pattern, edu_text)
+    for pattern in MAJOR_PATTERNS:
+        major_match = pattern.search(edu_text)
         if major_match:
             education_details['major'] = major_match.group(1).strip().title()
             break
 
     # Try to identify institution
-    inst_match = re.search(r'(?i)(?:at|from)\s+([\w\s&]+?)(?=\sin|,|\d|$)', edu_text)
+    inst_match = INSTITUTION_PATTERN.search(edu_text)
     if inst_match:
         education_details['institution'] = inst_match.group(1).strip().title()
 
     return education_details
 
-def identify_key_skills(text):
+def identify_key_skills(doc):
     """Identify specific key skills from the resume"""
-    skills_section = re.search(r'(?i)skills.*?(?=experience|education|$)', text, re.DOTALL)
-    if skills_section:
-        text_to_search = skills_section.group(0)
+    skills_section = doc.section('skills')
+    if skills_section is not None:
+        text_to_search = skills_section.lower()
     else:
-        text_to_search = text
-
-    skill_categories = {
-        'Technical': [
-            r'\b(python|java|javascript|typescript|react|angular|vue|node\.js|sql|aws|azure|docker|kubernetes|git)\b',
-            r'\b(html5|css3|rest api|graphql|mongodb|postgresql|mysql|redis|elasticsearch)\b',
-            r'\b(machine learning|artificial intelligence|data science|cloud computing|devops|ci/cd)\b'
-        ],
-        'Soft Skills': [
-            r'\b(leadership|management|communication|teamwork|problem.solving|analytical)\b',
-            r'\b(project management|time management|critical thinking|decision making|negotiation)\b'
-        ],
-        'Tools': [
-            r'\b(jira|confluence|slack|microsoft office|excel|powerpoint|photoshop|figma|sketch)\b',
-            r'\b(visual studio|intellij|eclipse|postman|jenkins|terraform|ansible)\b'
-        ]
-    }
-
-    identified_skills = {category: set() for category in skill_categories}
+        text_to_search = doc.lower
 
-    for category, patterns in skill_categories.items():
-        for pattern in patterns:
-            skills = re.findall(pattern, text_to_search.lower())
-            identified_skills[category].update(skills)
+    identified_skills = {category: [] for category in SKILL_CATEGORIES}
+    identified_skills.update(load_skill_matcher().match(text_to_search))
 
-    # Convert sets to sorted lists
-    return {category: sorted(list(skills)) for category, skills in identified_skills.items()}
+    return identified_skills
 
-def check_missing_sections(text):
+def check_missing_sections(doc):
     """Check for missing standard resume sections"""
-    standard_sections = {
-        'Contact Information': r'\b(?:phone|email|address|linkedin)\b',
-        'Summary/Objective': r'\b(?:summary|objective|profile|about)\b',
-        'Experience': r'\b(?:experience|work|employment|career)\b',
-        'Education': r'\b(?:education|degree|university|college)\b',
-        'Skills': r'\b(?:skills|expertise|competencies|proficiencies)\b',
-        'Projects': r'\b(?:projects|portfolio|achievements)\b'
-    }
-
     missing_sections = []
-    for section, pattern in standard_sections.items():
-        if not re.search(pattern, text.lower()):
+    for section, pattern in STANDARD_SECTIONS.items():
+        if not doc.contains(pattern):
             missing_sections.append(section)
 
     return missing_sections
 
-def check_leadership_indicators(text):
+def check_leadership_indicators(doc):
     """Check for leadership experience indicators"""
-    leadership_terms = [
-        r'\b(managed|led|supervised|directed|coordinated)\b',
-        r'\b(team|group|department|division)\b',
-        r'\b(leadership|manager|director|supervisor|head)\b'
-    ]
-
     indicators = []
-    for term in leadership_terms:
-        if re.search(term, text.lower()):
+    for term in LEADERSHIP_TERMS:
+        if doc.contains(term):
             indicators.append(True)
 
-    return "Strong" if len(indicators) >= 2 else "Limited" if indicators else "None"
\ No newline at end of file
+    return "Strong" if len(indicators) >= 2 else "Limited" if indicators else "None"
@@ -0,0 +1,300 @@
+import os
+import re
+import sqlite3
+import threading
+
+import numpy as np
+
+from utils.ml_scorer import PACKAGE_ROOT
+from utils.skill_matcher import load_skill_matcher
+
+DEFAULT_INDEX_PATH = os.environ.get('ATS_INDEX_PATH', os.path.join(PACKAGE_ROOT, 'data', 'candidates.sqlite'))
+
+# Ordinal encodings of the HR snapshot's categorical fields
+EDUCATION_RANKS = {"Associate's": 1, "Bachelor's": 2, "Master's": 3, 'Doctorate': 4}
+LEADERSHIP_RANKS = {'None': 0, 'Limited': 1, 'Strong': 2}
+EXPERIENCE_PATTERN = re.compile(r'^(\d+) years')
+
+# Numeric columns a query can filter on, and how a clause value is read
+FIELDS = {
+    'score': lambda value: _number(value),
+    'experience': lambda value: _number(value),
+    'education': lambda value: EDUCATION_RANKS[_match_key(EDUCATION_RANKS, value)],
+    'leadership': lambda value: LEADERSHIP_RANKS[_match_key(LEADERSHIP_RANKS, value)]
+}
+COMPARISONS = {
+    '>=': np.greater_equal, '≥': np.greater_equal, '>': np.greater,
+    '<=': np.less_equal, '≤': np.less_equal, '<': np.less, '=': np.equal
+}
+CLAUSE_PATTERN = re.compile(r'^\s*(\w+)\s*(>=|<=|≥|≤|>|<|=)\s*(.+?)\s*$')
+CLAUSE_SEPARATOR = re.compile(r',|\band\b', re.I)
+
+# Deltas are folded into the per-skill posting blobs once this many pile up
+COMPACT_THRESHOLD = 100_000
+
+
+def _match_key(table, value):
+    """Find a table key case-insensitively, ignoring apostrophes"""
+    wanted = value.lower().replace("'", '')
+    for key in table:
+        if key.lower().replace("'", '') == wanted:
+            return key
+    raise ValueError(f"Unknown value {value!r}; expected one of {', '.join(table)}")
+
+
+def _number(value):
+    """Read a numeric filter value"""
+    try:
+        return float(value)
+    except ValueError:
+        raise ValueError(f"Expected a number, got {value!r}") from None
+
+
+def snapshot_fields(analysis):
+    """Return (terms, score, experience, education, leadership) for an analysis result"""
+    stats = analysis['hr_snapshot']['Quick Stats']
+    terms = {skill.lower() for skills in stats['Skills'].values() for skill in skills}
+    match = EXPERIENCE_PATTERN.match(stats['Experience'])
+    experience = float(match.group(1)) if match else np.nan
+    education = stats['Education']
+    education = EDUCATION_RANKS.get(education.get('level'), 0) if isinstance(education, dict) else 0
+    leadership = LEADERSHIP_RANKS.get(stats['Leadership Indicators'], 0)
+    return terms, float(analysis['overall_score']), experience, education, leadership
+
+
+def parse_query(query):
+    """
+    Split a query such as "python AND kubernetes, education >= Master's,
+    experience >= 5" into its terms and (field, comparison, value) filters.
+    Terms naming a taxonomy skill or alias become its canonical name, the
+    form skills are indexed under. Raises ValueError for a filter value
+    that cannot be read, naming the offending clause.
+    """
+    matcher = load_skill_matcher()
+    terms, filters = [], []
+    for clause in CLAUSE_SEPARATOR.split(query):
+        if not clause.strip():
+            continue
+        match = CLAUSE_PATTERN.match(clause)
+        if match and match.group(1).lower() in FIELDS:
+            field, operator, value = match.groups()
+            field = field.lower()
+            try:
+                filters.append((field, operator, FIELDS[field](value)))
+            except ValueError as e:
+                raise ValueError(f"{clause.strip()!r}: {e}") from None
+        else:
+            term = clause.strip().lower()
+            terms.append(matcher.canonical(term) or term)
+    return terms, filters
+
+
+class CandidateIndex:
+    """
+    On-disk inverted index over analyze_resume results.
+
+    SQLite holds the durable state: one row of numeric columns per resume,
+    each skill's postings as a sorted array blob, and a delta table of
+    postings added since the blobs were last compacted. Opening the index
+    loads it into NumPy arrays, so a query intersects posting arrays
+    (rarest term first) and masks numeric columns without touching disk.
+    Adds and removals write through to both. Safe to share between threads.
+    """
+    def __init__(self, path=DEFAULT_INDEX_PATH):
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS candidates (
+                doc_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                source TEXT UNIQUE NOT NULL,
+                score REAL NOT NULL,
+                experience REAL,
+                education INTEGER NOT NULL,
+                leadership INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS postings (
+                term TEXT PRIMARY KEY,
+                doc_ids BLOB NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS postings_delta (
+                term TEXT NOT NULL,
+                doc_id INTEGER NOT NULL,
+                PRIMARY KEY (term, doc_id)
+            ) WITHOUT ROWID;
+        """)
+        self.lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        rows = self.db.execute(
+            "SELECT doc_id, source, score, experience, education, leadership FROM candidates"
+        ).fetchall()
+        # AUTOINCREMENT never reuses the id of a removed resume, whose stale
+        # postings may still be on disk
+        sequence = self.db.execute("SELECT seq FROM sqlite_sequence WHERE name = 'candidates'").fetchone()
+        self.next_id = (sequence[0] if sequence else 0) + 1
+        self._allocate(max(self.next_id, 1024))
+        self.sources, self.ids = {}, {}
+        for doc_id, source, score, experience, education, leadership in rows:
+            self.sources[source] = doc_id
+            self.ids[doc_id] = source
+            self.alive[doc_id] = True
+            self.columns['score'][doc_id] = score
+            self.columns['experience'][doc_id] = np.nan if experience is None else experience
+            self.columns['education'][doc_id] = education
+            self.columns['leadership'][doc_id] = leadership
+
+        # Compacted postings plus the delta; delta ids are newer, so each
+        # term's array stays sorted after appending them
+        self.postings = {term: [np.frombuffer(blob, dtype=np.uint32)]
+                         for term, blob in self.db.execute("SELECT term, doc_ids FROM postings")}
+        delta = {}
+        for term, doc_id in self.db.execute("SELECT term, doc_id FROM postings_delta ORDER BY term, doc_id"):
+            delta.setdefault(term, []).append(doc_id)
+        self.delta_size = 0
+        for term, doc_ids in delta.items():
+            self.postings.setdefault(term, []).append(np.array(doc_ids, dtype=np.uint32))
+            self.delta_size += len(doc_ids)
+
+    def _allocate(self, size):
+        self.alive = np.zeros(size, dtype=bool)
+        self.columns = {
+            'score': np.zeros(size, dtype=np.float32),
+            'experience': np.full(size, np.nan, dtype=np.float32),
+            'education': np.zeros(size, dtype=np.int8),
+            'leadership': np.zeros(size, dtype=np.int8)
+        }
+
+    def _grow(self, size):
+        capacity = len(self.alive)
+        if size <= capacity:
+            return
+        alive, columns = self.alive, self.columns
+        self._allocate(max(size, capacity * 2))
+        self.alive[:capacity] = alive
+        for name, column in columns.items():
+            self.columns[name][:capacity] = column
+
+    def __len__(self):
+        return len(self.sources)
+
+    def __contains__(self, source):
+        return source in self.sources
+
+    def add(self, source, analysis):
+        """Index (or re-index) one analyze_resume result under a source name"""
+        self.add_many([(source, analysis)])
+
+    def add_many(self, items):
+        """Index many (source, analysis) pairs in one transaction"""
+        added = {}
+        with self.lock, self.db:
+            for source, analysis in items:
+                terms, score, experience, education, leadership = snapshot_fields(analysis)
+                self._remove(source)
+
+                # Ids only grow, which keeps appended postings sorted
+                doc_id = self.next_id
+                self.next_id += 1
+                self.db.execute(
+                    "INSERT INTO candidates (doc_id, source, score, experience, education, leadership) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (doc_id, source, score, None if np.isnan(experience) else experience,
+                     education, leadership)
+                )
+                self.db.executemany("INSERT INTO postings_delta (term, doc_id) VALUES (?, ?)",
+                                    [(term, doc_id) for term in terms])
+
+                self._grow(doc_id + 1)
+                self.sources[source] = doc_id
+                self.ids[doc_id] = source
+                self.alive[doc_id] = True
+                for name, value in zip(('score', 'experience', 'education', 'leadership'),
+                                       (score, experience, education, leadership)):
+                    self.columns[name][doc_id] = value
+                for term in terms:
+                    added.setdefault(term, []).append(doc_id)
+                self.delta_size += len(terms)
+
+            for term, doc_ids in added.items():
+                self.postings.setdefault(term, []).append(np.array(doc_ids, dtype=np.uint32))
+        if self.delta_size >= COMPACT_THRESHOLD:
+            self.compact()
+
+    def remove(self, source):
+        """Drop a resume from the index; returns whether it was present"""
+        with self.lock, self.db:
+            return self._remove(source)
+
+    def _remove(self, source):
+        doc_id = self.sources.pop(source, None)
+        if doc_id is None:
+            return False
+        del self.ids[doc_id]
+        # Postings keep the id until the next compaction; the alive mask hides it
+        self.alive[doc_id] = False
+        self.db.execute("DELETE FROM candidates WHERE doc_id = ?", (doc_id,))
+        return True
+
+    def compact(self):
+        """Fold delta postings into the per-skill blobs and drop removed ids"""
+        with self.lock, self.db:
+            postings = {}
+            for term, parts in self.postings.items():
+                doc_ids = np.concatenate(parts) if len(parts) > 1 else parts[0]
+                doc_ids = doc_ids[self.alive[doc_ids]]
+                if len(doc_ids):
+                    postings[term] = [doc_ids]
+            self.db.execute("DELETE FROM postings")
+            self.db.execute("DELETE FROM postings_delta")
+            self.db.executemany("INSERT INTO postings (term, doc_ids) VALUES (?, ?)",
+                                [(term, parts[0].tobytes()) for term, parts in postings.items()])
+            self.postings = postings
+            self.delta_size = 0
+
+    def _posting(self, term):
+        parts = self.postings.get(term)
+        if not parts:
+            return np.empty(0, dtype=np.uint32)
+        if len(parts) > 1:
+            # Merge appended ids so later queries read one array
+            parts[:] = [np.concatenate(parts)]
+        return parts[0]
+
+    def search(self, query='', limit=50):
+        """
+        Return the sources matching a query, highest overall score first.
+
+        Terms (skills, by name or alias) are ANDed together; filters
+        compare the score, experience (years), education and leadership
+        columns. Only taxonomy skills are indexed, so a term that is not a
+        skill matches nothing even if the word appears in a resume.
+        """
+        terms, filters = parse_query(query) if isinstance(query, str) else query
+        with self.lock:
+            if terms:
+                postings = sorted((self._posting(term) for term in terms), key=len)
+                matches = postings[0]
+                for posting in postings[1:]:
+                    if not len(matches):
+                        break
+                    found = np.searchsorted(posting, matches)
+                    found[found == len(posting)] = 0
+                    matches = matches[posting[found] == matches] if len(posting) else matches[:0]
+                matches = matches[self.alive[matches]]
+            else:
+                matches = np.flatnonzero(self.alive[:self.next_id])
+
+            for field, operator, value in filters:
+                # Comparisons with a missing (NaN) experience are false
+                matches = matches[COMPARISONS[operator](self.columns[field][matches], value)]
+
+            order = np.argsort(-self.columns['score'][matches], kind='stable')[:limit]
+            hits = matches[order]
+            return [{'source': self.ids[doc_id], 'score': round(score, 1)}
+                    for doc_id, score in zip(hits.tolist(), self.columns['score'][hits].tolist())]
+
+    def close(self):
+        self.db.close()
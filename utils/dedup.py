@@ -0,0 +1,119 @@
+import re
+import threading
+import zlib
+from itertools import count
+
+import numpy as np
+
+# 128 hash functions split into 16 bands of 8 rows. Two resumes are only
+# compared if some band matches exactly: ~95% of pairs at Jaccard 0.8 are,
+# ~6% at 0.5 and ~1% at 0.4
+NUM_PERM = 128
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+# Estimated Jaccard similarity at which a resume counts as a near-duplicate
+DUPLICATE_THRESHOLD = 0.8
+SHINGLE_SIZE = 3
+# Texts with fewer distinct shingles (blank pages, scans without a text
+# layer, a few stray words) get no signature: their few shingles would match
+# each other without saying anything about the candidate
+MIN_SHINGLES = 10
+
+WORD_PATTERN = re.compile(r'\w+')
+MERSENNE_PRIME = (1 << 31) - 1
+_rng = np.random.RandomState(1)
+PERM_A = _rng.randint(1, MERSENNE_PRIME, size=NUM_PERM).astype(np.uint64)
+PERM_B = _rng.randint(0, MERSENNE_PRIME, size=NUM_PERM).astype(np.uint64)
+
+
+def shingle_hashes(text, size=SHINGLE_SIZE):
+    """Return hashes below MERSENNE_PRIME of the text's overlapping word n-grams"""
+    words = WORD_PATTERN.findall(text.lower())
+    shingles = {' '.join(words[i:i + size]) for i in range(len(words) - size + 1)}
+    hashes = np.fromiter((zlib.crc32(s.encode()) for s in shingles), dtype=np.uint64, count=len(shingles))
+    return hashes % MERSENNE_PRIME
+
+
+def minhash(text):
+    """Return the text's MinHash signature, NUM_PERM uint32 values, or None if it is too short"""
+    hashes = shingle_hashes(text)
+    if len(hashes) < MIN_SHINGLES:
+        return None
+    # (a * h + b) mod p for every hash function at once; a, b and h are all
+    # below p = 2**31 - 1, so the arithmetic fits in 64 bits
+    permuted = (np.outer(hashes, PERM_A) + PERM_B) % MERSENNE_PRIME
+    return permuted.min(axis=0).astype(np.uint32)
+
+
+def similarity(signature, other):
+    """Estimate the Jaccard similarity of two resumes from their signatures"""
+    return float(np.mean(signature == other))
+
+
+class DuplicateIndex:
+    """
+    LSH index of MinHash signatures for near-duplicate detection.
+
+    Each resume costs one fixed-size signature plus one bucket entry per
+    band. A lookup hashes the signature's bands and compares only against
+    resumes sharing a bucket, so inserts stay fast as the index grows.
+    check() is safe to call from several threads.
+    """
+    def __init__(self, threshold=DUPLICATE_THRESHOLD):
+        self.threshold = threshold
+        self.signatures = {}
+        self.buckets = [{} for _ in range(BANDS)]
+        # Insertion sequence per key, so equally similar matches resolve to
+        # the earliest indexed resume
+        self.sequence = {}
+        self._counter = count()
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.signatures)
+
+    def _band_keys(self, signature):
+        return [signature[band * ROWS:(band + 1) * ROWS].tobytes() for band in range(BANDS)]
+
+    def query(self, signature):
+        """Return (key, similarity) for indexed near-duplicates, most similar (then earliest) first"""
+        candidates = set()
+        for bucket, band_key in zip(self.buckets, self._band_keys(signature)):
+            candidates.update(bucket.get(band_key, ()))
+        matches = [(key, similarity(signature, self.signatures[key])) for key in candidates]
+        return sorted((match for match in matches if match[1] >= self.threshold),
+                      key=lambda match: (-match[1], self.sequence[match[0]]))
+
+    def add(self, key, signature):
+        """Index a signature under key"""
+        if key in self.signatures:
+            self.remove(key)
+        self.signatures[key] = signature
+        self.sequence[key] = next(self._counter)
+        for bucket, band_key in zip(self.buckets, self._band_keys(signature)):
+            bucket.setdefault(band_key, []).append(key)
+
+    def remove(self, key):
+        """Drop key from the index"""
+        signature = self.signatures.pop(key)
+        del self.sequence[key]
+        for bucket, band_key in zip(self.buckets, self._band_keys(signature)):
+            keys = bucket[band_key]
+            keys.remove(key)
+            if not keys:
+                del bucket[band_key]
+
+    def check(self, key, text=None, signature=None):
+        """
+        Return (original key, similarity) if the resume is a near-duplicate
+        of one already indexed, else None; either way it is then indexed.
+        Texts too short to fingerprint are neither matched nor indexed.
+        """
+        if signature is None and text is not None:
+            signature = minhash(text)
+        if signature is None:
+            return None
+        with self.lock:
+            matches = [match for match in self.query(signature) if match[0] != key]
+            self.add(key, signature)
+        return matches[0] if matches else None
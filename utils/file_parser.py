@@ -1,26 +1,248 @@
 import PyPDF2
-from docx import Document
 import io
+import multiprocessing
+import os
+import re
+import zipfile
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from xml.etree.ElementTree import iterparse
 
-def parse_resume(uploaded_file):
+from utils import metrics
+
+# Upper bounds on what a single upload may cost to parse. Uploads over
+# max_bytes are rejected; text past max_pages or max_chars is cut off.
+ParseLimits = namedtuple('ParseLimits', ['max_bytes', 'max_pages', 'max_chars'])
+DEFAULT_LIMITS = ParseLimits(
+    max_bytes=int(os.environ.get('ATS_MAX_UPLOAD_BYTES', 10 * 1024 * 1024)),
+    max_pages=int(os.environ.get('ATS_MAX_PAGES', 50)),
+    max_chars=int(os.environ.get('ATS_MAX_CHARS', 200_000))
+)
+
+# Documents with at least this many pages are split across processes when
+# parse_resume is given workers > 1
+PARALLEL_PAGE_THRESHOLD = 16
+
+
+class ResumeLimitError(ValueError):
+    """Raised when an upload exceeds the configured parse limits"""
+
+
+class PyPDF2Backend:
+    """
+    PDF text extraction through PyPDF2.
+
+    A backend opens a PDF from a binary stream, reports its page count with
+    len() and extracts one page's text at a time with page_text().
+    """
+    def __init__(self, stream):
+        self.reader = PyPDF2.PdfReader(stream)
+
+    def __len__(self):
+        return len(self.reader.pages)
+
+    def page_text(self, index):
+        return self.reader.pages[index].extract_text() or ""
+
+
+class PypdfBackend(PyPDF2Backend):
+    """PDF text extraction through pypdf, PyPDF2's maintained successor (optional)"""
+    def __init__(self, stream):
+        import pypdf
+
+        self.reader = pypdf.PdfReader(stream)
+
+
+class PdfminerBackend:
+    """PDF text extraction through pdfminer.six (optional)"""
+    def __init__(self, stream):
+        from pdfminer.pdfdocument import PDFDocument
+        from pdfminer.pdfpage import PDFPage
+        from pdfminer.pdfparser import PDFParser
+
+        self.pages = list(PDFPage.create_pages(PDFDocument(PDFParser(stream))))
+
+    def __len__(self):
+        return len(self.pages)
+
+    def page_text(self, index):
+        from pdfminer.converter import TextConverter
+        from pdfminer.layout import LAParams
+        from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+
+        output = io.StringIO()
+        manager = PDFResourceManager()
+        with TextConverter(manager, output, laparams=LAParams()) as device:
+            PDFPageInterpreter(manager, device).process_page(self.pages[index])
+        return output.getvalue()
+
+
+PDF_BACKENDS = {
+    'pypdf2': PyPDF2Backend,
+    'pypdf': PypdfBackend,
+    'pdfminer': PdfminerBackend
+}
+DEFAULT_PDF_BACKEND = os.environ.get('ATS_PDF_BACKEND', 'pypdf2')
+
+
+def iter_pdf_pages(document, max_pages=None):
+    """Yield the text of each page of an opened PDF backend, stopping after max_pages"""
+    page_count = len(document) if max_pages is None else min(len(document), max_pages)
+    for index in range(page_count):
+        yield document.page_text(index)
+
+
+def _extract_page_range(job):
+    """Extract pages [start, stop) of PDF bytes in a worker process"""
+    data, backend, start, stop = job
+    document = PDF_BACKENDS[backend](io.BytesIO(data))
+    return [document.page_text(index) for index in range(start, stop)]
+
+
+def iter_pdf_pages_parallel(data, page_count, backend=DEFAULT_PDF_BACKEND, workers=2):
+    """
+    Yield the text of the first page_count pages of PDF bytes, extracting
+    contiguous page ranges in separate processes. Pages come back in order.
+    """
+    step = -(-page_count // workers)
+    jobs = [(data, backend, start, min(start + step, page_count))
+            for start in range(0, page_count, step)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for texts in executor.map(_extract_page_range, jobs):
+            yield from texts
+
+
+# WordprocessingML tags, in ElementTree's {namespace}name form
+W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+PARAGRAPH_TAG = W_NS + 'p'
+TEXT_TAG = W_NS + 't'
+TAB_TAGS = {W_NS + 'tab', W_NS + 'ptab'}
+BREAK_TAGS = {W_NS + 'br', W_NS + 'cr'}
+# Top-level blocks and the part roots that hold them
+BLOCK_TAGS = {PARAGRAPH_TAG, W_NS + 'tbl', W_NS + 'sdt'}
+CONTAINER_TAGS = {W_NS + 'body', W_NS + 'hdr', W_NS + 'ftr'}
+# Text boxes are stored twice: as DrawingML under mc:Choice and as a VML
+# copy under mc:Fallback. Only the first is read.
+FALLBACK_TAG = '{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback'
+HEADER_PART_PATTERN = re.compile(r'word/header\d*\.xml')
+FOOTER_PART_PATTERN = re.compile(r'word/footer\d*\.xml')
+
+
+def _paragraph_text(paragraph):
+    pieces = []
+    for node in paragraph.iter():
+        if node.tag == TEXT_TAG:
+            pieces.append(node.text or '')
+        elif node.tag in TAB_TAGS:
+            pieces.append('\t')
+        elif node.tag in BREAK_TAGS:
+            pieces.append('\n')
+    return ''.join(pieces)
+
+
+def iter_docx_part(archive, name):
+    """
+    Yield the text of each paragraph in one part of a DOCX archive.
+
+    The XML is parsed incrementally from the zip member and each top-level
+    paragraph or table is dropped from the tree once read, so memory stays
+    flat however long the document is. Paragraphs inside tables and text
+    boxes are included.
+    """
+    stack, skipping = [], 0
+    with archive.open(name) as part:
+        for event, elem in iterparse(part, events=('start', 'end')):
+            if event == 'start':
+                stack.append(elem)
+                skipping += elem.tag == FALLBACK_TAG
+                continue
+
+            stack.pop()
+            if elem.tag == FALLBACK_TAG:
+                skipping -= 1
+            elif elem.tag == PARAGRAPH_TAG:
+                if not skipping:
+                    yield _paragraph_text(elem)
+                # Nested text-box paragraphs end first; clearing them keeps
+                # their text out of the enclosing paragraph
+                elem.clear()
+            if elem.tag in BLOCK_TAGS and stack and stack[-1].tag in CONTAINER_TAGS:
+                stack[-1].remove(elem)
+
+
+def iter_docx_paragraphs(stream):
+    """Yield paragraph text from a DOCX's headers, body and footers, in that order"""
+    with zipfile.ZipFile(stream) as archive:
+        names = archive.namelist()
+        headers = sorted(n for n in names if HEADER_PART_PATTERN.fullmatch(n))
+        footers = sorted(n for n in names if FOOTER_PART_PATTERN.fullmatch(n))
+        # The same header is often repeated for first, odd and even pages
+        seen = set()
+        for name in headers:
+            for text in iter_docx_part(archive, name):
+                if text and text not in seen:
+                    seen.add(text)
+                    yield text
+        yield from iter_docx_part(archive, 'word/document.xml')
+        seen.clear()
+        for name in footers:
+            for text in iter_docx_part(archive, name):
+                if text and text not in seen:
+                    seen.add(text)
+                    yield text
+
+
+def _collect(chunks, max_chars):
+    """Join text chunks in linear time, stopping once max_chars is reached"""
+    parts, total = [], 0
+    for chunk in chunks:
+        parts.append(chunk)
+        total += len(chunk)
+        if total >= max_chars:
+            break
+    return ''.join(parts)[:max_chars]
+
+
+def _read_limited(uploaded_file, max_bytes):
+    """Read an upload, refusing anything over max_bytes without reading it all"""
+    data = uploaded_file.read(max_bytes + 1)
+    if len(data) > max_bytes:
+        raise ResumeLimitError(f"File exceeds the {max_bytes:,} byte upload limit")
+    return data
+
+
+def _upload_size(uploaded_file, *args, **kwargs):
+    return uploaded_file.getbuffer().nbytes if hasattr(uploaded_file, 'getbuffer') else None
+
+
+@metrics.timed('parse_resume', size=_upload_size)
+def parse_resume(uploaded_file, limits=DEFAULT_LIMITS, pdf_backend=DEFAULT_PDF_BACKEND, workers=1):
     """
     Parse uploaded resume file and extract text content
     """
     file_type = uploaded_file.name.split('.')[-1].lower()
     content = ""
-    
+
     try:
         if file_type == 'pdf':
-            pdf_reader = PyPDF2.PdfReader(uploaded_file)
-            for page in pdf_reader.pages:
-                content += page.extract_text()
-                
+            data = _read_limited(uploaded_file, limits.max_bytes)
+            document = PDF_BACKENDS[pdf_backend](io.BytesIO(data))
+            page_count = min(len(document), limits.max_pages)
+            # Pool workers are daemonic and cannot start processes of their own
+            if workers > 1 and page_count >= PARALLEL_PAGE_THRESHOLD and \
+                    not multiprocessing.current_process().daemon:
+                pages = iter_pdf_pages_parallel(data, page_count, pdf_backend, workers)
+            else:
+                pages = iter_pdf_pages(document, page_count)
+            content = _collect(pages, limits.max_chars)
+
         elif file_type in ['doc', 'docx']:
-            doc = Document(io.BytesIO(uploaded_file.read()))
-            for para in doc.paragraphs:
-                content += para.text + "\n"
-                
+            paragraphs = iter_docx_paragraphs(io.BytesIO(_read_limited(uploaded_file, limits.max_bytes)))
+            content = _collect((text + "\n" for text in paragraphs), limits.max_chars)
+
         return content.strip(), file_type
-        
+
+    except ResumeLimitError:
+        raise
     except Exception as e:
         raise Exception(f"Error parsing {file_type.upper()} file: {str(e)}")
@@ -0,0 +1,111 @@
+import numpy as np
+
+# Marker sklearn uses for a leaf's child indices
+TREE_LEAF = -1
+
+
+class FlatForest:
+    """
+    Array-backed evaluator for a fitted RandomForestClassifier.
+
+    All trees are flattened into shared contiguous arrays (feature index,
+    threshold, left/right child and per-leaf class probabilities), and a
+    batch is evaluated by stepping every (sample, tree) pair down one level
+    per iteration with vectorized NumPy operations. predict_proba follows
+    sklearn's arithmetic step for step, so probabilities are bit-identical.
+    """
+    def __init__(self, feature, threshold, left, right, value, roots, classes, n_features):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.value = value
+        self.roots = roots
+        # Interleaved (left, right) child pairs so a step is a single lookup;
+        # leaves point back at themselves
+        nodes = np.arange(len(left), dtype=np.int32)
+        self.children = np.column_stack([np.where(left == TREE_LEAF, nodes, left),
+                                         np.where(right == TREE_LEAF, nodes, right)]).ravel()
+        self.classes_ = classes
+        self.n_features_in_ = n_features
+
+    @classmethod
+    def from_sklearn(cls, forest):
+        """Flatten the trees of a fitted sklearn forest"""
+        if forest.n_outputs_ != 1:
+            raise ValueError("FlatForest supports single-output forests only")
+
+        features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+        offset = 0
+        for estimator in forest.estimators_:
+            tree = estimator.tree_
+            left = tree.children_left.astype(np.int32)
+            right = tree.children_right.astype(np.int32)
+            # Child indices become global; leaves keep the TREE_LEAF marker
+            # Leaves carry no split feature; point them at feature 0 so every
+            # node can be evaluated uniformly
+            features.append(np.where(left == TREE_LEAF, 0, tree.feature).astype(np.int32))
+            thresholds.append(tree.threshold)
+            lefts.append(np.where(left == TREE_LEAF, TREE_LEAF, left + offset).astype(np.int32))
+            rights.append(np.where(right == TREE_LEAF, TREE_LEAF, right + offset).astype(np.int32))
+
+            # Same normalization as DecisionTreeClassifier.predict_proba
+            proba = tree.value[:, 0, :forest.n_classes_]
+            normalizer = proba.sum(axis=1)[:, np.newaxis]
+            normalizer[normalizer == 0.0] = 1.0
+            values.append(proba / normalizer)
+
+            roots.append(offset)
+            offset += tree.node_count
+
+        return cls(
+            feature=np.concatenate(features),
+            threshold=np.ascontiguousarray(np.concatenate(thresholds), dtype=np.float64),
+            left=np.concatenate(lefts),
+            right=np.concatenate(rights),
+            value=np.ascontiguousarray(np.concatenate(values), dtype=np.float64),
+            roots=np.array(roots, dtype=np.int32),
+            classes=np.asarray(forest.classes_),
+            n_features=forest.n_features_in_
+        )
+
+    @property
+    def n_trees(self):
+        return len(self.roots)
+
+    def apply(self, X):
+        """Return the leaf index reached in every tree, shape (n_samples, n_trees)"""
+        # sklearn evaluates trees on float32 inputs
+        if hasattr(X, 'toarray'):
+            X = X.astype(np.float32).toarray()
+        else:
+            X = np.asarray(X, dtype=np.float32)
+        n_samples, n_trees = X.shape[0], self.n_trees
+
+        # One entry per (sample, tree) pair; pair k is sample k // n_trees.
+        # Each step reads the split feature of every unfinished pair from the
+        # flattened input and moves it to the chosen child. Leaves are their
+        # own children, so a pair is finished once a step leaves it in place.
+        values = X.ravel()
+        offsets = np.repeat(np.arange(n_samples) * X.shape[1], n_trees)
+        nodes = np.tile(self.roots, n_samples)
+        active = np.arange(nodes.size)
+        while active.size:
+            current = nodes[active]
+            go_right = values[offsets[active] + self.feature[current]] > self.threshold[current]
+            following = self.children[2 * current + go_right]
+            moved = following != current
+            active = active[moved]
+            nodes[active] = following[moved]
+
+        return nodes.reshape(n_samples, n_trees)
+
+    def predict_proba(self, X):
+        """Class probabilities averaged over the trees, as sklearn computes them"""
+        leaves = self.apply(X)
+        proba = np.zeros((leaves.shape[0], self.value.shape[1]), dtype=np.float64)
+        # Accumulate tree by tree in estimator order to match sklearn's sums
+        for tree in range(self.n_trees):
+            proba += self.value[leaves[:, tree]]
+        proba /= self.n_trees
+        return proba
@@ -0,0 +1,104 @@
+import os
+
+import numpy as np
+
+from utils.ml_scorer import PACKAGE_ROOT
+from utils.model_artifact import ModelArtifact, write_artifact
+
+CORPUS_PATH = os.environ.get('ATS_CORPUS_PATH', os.path.join(PACKAGE_ROOT, 'models', 'corpus.atsm'))
+
+# Matched and missing terms reported per ranked resume
+MAX_TERMS = 15
+
+
+class JobMatcher:
+    """
+    Ranks a corpus of resumes against job descriptions.
+
+    Resumes are embedded once as L2-normalized TF-IDF rows, configured like
+    MLScorer's vectorizer but without its feature cap, and kept as a CSC
+    matrix. A job description touches only the columns of its own terms, so
+    ranking is one sparse product over those columns plus a partial sort,
+    whatever the corpus size.
+    """
+    def __init__(self, min_df=1, max_df=1.0):
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
+        self.vectorizer = TfidfVectorizer(
+            stop_words='english',
+            ngram_range=(1, 2),
+            sublinear_tf=True,
+            min_df=min_df,
+            max_df=max_df,
+            dtype=np.float32
+        )
+        self.ids = []
+        self.matrix = None
+        self.terms = None
+
+    def fit(self, ids, texts):
+        """Build the corpus matrix from resume ids and their texts"""
+        self.ids = list(ids)
+        self.matrix = self.vectorizer.fit_transform(texts).tocsc()
+        # Terms pruned by min_df/max_df are only kept for introspection
+        self.vectorizer.stop_words_ = None
+        self.terms = self.vectorizer.get_feature_names_out()
+        return self
+
+    def rank(self, job_description, k=10):
+        """
+        Return up to k resumes most similar to a job description, best
+        first; resumes sharing no terms with it are left out.
+
+        Each result holds the resume id, its cosine similarity score (0-100)
+        and the description's terms the resume matches or misses, most
+        heavily weighted first.
+        """
+        query = self.vectorizer.transform([job_description])
+        if query.nnz == 0 or not self.ids:
+            return []
+        # Most distinctive description terms first
+        order = np.argsort(-query.data, kind='stable')
+        columns, weights = query.indices[order], query.data[order]
+
+        # Only the description's columns take part in the product
+        hits = self.matrix[:, columns]
+        scores = hits @ weights
+
+        k = min(k, len(self.ids))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.lexsort((top, -scores[top]))]
+
+        hits = hits.tocsr()
+        results = []
+        for row in top:
+            if scores[row] <= 0:
+                break
+            present = np.zeros(len(columns), dtype=bool)
+            present[hits.indices[hits.indptr[row]:hits.indptr[row + 1]]] = True
+            results.append({
+                'id': self.ids[row],
+                'score': round(float(scores[row]) * 100, 1),
+                'matched_terms': self.terms[columns[present]][:MAX_TERMS].tolist(),
+                'missing_terms': self.terms[columns[~present]][:MAX_TERMS].tolist()
+            })
+        return results
+
+    def save(self, path=CORPUS_PATH):
+        """Write the fitted corpus as a memory-mappable artifact"""
+        write_artifact(path, {
+            'vectorizer': self.vectorizer,
+            'matrix': self.matrix,
+            'ids': self.ids
+        }, metadata={'kind': 'job_corpus', 'resumes': len(self.ids)})
+
+    @classmethod
+    def load(cls, path=CORPUS_PATH):
+        """Load a corpus written by save; the matrix stays mapped from disk"""
+        artifact = ModelArtifact(path)
+        matcher = cls.__new__(cls)
+        matcher.vectorizer = artifact.load('vectorizer')
+        matcher.matrix = artifact.load('matrix')
+        matcher.ids = artifact.load('ids')
+        matcher.terms = matcher.vectorizer.get_feature_names_out()
+        return matcher
@@ -0,0 +1,193 @@
+import os
+import tempfile
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+# Process-wide stage metrics (ATS_METRICS=1), written in Prometheus text
+# format to ATS_METRICS_FILE after each analysis when that is set
+ENABLED = os.environ.get('ATS_METRICS', '0') == '1'
+METRICS_FILE = os.environ.get('ATS_METRICS_FILE')
+# Attach a per-request "timings" block to analysis results (ATS_TIMINGS=1)
+TIMINGS_ENABLED = os.environ.get('ATS_TIMINGS', '0') == '1'
+
+# Histogram bucket upper bounds, in seconds
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Observations of the request being collected, if any
+_observations = ContextVar('observations', default=None)
+
+
+class StageStats:
+    """Running totals and a latency histogram for one pipeline stage"""
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.seconds = 0.0
+        self.input_size = 0
+        self.buckets = [0] * (len(BUCKETS) + 1)
+
+    def observe(self, seconds, size, error):
+        self.count += 1
+        self.errors += error
+        self.seconds += seconds
+        self.input_size += size or 0
+        self.buckets[bisect_left(BUCKETS, seconds)] += 1
+
+
+_stats = {}
+_lock = threading.Lock()
+
+
+def enable(enabled=True):
+    """Turn process-wide stage metrics on or off"""
+    global ENABLED
+    ENABLED = enabled
+
+
+def record(stage, seconds, size=None, error=False):
+    """Add one observation of a stage to the process-wide metrics"""
+    with _lock:
+        stats = _stats.get(stage)
+        if stats is None:
+            stats = _stats[stage] = StageStats()
+        stats.observe(seconds, size, error)
+
+
+def record_all(observations):
+    """Fold observations collected in another process into this one's metrics"""
+    if ENABLED:
+        for observation in observations:
+            record(*observation)
+
+
+class _Stage:
+    __slots__ = ('name', 'size', 'start')
+
+    def __init__(self, name, size):
+        self.name = name
+        self.size = size
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        seconds = time.perf_counter() - self.start
+        error = exc_type is not None
+        if ENABLED:
+            record(self.name, seconds, self.size, error)
+        observations = _observations.get()
+        if observations is not None:
+            observations.append((self.name, seconds, self.size, error))
+        return False
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+def stage(name, size=None):
+    """Context manager timing a block as one pipeline stage; a no-op when nothing is recording"""
+    if not ENABLED and _observations.get() is None:
+        return _NULL_STAGE
+    return _Stage(name, size)
+
+
+def timed(name, size=None):
+    """
+    Decorator timing every call of a function as a pipeline stage.
+
+    size, if given, is called with the function's arguments and returns the
+    input size to record (bytes or characters).
+    """
+    def decorate(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not ENABLED and _observations.get() is None:
+                return func(*args, **kwargs)
+            with _Stage(name, size(*args, **kwargs) if size else None):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+@contextmanager
+def collect():
+    """Collect the (stage, seconds, size, error) observations made inside the block"""
+    observations = []
+    token = _observations.set(observations)
+    try:
+        yield observations
+    finally:
+        _observations.reset(token)
+
+
+def current_observations():
+    """Return the list being collected into, or None"""
+    return _observations.get()
+
+
+def summarize(observations):
+    """Total milliseconds per stage, for an analysis result's "timings" block"""
+    timings = {}
+    for name, seconds, _, _ in observations:
+        timings[name] = timings.get(name, 0.0) + seconds * 1000
+    return {name: round(ms, 3) for name, ms in timings.items()}
+
+
+def render_prometheus():
+    """Return the process-wide stage metrics in Prometheus text exposition format"""
+    lines = [
+        '# HELP ats_stage_duration_seconds Time spent in each analysis pipeline stage.',
+        '# TYPE ats_stage_duration_seconds histogram'
+    ]
+    with _lock:
+        stats = sorted(_stats.items())
+        for name, stage_stats in stats:
+            cumulative = 0
+            for bound, count in zip(BUCKETS, stage_stats.buckets):
+                cumulative += count
+                lines.append(f'ats_stage_duration_seconds_bucket{{stage="{name}",le="{bound}"}} {cumulative}')
+            lines.append(f'ats_stage_duration_seconds_bucket{{stage="{name}",le="+Inf"}} {stage_stats.count}')
+            lines.append(f'ats_stage_duration_seconds_sum{{stage="{name}"}} {stage_stats.seconds:.6f}')
+            lines.append(f'ats_stage_duration_seconds_count{{stage="{name}"}} {stage_stats.count}')
+
+        lines.append('# HELP ats_stage_errors_total Calls of each stage that raised.')
+        lines.append('# TYPE ats_stage_errors_total counter')
+        lines.extend(f'ats_stage_errors_total{{stage="{name}"}} {s.errors}' for name, s in stats)
+        lines.append('# HELP ats_stage_input_size_total Input bytes or characters processed by each stage.')
+        lines.append('# TYPE ats_stage_input_size_total counter')
+        lines.extend(f'ats_stage_input_size_total{{stage="{name}"}} {s.input_size}' for name, s in stats)
+    return '\n'.join(lines) + '\n'
+
+
+def write_prometheus(path=METRICS_FILE):
+    """Atomically write the metrics to a file, e.g. for node_exporter's textfile collector"""
+    if not path:
+        return
+    # A temporary file of its own per call, so concurrent writers (upload
+    # threads, or several processes sharing one file) never replace each
+    # other's half-written output
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(render_prometheus())
+        # mkstemp creates the file owner-only; collectors run as other users
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
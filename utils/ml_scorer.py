@@ -1,22 +1,125 @@
-import nltk
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.preprocessing import MinMaxScaler
 import pickle
 import os
+import re
+import time
+from functools import lru_cache
 
-# Download all required NLTK data
-try:
-    nltk.download('punkt', quiet=True)
-    nltk.download('averaged_perceptron_tagger', quiet=True)
-    nltk.download('stopwords', quiet=True)
-    nltk.download('punkt_tab', quiet=True)
-except Exception as e:
-    print(f"Warning: Some NLTK resources couldn't be downloaded: {str(e)}")
+from utils import metrics
+from utils.forest_engine import FlatForest
+from utils.model_artifact import ModelArtifact, write_artifact
+
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODEL_PATH = os.environ.get('ATS_MODEL_PATH', os.path.join(PACKAGE_ROOT, 'models', 'scorer.atsm'))
+
+# NLTK corpora are read from a pre-provisioned directory and never downloaded
+# at runtime; run `python cli.py nltk-data` once when building the image
+NLTK_DATA_DIR = os.environ.get(
+    'ATS_NLTK_DATA',
+    os.path.join(PACKAGE_ROOT, 'nltk_data')
+)
+NLTK_RESOURCES = {
+    'punkt_tab': 'tokenizers/punkt_tab',
+    'averaged_perceptron_tagger_eng': 'taggers/averaged_perceptron_tagger_eng',
+    'stopwords': 'corpora/stopwords'
+}
+
+def download_nltk_data(path=NLTK_DATA_DIR):
+    """
+    Fetch the NLTK corpora the scorer needs into path (provisioning step only).
+    Returns the names of resources that could not be downloaded.
+    """
+    import nltk
+
+    os.makedirs(path, exist_ok=True)
+    return [name for name in NLTK_RESOURCES
+            if not nltk.download(name, download_dir=path, quiet=True)]
+
+# Order of the statistical features in the scaler's input
+STAT_FEATURES = ('word_count', 'avg_word_length', 'noun_count', 'verb_count', 'number_count')
+
+@lru_cache(maxsize=1)
+def load_nltk():
+    """
+    Import NLTK against the local data directory.
+
+    Returns the nltk module, or None if any required resource is missing,
+    in which case the scorer uses its fallback features.
+    """
+    import nltk
+
+    if NLTK_DATA_DIR not in nltk.data.path:
+        nltk.data.path.insert(0, NLTK_DATA_DIR)
+    missing = []
+    for name, resource in NLTK_RESOURCES.items():
+        try:
+            nltk.data.find(resource)
+        except LookupError:
+            missing.append(name)
+    if missing:
+        print(f"Warning: NLTK resources not found in {NLTK_DATA_DIR}: {', '.join(missing)}")
+        return None
+    return nltk
+
+# Preprocessing mode: 'full' runs NLTK's tokenizer and perceptron tagger,
+# 'fast' uses FAST_TOKEN_PATTERN and suffix rules
+DEFAULT_PREPROCESSING = os.environ.get('ATS_ML_PREPROCESSING', 'full')
+
+# Scorer used by the analyzer: 'forest' (MLScorer) or 'online' (OnlineScorer)
+DEFAULT_SCORER = os.environ.get('ATS_ML_SCORER', 'forest')
+
+# Inference backend for loaded artifacts: 'sklearn' unpickles the
+# RandomForestClassifier, 'flat' evaluates the forest's memory-mapped arrays
+# with FlatForest (same probabilities, less per-call overhead)
+DEFAULT_BACKEND = os.environ.get('ATS_ML_BACKEND', 'sklearn')
+
+# Approximates NLTK's Treebank tokenizer on lowercased text: contractions
+# split off, hyphenated and dotted words kept whole, punctuation separate
+FAST_TOKEN_PATTERN = re.compile(
+    r"\w+?(?=n't\b)|n't\b|'(?:s|re|ve|ll|d|m)\b|\w+(?:[-.]\w+)*|[^\w\s]"
+)
+VERB_SUFFIXES = ('ed', 'ing', 'ize', 'ise', 'ify')
+ADJECTIVE_SUFFIXES = ('ly', 'al', 'ive', 'ous', 'ful', 'able', 'ible', 'ic', 'less')
+
+# NLTK's English stopword list, bundled so both modes filter the same words
+# whether or not NLTK data is installed
+STOPWORDS_PATH = os.path.join(PACKAGE_ROOT, 'assets', 'stopwords_en.txt')
+
+@lru_cache(maxsize=1)
+def load_stopwords():
+    """Return the English stopword set, built once per process"""
+    with open(STOPWORDS_PATH, encoding='utf-8') as f:
+        return frozenset(line.strip() for line in f if line.strip())
+
+# Fast mode reads no installed data, so a fast-mode model scores the same
+# text the same way on every machine
+@lru_cache(maxsize=100_000)
+def fast_pos_tag(token):
+    """Approximate a token's Penn Treebank tag from its form alone"""
+    if not token[0].isalpha():
+        return 'CD' if token[0].isdigit() else token
+    if len(token) > 4 and token.endswith(VERB_SUFFIXES):
+        return 'VB'
+    if len(token) > 4 and token.endswith(ADJECTIVE_SUFFIXES):
+        return 'JJ'
+    return 'NN'
 
 class MLScorer:
-    def __init__(self):
+    kind = 'forest'
+    model_path = MODEL_PATH
+
+    def __init__(self, preprocessing=DEFAULT_PREPROCESSING, backend=DEFAULT_BACKEND):
+        self.preprocessing = preprocessing
+        self.backend = backend
+        self.metadata = {}
+        self._init_model()
+
+    def _init_model(self):
+        """Build the untrained vectorizer, model and scaler"""
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from sklearn.ensemble import RandomForestClassifier
+        from sklearn.preprocessing import MinMaxScaler
+
         self.vectorizer = TfidfVectorizer(
             max_features=1000,
             stop_words='english',
@@ -31,18 +134,27 @@ class MLScorer:
     def preprocess_text(self, text):
         """Preprocess resume text for ML analysis"""
         try:
-            # Tokenize
-            tokens = nltk.word_tokenize(text.lower())
-            # Remove stopwords
-            stop_words = set(nltk.corpus.stopwords.words('english'))
-            tokens = [t for t in tokens if t not in stop_words]
-            # Get parts of speech
-            pos_tags = nltk.pos_tag(tokens)
+            if self.preprocessing == 'fast':
+                stop_words = load_stopwords()
+                tokens = [t for t in FAST_TOKEN_PATTERN.findall(text.lower()) if t not in stop_words]
+                pos_tags = [(t, fast_pos_tag(t)) for t in tokens]
+            else:
+                nltk = load_nltk()
+                if nltk is None:
+                    raise LookupError("NLTK data unavailable")
+                # Tokenize
+                tokens = nltk.word_tokenize(text.lower())
+                # Remove stopwords
+                stop_words = load_stopwords()
+                tokens = [t for t in tokens if t not in stop_words]
+                # Get parts of speech
+                pos_tags = nltk.pos_tag(tokens)
 
             # Extract features
             features = {
                 'word_count': len(tokens),
-                'avg_word_length': np.mean([len(t) for t in tokens]),
+                # Blank, scanned or stopword-only text leaves no tokens to average
+                'avg_word_length': float(np.mean([len(t) for t in tokens])) if tokens else 0.0,
                 'noun_count': len([t for t, pos in pos_tags if pos.startswith('NN')]),
                 'verb_count': len([t for t, pos in pos_tags if pos.startswith('VB')]),
                 'number_count': len([t for t in tokens if t.isdigit()]),
@@ -69,13 +181,7 @@ class MLScorer:
             tfidf_features = self.vectorizer.transform([processed_text])
 
             # Combine with statistical features
-            stat_features_array = np.array([[
-                stat_features['word_count'],
-                stat_features['avg_word_length'],
-                stat_features['noun_count'],
-                stat_features['verb_count'],
-                stat_features['number_count']
-            ]])
+            stat_features_array = np.array([[stat_features[name] for name in STAT_FEATURES]])
 
             return tfidf_features, stat_features_array
         except Exception as e:
@@ -83,26 +189,109 @@ class MLScorer:
             # Return safe defaults
             return self.vectorizer.transform([""]), np.zeros((1, 5))
 
+    def fit(self, texts, labels):
+        """Fit the vectorizer, forest and scaler on labeled resume texts (1 = good fit)"""
+        processed_texts, stat_features = zip(*(self.preprocess_text(text) for text in texts))
+        stat_array = np.array([[features[name] for name in STAT_FEATURES]
+                               for features in stat_features], dtype=float)
+
+        tfidf_features = self.vectorizer.fit_transform(processed_texts)
+        self.model.fit(tfidf_features, np.asarray(labels))
+        self.scaler.fit(stat_array)
+        return self
+
     def predict_score(self, text):
         """Predict resume score using ML model"""
+        return self.predict_scores([text])[0]
+
+    def predict_scores(self, texts):
+        """
+        Predict scores for a batch of resume texts.
+
+        Builds one sparse TF-IDF matrix and one statistics array for the whole
+        batch so the vectorizer, forest and scaler each run once.
+        """
+        texts = list(texts)
+        if not texts:
+            return []
+
+        size = sum(len(text) for text in texts)
         try:
-            # Extract features
-            tfidf_features, stat_features = self.extract_features(text)
+            with metrics.stage('ml_score', size):
+                with metrics.stage('ml_preprocess', size):
+                    processed_texts, stat_features = zip(*(self.preprocess_text(text) for text in texts))
 
-            # Make prediction
-            tfidf_score = self.model.predict_proba(tfidf_features)[0][1]
+                # Extract features
+                tfidf_features = self.vectorizer.transform(processed_texts)
+                stat_array = np.array([[features[name] for name in STAT_FEATURES]
+                                       for features in stat_features], dtype=float)
 
-            # Scale statistical features
-            scaled_stats = self.scaler.transform(stat_features)
+                # Make predictions
+                tfidf_scores = self.model.predict_proba(tfidf_features)[:, 1]
 
-            # Combine scores (70% TF-IDF, 30% statistical)
-            final_score = (0.7 * tfidf_score + 0.3 * np.mean(scaled_stats)) * 100
+                # Scale statistical features
+                scaled_stats = self.scaler.transform(stat_array)
 
-            return min(max(final_score, 0), 100)  # Ensure score is between 0 and 100
+                # Combine scores (70% TF-IDF, 30% statistical)
+                final_scores = (0.7 * tfidf_scores + 0.3 * scaled_stats.mean(axis=1)) * 100
+
+                return np.clip(final_scores, 0, 100).tolist()  # Ensure scores are between 0 and 100
 
         except Exception as e:
             print(f"Warning: Error in ML scoring: {str(e)}")
-            return 50  # Return neutral score on error
+            return [50] * len(texts)  # Return neutral scores on error
+
+    def save_artifact(self, path=None, metadata=None):
+        """Save the fitted vectorizer, model and scaler as one memory-mappable artifact"""
+        import sklearn
+
+        metadata = {
+            'model_version': time.strftime('%Y%m%dT%H%M%S'),
+            'scorer': self.kind,
+            'sklearn_version': sklearn.__version__,
+            'numpy_version': np.__version__,
+            'preprocessing': self.preprocessing,
+            **(metadata or {})
+        }
+        write_artifact(path or self.model_path, self._artifact_entries(), metadata)
+
+    def load_artifact(self, path=None):
+        """Load a model artifact; its large arrays stay mapped from disk"""
+        import sklearn
+
+        path = path or self.model_path
+        try:
+            artifact = ModelArtifact(path)
+        except (OSError, ValueError):
+            return False
+        if artifact.metadata.get('scorer', 'forest') != self.kind:
+            print(f"Warning: {path} holds a {artifact.metadata.get('scorer')} model, not {self.kind}")
+            return False
+        if artifact.metadata.get('sklearn_version') != sklearn.__version__:
+            print(f"Warning: {path} was built with scikit-learn "
+                  f"{artifact.metadata.get('sklearn_version')}, running {sklearn.__version__}")
+        self._load_entries(artifact)
+        # Features must be computed the way the model was trained
+        self.preprocessing = artifact.metadata.get('preprocessing', self.preprocessing)
+        self.metadata = artifact.metadata
+        return True
+
+    def _artifact_entries(self):
+        return {
+            'vectorizer': self.vectorizer,
+            'model': self.model,
+            'forest': FlatForest.from_sklearn(self.model),
+            'scaler': self.scaler
+        }
+
+    def _load_entries(self, artifact):
+        self.vectorizer = artifact.load('vectorizer')
+        if self.backend == 'flat':
+            self.model = (artifact.load('forest') if 'forest' in artifact
+                          else FlatForest.from_sklearn(artifact.load('model')))
+        else:
+            self.model = artifact.load('model')
+        self.scaler = artifact.load('scaler')
 
     def save_model(self, path='models'):
         """Save the trained model and vectorizer"""
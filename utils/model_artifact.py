@@ -0,0 +1,90 @@
+import json
+import mmap
+import os
+import pickle
+import struct
+
+# File layout: MAGIC, a little-endian (format version, header length) pair,
+# a JSON header, then the data section holding each entry's pickle stream
+# and its out-of-band array buffers, every block aligned to ALIGNMENT bytes.
+# Arrays are read back as zero-copy views of a read-only mmap, so processes
+# that load the same artifact share one copy of them through the page cache.
+MAGIC = b'ATSMODEL'
+FORMAT_VERSION = 1
+PREAMBLE = struct.Struct('<8sII')
+ALIGNMENT = 64
+
+
+def _pad(f):
+    f.write(b'\0' * (-f.tell() % ALIGNMENT))
+
+
+def write_artifact(path, entries, metadata=None):
+    """
+    Write a mapping of name -> picklable object as a single artifact file.
+
+    NumPy arrays inside the objects are stored as raw, aligned buffers
+    rather than inside the pickle streams.
+    """
+    pickled = {}
+    for name, obj in entries.items():
+        buffers = []
+        data = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+        pickled[name] = (data, [buffer.raw() for buffer in buffers])
+
+    # Offsets are relative to the start of the data section, which begins at
+    # the first aligned position after the header
+    layout, offset = {}, 0
+    for name, (data, buffers) in pickled.items():
+        entry = {'offset': offset, 'length': len(data), 'buffers': []}
+        offset += len(data) + (-len(data) % ALIGNMENT)
+        for buffer in buffers:
+            entry['buffers'].append([offset, buffer.nbytes])
+            offset += buffer.nbytes + (-buffer.nbytes % ALIGNMENT)
+        layout[name] = entry
+    header_bytes = json.dumps({'metadata': metadata or {}, 'entries': layout}).encode()
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header_bytes)))
+        f.write(header_bytes)
+        _pad(f)
+        for data, buffers in pickled.values():
+            f.write(data)
+            _pad(f)
+            for buffer in buffers:
+                f.write(buffer)
+                _pad(f)
+    # Replace atomically so workers never map a half-written file
+    os.replace(tmp_path, path)
+
+
+class ModelArtifact:
+    """Read-only, memory-mapped view of an artifact written by write_artifact"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, header_length = PREAMBLE.unpack_from(self.mmap, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a model artifact")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"{path} has artifact format {version}, expected {FORMAT_VERSION}")
+        header_end = PREAMBLE.size + header_length
+        header = json.loads(self.mmap[PREAMBLE.size:header_end])
+        self.metadata = header['metadata']
+        self.entries = header['entries']
+        self.data_start = header_end + (-header_end % ALIGNMENT)
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def load(self, name):
+        """Unpickle one entry; its arrays are views into the mapped file"""
+        entry = self.entries[name]
+        view = memoryview(self.mmap)[self.data_start:]
+        data = view[entry['offset']:entry['offset'] + entry['length']]
+        buffers = [view[offset:offset + length] for offset, length in entry['buffers']]
+        return pickle.loads(data, buffers=buffers)
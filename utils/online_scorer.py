@@ -0,0 +1,100 @@
+import os
+
+import numpy as np
+
+from utils.ml_scorer import MLScorer, DEFAULT_PREPROCESSING, PACKAGE_ROOT, STAT_FEATURES
+
+ONLINE_MODEL_PATH = os.environ.get('ATS_ONLINE_MODEL_PATH',
+                                   os.path.join(PACKAGE_ROOT, 'models', 'online.atsm'))
+HASH_FEATURES = 2 ** 18
+CLASSES = np.array([0, 1])
+
+
+class OnlineScorer(MLScorer):
+    """
+    Scorer that learns continuously from recruiter accept/reject decisions.
+
+    Text is hashed into a fixed feature space, so there is no vocabulary to
+    refit, and a logistic-loss linear model absorbs each mini-batch of
+    feedback with partial_fit. Memory stays fixed as feedback accumulates
+    and a checkpoint is just the weight vector and scaler bounds.
+    """
+    kind = 'online'
+    model_path = ONLINE_MODEL_PATH
+
+    def __init__(self, preprocessing=DEFAULT_PREPROCESSING, batch_size=64):
+        super().__init__(preprocessing=preprocessing)
+        self.batch_size = batch_size
+        self.pending = []
+        self.updates = 0
+
+    def _init_model(self):
+        from sklearn.feature_extraction.text import HashingVectorizer
+        from sklearn.linear_model import SGDClassifier
+        from sklearn.preprocessing import MinMaxScaler
+
+        self.vectorizer = HashingVectorizer(
+            n_features=HASH_FEATURES,
+            stop_words='english',
+            ngram_range=(1, 2),
+            alternate_sign=False
+        )
+        self.model = SGDClassifier(loss='log_loss', alpha=1e-5, random_state=42)
+        self.scaler = MinMaxScaler()
+
+    def partial_fit(self, texts, labels):
+        """Update the model and scaler with one mini-batch of labeled texts"""
+        processed_texts, stat_features = zip(*(self.preprocess_text(text) for text in texts))
+        stat_array = np.array([[features[name] for name in STAT_FEATURES]
+                               for features in stat_features], dtype=float)
+
+        # Weights loaded from an artifact are read-only views of its mapping;
+        # copy them only once feedback actually updates them
+        if hasattr(self.model, 'coef_') and not self.model.coef_.flags.writeable:
+            self.model.coef_ = np.array(self.model.coef_)
+            self.model.intercept_ = np.array(self.model.intercept_)
+
+        self.model.partial_fit(self.vectorizer.transform(processed_texts), np.asarray(labels),
+                               classes=CLASSES)
+        self.scaler.partial_fit(stat_array)
+        self.updates += len(processed_texts)
+        return self
+
+    def fit(self, texts, labels):
+        """Train on a labeled corpus in mini-batches, continuing from the current weights"""
+        texts, labels = list(texts), list(labels)
+        for start in range(0, len(texts), self.batch_size):
+            self.partial_fit(texts[start:start + self.batch_size],
+                             labels[start:start + self.batch_size])
+        return self
+
+    def add_feedback(self, text, accepted):
+        """Queue one recruiter decision; the model updates once a mini-batch is full"""
+        self.pending.append((text, int(bool(accepted))))
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Apply any queued feedback"""
+        if self.pending:
+            texts, labels = zip(*self.pending)
+            self.pending = []
+            self.partial_fit(texts, labels)
+
+    def save_artifact(self, path=None, metadata=None):
+        """Checkpoint the model, including any queued feedback"""
+        self.flush()
+        super().save_artifact(path, {'updates': self.updates, **(metadata or {})})
+
+    def _artifact_entries(self):
+        return {
+            'vectorizer': self.vectorizer,
+            'model': self.model,
+            'scaler': self.scaler
+        }
+
+    def _load_entries(self, artifact):
+        self.vectorizer = artifact.load('vectorizer')
+        self.model = artifact.load('model')
+        self.scaler = artifact.load('scaler')
+        self.updates = artifact.metadata.get('updates', 0)
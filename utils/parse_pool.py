@@ -0,0 +1,250 @@
+import atexit
+import io
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+import time
+import types
+from functools import lru_cache
+
+from utils.file_parser import ResumeLimitError, parse_resume
+
+# Per-file budgets for isolated parsing. A worker that runs past the timeout
+# or grows past the RSS cap is killed and replaced.
+PARSE_TIMEOUT = float(os.environ.get('ATS_PARSE_TIMEOUT', 20))
+PARSE_MAX_RSS = int(os.environ.get('ATS_PARSE_MAX_RSS', 512 * 1024 * 1024))
+PARSE_WORKERS = int(os.environ.get('ATS_PARSE_WORKERS', 2))
+
+# Parse uploads and batches in isolated workers (set ATS_PARSE_ISOLATION=0
+# to parse in-process, e.g. where subprocesses are not allowed)
+PARSE_ISOLATION = os.environ.get('ATS_PARSE_ISOLATION', '1') != '0'
+
+# Workers are started from a single-threaded fork server (or spawned where
+# that is unavailable), never forked from the multithreaded web server
+START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+# Workers are recycled after this many files to bound slow leaks
+MAX_TASKS_PER_WORKER = 200
+# How often the parent checks a busy worker's memory, in seconds
+POLL_INTERVAL = 0.05
+
+PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+class ParseTimeoutError(ResumeLimitError):
+    """Raised when parsing a file takes longer than the pool's timeout"""
+    def __init__(self, filename, timeout):
+        super().__init__(f"Parsing {filename} took longer than {timeout:g}s and was stopped")
+        self.filename = filename
+        self.timeout = timeout
+
+    def __reduce__(self):
+        return type(self), (self.filename, self.timeout)
+
+
+class ParseMemoryError(ResumeLimitError):
+    """Raised when parsing a file needs more memory than the pool allows"""
+    def __init__(self, filename, max_rss):
+        super().__init__(f"Parsing {filename} needed more than {max_rss // (1024 * 1024)} MB and was stopped")
+        self.filename = filename
+        self.max_rss = max_rss
+
+    def __reduce__(self):
+        return type(self), (self.filename, self.max_rss)
+
+
+def _read_statm(pid, field):
+    try:
+        with open(f'/proc/{pid}/statm') as f:
+            return int(f.read().split()[field]) * PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+def read_rss(pid):
+    """Return a process's resident set size in bytes, or None where /proc is unavailable"""
+    return _read_statm(pid, 1)
+
+
+def limit_address_space(max_bytes):
+    """
+    Cap how much more address space this process may map, where the OS
+    allows it. Allocations past the cap fail at once with MemoryError, where
+    the parent's RSS polling could be outrun by one large allocation.
+    """
+    try:
+        import resource
+    except ImportError:
+        return
+    size = _read_statm('self', 0)
+    if size is None:
+        return
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    limit = size + max_bytes
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def _worker_main(conn, parser, max_rss):
+    """Parse files sent over conn until the parent closes it"""
+    limit_address_space(max_rss)
+    while True:
+        try:
+            name, data = conn.recv()
+        except EOFError:
+            return
+        upload = io.BytesIO(data)
+        upload.name = name
+        try:
+            conn.send(('ok', parser(upload)))
+        except MemoryError:
+            conn.send(('memory', None))
+        except Exception as e:
+            conn.send(('error', e))
+
+
+_start_lock = threading.Lock()
+
+
+def _start_without_main(process):
+    """
+    Start a worker process without handing it the __main__ script.
+
+    Spawned and fork-server children normally re-run the parent's main
+    script before unpickling their target. Under `streamlit run` that script
+    is the whole app, so a bare module stands in for it while the worker
+    starts; workers only need this module and the parser's.
+    """
+    with _start_lock:
+        main = sys.modules['__main__']
+        placeholder = sys.modules['__main__'] = types.ModuleType('__main__')
+        try:
+            process.start()
+        finally:
+            # Streamlit may have installed the next run's script meanwhile
+            if sys.modules['__main__'] is placeholder:
+                sys.modules['__main__'] = main
+
+
+class _Worker:
+    def __init__(self, context, parser, max_rss):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn, parser, max_rss), daemon=True)
+        _start_without_main(self.process)
+        child_conn.close()
+        self.tasks = 0
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+    def stop(self):
+        self.conn.close()
+        self.process.join(1)
+        if self.process.is_alive():
+            self.kill()
+
+
+class ParsePool:
+    """
+    Pool of worker processes that parse uploads out of the caller's process.
+
+    Each call borrows an idle worker, sends it the file bytes and waits for
+    the text while watching the wall clock and the worker's RSS. A worker
+    that overruns either budget, or dies, is killed and replaced before the
+    error reaches the caller, so one malformed file cannot hang or exhaust
+    the server. Workers also cap their own address space at max_rss past
+    their size at startup. parser is the function each worker runs on a
+    file (parse_resume); it must be importable from a module other than
+    __main__. Safe to share between threads.
+    """
+    def __init__(self, workers=PARSE_WORKERS, timeout=PARSE_TIMEOUT, max_rss=PARSE_MAX_RSS,
+                 max_tasks=MAX_TASKS_PER_WORKER, parser=parse_resume):
+        self.size = workers
+        self.timeout = timeout
+        self.max_rss = max_rss
+        self.max_tasks = max_tasks
+        self.parser = parser
+        self.context = multiprocessing.get_context(START_METHOD)
+        if START_METHOD == 'forkserver':
+            # Workers fork from a server with the parsers already imported
+            self.context.set_forkserver_preload(['utils.file_parser'])
+        self.idle = queue.Queue()
+        self.lock = threading.Lock()
+        self.workers = set()
+        for _ in range(workers):
+            self.idle.put(self._spawn())
+
+    def _spawn(self):
+        worker = _Worker(self.context, self.parser, self.max_rss)
+        with self.lock:
+            self.workers.add(worker)
+        return worker
+
+    def _retire(self, worker):
+        with self.lock:
+            self.workers.discard(worker)
+        worker.kill()
+
+    def parse(self, data, filename):
+        """Parse file bytes in a worker; returns (text, file_type) like parse_resume"""
+        worker = self.idle.get()
+        try:
+            status, result = self._run(worker, data, filename)
+        except BaseException:
+            # The worker may still be busy with this file; never reuse it
+            self._retire(worker)
+            self.idle.put(self._spawn())
+            raise
+
+        worker.tasks += 1
+        # A worker that hit MemoryError may be left fragmented; start fresh
+        if status == 'memory' or worker.tasks >= self.max_tasks:
+            self._retire(worker)
+            worker = self._spawn()
+        self.idle.put(worker)
+
+        if status == 'memory':
+            raise ParseMemoryError(filename, self.max_rss)
+        if status == 'error':
+            raise result
+        return result
+
+    def _run(self, worker, data, filename):
+        worker.conn.send((filename, data))
+        deadline = time.monotonic() + self.timeout
+        while not worker.conn.poll(POLL_INTERVAL):
+            if time.monotonic() > deadline:
+                raise ParseTimeoutError(filename, self.timeout)
+            rss = read_rss(worker.process.pid)
+            if rss is not None and rss > self.max_rss:
+                raise ParseMemoryError(filename, self.max_rss)
+            if not worker.process.is_alive():
+                break
+        try:
+            return worker.conn.recv()
+        except EOFError:
+            # The pipe can close before the exit is reaped
+            worker.process.join(1)
+            file_type = filename.split('.')[-1].upper()
+            raise Exception(f"Error parsing {file_type} file: parser exited with code "
+                            f"{worker.process.exitcode}") from None
+
+    def close(self):
+        """Stop every worker"""
+        with self.lock:
+            workers, self.workers = self.workers, set()
+        for worker in workers:
+            worker.stop()
+
+
+@lru_cache(maxsize=1)
+def get_parse_pool():
+    """Return the process-wide parse pool, started on first use"""
+    pool = ParsePool()
+    atexit.register(pool.close)
+    return pool
@@ -3,35 +3,72 @@ from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
 from reportlab.lib.units import inch
+from collections import OrderedDict, deque
+from functools import lru_cache
+from multiprocessing import Pool
+import hashlib
 import io
+import json
+import os
+import threading
+import zipfile
+from utils import metrics
 
+# Generated downloads kept in memory, keyed by (result hash, format)
+REPORT_CACHE_SIZE = 64
+_report_cache = OrderedDict()
+_report_lock = threading.Lock()
+
+# Reports rendered ahead of the zip writer, per worker process
+REPORTS_IN_FLIGHT_PER_WORKER = 4
+
+@lru_cache(maxsize=1)
+def report_styles():
+    """Build the report's paragraph and table styles once per process"""
+    styles = getSampleStyleSheet()
+    styles.add(ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        spaceAfter=30
+    ))
+    styles.add(ParagraphStyle(
+        'Score',
+        parent=styles['Heading2'],
+        fontSize=18,
+        textColor=colors.HexColor('#2E7D32')
+    ))
+    section_table_style = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 14),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+        ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 1), (-1, -1), 12),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ])
+    return styles, section_table_style
+
+@metrics.timed('create_pdf_report')
 def create_pdf_report(analysis_results):
     """
     Generate a PDF report from the ATS analysis results
     """
     buffer = io.BytesIO()
     doc = SimpleDocTemplate(buffer, pagesize=letter)
-    styles = getSampleStyleSheet()
+    styles, section_table_style = report_styles()
     story = []
 
     # Title
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        spaceAfter=30
-    )
-    story.append(Paragraph("ATS Resume Analysis Report", title_style))
+    story.append(Paragraph("ATS Resume Analysis Report", styles['CustomTitle']))
     story.append(Spacer(1, 12))
 
     # Overall Score
-    score_style = ParagraphStyle(
-        'Score',
-        parent=styles['Heading2'],
-        fontSize=18,
-        textColor=colors.HexColor('#2E7D32')
-    )
-    story.append(Paragraph(f"Overall Score: {analysis_results['overall_score']}%", score_style))
+    story.append(Paragraph(f"Overall Score: {analysis_results['overall_score']}%", styles['Score']))
     story.append(Spacer(1, 12))
 
     # Section Scores
@@ -41,19 +78,7 @@ def create_pdf_report(analysis_results):
         [["Section", "Score"]] + section_data,
         colWidths=[4*inch, 2*inch]
     )
-    section_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 14),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-        ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 1), (-1, -1), 12),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    section_table.setStyle(section_table_style)
     story.append(section_table)
     story.append(Spacer(1, 20))
 
@@ -82,3 +107,85 @@ def create_pdf_report(analysis_results):
     doc.build(story)
     buffer.seek(0)
     return buffer
+
+def result_hash(analysis_results):
+    """Stable digest of an analysis result"""
+    canonical = json.dumps(analysis_results, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+def report_bytes(analysis_results, fmt='pdf'):
+    """
+    Return a downloadable report ('pdf' or 'json') for an analysis result.
+
+    Reports are generated on first request and reused for any result with
+    the same content, so repeat downloads cost only a hash.
+    """
+    key = (result_hash(analysis_results), fmt)
+    with _report_lock:
+        if key in _report_cache:
+            _report_cache.move_to_end(key)
+            return _report_cache[key]
+
+    if fmt == 'pdf':
+        data = create_pdf_report(analysis_results).getvalue()
+    elif fmt == 'json':
+        data = json.dumps(analysis_results, indent=2, default=str).encode()
+    else:
+        raise ValueError(f"Unknown report format: {fmt}")
+
+    with _report_lock:
+        _report_cache[key] = data
+        while len(_report_cache) > REPORT_CACHE_SIZE:
+            _report_cache.popitem(last=False)
+    return data
+
+def _render_report(item):
+    """Render one (name, analysis_results) pair; runs in a worker process"""
+    name, analysis_results = item
+    return name, create_pdf_report(analysis_results).getvalue()
+
+def _report_entry_name(name, used):
+    """Zip entry name for a report, made unique within the archive"""
+    stem = os.path.splitext(os.path.basename(name))[0] or 'resume'
+    entry = f"{stem}_ats_report.pdf"
+    suffix = 2
+    while entry in used:
+        entry = f"{stem}_ats_report-{suffix}.pdf"
+        suffix += 1
+    used.add(entry)
+    return entry
+
+def write_report_zip(items, out, workers=None):
+    """
+    Render PDF reports for many (name, analysis_results) pairs into one zip.
+
+    Reports are rendered across a process pool and written to the archive
+    in input order as they finish. Only a few reports per worker are held
+    in memory at once, so the batch can be any size. out is a path or a
+    writable binary file. Returns the number of reports written.
+    """
+    used = set()
+    written = 0
+    with zipfile.ZipFile(out, 'w', zipfile.ZIP_DEFLATED) as archive:
+        if workers == 1:
+            for item in items:
+                name, data = _render_report(item)
+                archive.writestr(_report_entry_name(name, used), data)
+                written += 1
+            return written
+
+        with Pool(processes=workers, initializer=report_styles) as pool:
+            # Submit ahead of the writer, but never more than the window
+            window = (workers or os.cpu_count() or 1) * REPORTS_IN_FLIGHT_PER_WORKER
+            pending = deque()
+            for item in items:
+                pending.append(pool.apply_async(_render_report, (item,)))
+                if len(pending) >= window:
+                    name, data = pending.popleft().get()
+                    archive.writestr(_report_entry_name(name, used), data)
+                    written += 1
+            while pending:
+                name, data = pending.popleft().get()
+                archive.writestr(_report_entry_name(name, used), data)
+                written += 1
+    return written
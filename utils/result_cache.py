@@ -0,0 +1,191 @@
+import hashlib
+import io
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from contextlib import nullcontext
+from functools import lru_cache
+
+from utils import metrics
+from utils.ats_analyzer import analyze_resume
+from utils.file_parser import DEFAULT_LIMITS, DEFAULT_PDF_BACKEND, parse_resume
+from utils.ml_scorer import DEFAULT_PREPROCESSING, DEFAULT_SCORER, MODEL_PATH
+from utils.online_scorer import ONLINE_MODEL_PATH
+from utils.parse_pool import PARSE_ISOLATION, get_parse_pool
+from utils.skill_matcher import SKILL_TAXONOMY_PATH
+
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CACHE_PATH = os.environ.get(
+    'ATS_CACHE_PATH',
+    os.path.join(os.path.expanduser('~'), '.cache', 'ats-resume-analyzer', 'results.sqlite')
+)
+
+# Oldest entries fetched per eviction query
+EVICT_BATCH = 64
+
+# Files whose contents decide an analysis result; editing any of them
+# changes the fingerprint and so invalidates every cached entry
+RULE_FILES = [
+    'assets/stopwords_en.txt',
+    'utils/ats_analyzer.py',
+    'utils/file_parser.py',
+    'utils/forest_engine.py',
+    'utils/ml_scorer.py',
+    'utils/model_artifact.py',
+    'utils/online_scorer.py',
+    'utils/resume_document.py',
+    'utils/skill_matcher.py'
+]
+
+
+def analysis_fingerprint():
+    """Hash the rule sources, skill taxonomy, model artifact and scorer/parser settings into a version string"""
+    settings = f'{DEFAULT_SCORER}:{DEFAULT_PREPROCESSING}:{DEFAULT_PDF_BACKEND}:{tuple(DEFAULT_LIMITS)}'
+    digest = hashlib.sha256(settings.encode())
+    for path in [os.path.join(PACKAGE_ROOT, name) for name in RULE_FILES] + [SKILL_TAXONOMY_PATH]:
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    # The model artifact can be large, so it contributes its size and mtime only
+    model_path = ONLINE_MODEL_PATH if DEFAULT_SCORER == 'online' else MODEL_PATH
+    if os.path.exists(model_path):
+        stat = os.stat(model_path)
+        digest.update(f'{model_path}:{stat.st_size}:{stat.st_mtime_ns}'.encode())
+    return digest.hexdigest()[:16]
+
+
+class ResultCache:
+    """
+    Two-tier cache of parse and analysis results keyed by upload content.
+
+    A bounded in-process LRU sits in front of a size-capped SQLite file.
+    Entries written under a different analysis fingerprint are dropped when
+    the cache is opened.
+    """
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_entries=128, max_bytes=256 * 1024 * 1024,
+                 version=None):
+        self.version = version or analysis_fingerprint()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.memory = OrderedDict()
+        self.lock = threading.Lock()
+
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS results (
+                key TEXT PRIMARY KEY,
+                version TEXT NOT NULL,
+                value BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                accessed REAL NOT NULL
+            )""")
+        self.db.execute("CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)")
+        self.db.execute("DELETE FROM results WHERE version != ?", (self.version,))
+        self.db.commit()
+        # Running byte total of the disk tier, kept in step with every insert
+        # and delete so a put never has to sum the table
+        self.total_bytes = self.db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+
+    def key_for(self, data, filename=''):
+        """Return the cache key for uploaded file bytes"""
+        # The extension picks the parser, so it is part of the content identity
+        extension = os.path.splitext(filename)[1].lower()
+        return f'{hashlib.sha256(data).hexdigest()}{extension}:{self.version}'
+
+    def get(self, key):
+        """Return the cached value for key, or None"""
+        with self.lock:
+            if key in self.memory:
+                self.memory.move_to_end(key)
+                return self.memory[key]
+
+            row = self.db.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self.db.execute("UPDATE results SET accessed = ? WHERE key = ?", (time.time(), key))
+            self.db.commit()
+            value = json.loads(zlib.decompress(row[0]))
+            self._remember(key, value)
+            return value
+
+    def put(self, key, value):
+        """Store value under key in both tiers, evicting the oldest entries if over budget"""
+        blob = zlib.compress(json.dumps(value, default=str).encode())
+        with self.lock:
+            self._remember(key, value)
+            row = self.db.execute("SELECT size FROM results WHERE key = ?", (key,)).fetchone()
+            self.db.execute(
+                "INSERT OR REPLACE INTO results (key, version, value, size, accessed) VALUES (?, ?, ?, ?, ?)",
+                (key, self.version, blob, len(blob), time.time())
+            )
+            self.total_bytes += len(blob) - (row[0] if row else 0)
+            self._evict()
+            self.db.commit()
+
+    def _remember(self, key, value):
+        self.memory[key] = value
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.max_entries:
+            self.memory.popitem(last=False)
+
+    def _evict(self):
+        while self.total_bytes > self.max_bytes:
+            rows = self.db.execute(
+                "SELECT key, size FROM results ORDER BY accessed LIMIT ?", (EVICT_BATCH,)
+            ).fetchall()
+            if not rows:
+                self.total_bytes = 0
+                return
+            stale = []
+            for key, size in rows:
+                if self.total_bytes <= self.max_bytes:
+                    break
+                stale.append((key,))
+                self.total_bytes -= size
+            self.db.executemany("DELETE FROM results WHERE key = ?", stale)
+
+    def close(self):
+        self.db.close()
+
+
+@lru_cache(maxsize=1)
+def get_result_cache():
+    """Return the process-wide result cache"""
+    return ResultCache()
+
+
+def analyze_upload(uploaded_file, cache=None):
+    """
+    Parse and analyze an uploaded file, reusing the cached result for
+    identical content. Returns (resume_text, file_type, analysis_results).
+    """
+    cache = cache or get_result_cache()
+    data = uploaded_file.getvalue() if hasattr(uploaded_file, 'getvalue') else uploaded_file.read()
+    key = cache.key_for(data, uploaded_file.name)
+
+    cached = cache.get(key)
+    if cached is not None:
+        return cached['text'], cached['file_type'], cached['analysis']
+
+    with metrics.collect() if metrics.TIMINGS_ENABLED else nullcontext():
+        if PARSE_ISOLATION:
+            # Timed here, since the worker process keeps its own metrics
+            with metrics.stage('parse_resume', len(data)):
+                text, file_type = get_parse_pool().parse(data, uploaded_file.name)
+        else:
+            upload = io.BytesIO(data)
+            upload.name = uploaded_file.name
+            text, file_type = parse_resume(upload)
+        analysis = analyze_resume(text, timings=metrics.TIMINGS_ENABLED)
+    if metrics.ENABLED:
+        metrics.write_prometheus()
+
+    # Timings describe this run only, so they are not cached
+    cached_analysis = {name: value for name, value in analysis.items() if name != 'timings'}
+    cache.put(key, {'text': text, 'file_type': file_type, 'analysis': cached_analysis})
+    return text, file_type, analysis
@@ -0,0 +1,137 @@
+import re
+
+# Patterns shared by several rules, compiled once at import
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+PHONE_PATTERN = re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b')
+NON_ASCII_PATTERN = re.compile(r'[^\x00-\x7F]+')
+YEAR_PATTERN = re.compile(r'(?:19|20)\d{2}')
+
+# Heading aliases for each canonical section, used by the line segmenter
+SECTION_HEADINGS = {
+    'summary': ('summary', 'professional summary', 'career summary', 'objective',
+                'career objective', 'profile', 'professional profile', 'about me'),
+    'experience': ('experience', 'work experience', 'professional experience',
+                   'relevant experience', 'employment', 'employment history',
+                   'work history', 'career history'),
+    'education': ('education', 'academic background', 'education and training',
+                  'academic qualifications', 'qualifications'),
+    'skills': ('skills', 'technical skills', 'core skills', 'key skills',
+               'skills and abilities', 'core competencies', 'competencies',
+               'expertise', 'areas of expertise'),
+    'projects': ('projects', 'key projects', 'personal projects', 'portfolio'),
+    'certifications': ('certifications', 'certificates', 'licenses',
+                       'licenses and certifications'),
+    'awards': ('awards', 'honors', 'achievements', 'awards and honors'),
+    'publications': ('publications',),
+    'languages': ('languages',),
+    'interests': ('interests', 'hobbies'),
+    'references': ('references',),
+    'volunteer': ('volunteer', 'volunteering', 'volunteer experience')
+}
+
+# Keyword fallback for resumes whose headings were lost in extraction
+# (e.g. PDFs that come out as one long line)
+SECTION_KEYWORDS = {
+    'experience': (re.compile(r'(?i)experience'), re.compile(r'(?i)education|skills')),
+    'education': (re.compile(r'(?i)education'), re.compile(r'(?i)experience|skills')),
+    'skills': (re.compile(r'(?i)skills'), re.compile(r'(?i)experience|education'))
+}
+
+HEADING_NOISE = re.compile(r'[^a-z]+')
+MAX_HEADING_LENGTH = 40
+
+
+def _heading_key(line):
+    """Normalize a line to the form used for heading lookups"""
+    return ' '.join(HEADING_NOISE.sub(' ', line.lower()).split())
+
+
+HEADING_INDEX = {
+    _heading_key(alias): section
+    for section, aliases in SECTION_HEADINGS.items()
+    for alias in aliases
+}
+
+
+def detect_heading(line):
+    """Return the canonical section a heading line introduces, or None"""
+    # A heading is either a short line of its own ("WORK EXPERIENCE") or an
+    # inline label ("Skills: python, sql")
+    label, sep, _ = line.partition(':')
+    if len(label) > MAX_HEADING_LENGTH:
+        return None
+    if sep:
+        return HEADING_INDEX.get(_heading_key(label))
+    return HEADING_INDEX.get(_heading_key(line))
+
+
+def segment_sections(text, lines=None):
+    """
+    Split resume text into sections in a single pass over its lines.
+
+    Returns a dict mapping canonical section names to (start, end) offsets
+    into text. A section runs from its heading line to the next heading.
+    """
+    if lines is None:
+        lines = text.split('\n')
+
+    spans = {}
+    current = None
+    start = offset = 0
+    for line in lines:
+        section = detect_heading(line) if line.strip() else None
+        if section is not None:
+            if current is not None and current not in spans:
+                spans[current] = (start, offset)
+            current, start = section, offset
+        offset += len(line) + 1
+    if current is not None and current not in spans:
+        spans[current] = (start, len(text))
+
+    # Fall back to keyword search for core sections without a heading
+    for section, (begin, stop) in SECTION_KEYWORDS.items():
+        if section in spans:
+            continue
+        match = begin.search(text)
+        if match:
+            end = stop.search(text, match.end())
+            spans[section] = (match.start(), end.start() if end else len(text))
+
+    return spans
+
+
+class ResumeDocument:
+    """
+    Precomputed view of a resume's text, built once and shared by every rule
+    """
+    def __init__(self, text):
+        self.text = text
+        self.lower = text.lower()
+        self.lines = text.split('\n')
+        self.line_count = len(self.lines)
+        self.length = len(text)
+
+        # Hits for the patterns every scorer and checker asks about
+        self.has_email = EMAIL_PATTERN.search(text) is not None
+        self.has_phone = PHONE_PATTERN.search(text) is not None
+        self.has_non_ascii = NON_ASCII_PATTERN.search(text) is not None
+        self.has_year = YEAR_PATTERN.search(text) is not None
+
+        # Section boundaries as (start, end) offsets into text
+        self.sections = segment_sections(text, self.lines)
+
+        self._hits = {}
+
+    def contains(self, pattern):
+        """Return whether a compiled pattern occurs in the lowercased text"""
+        hit = self._hits.get(pattern)
+        if hit is None:
+            hit = self._hits[pattern] = pattern.search(self.lower) is not None
+        return hit
+
+    def section(self, name):
+        """Return the text of a section, or None if it was not found"""
+        span = self.sections.get(name)
+        if span is None:
+            return None
+        return self.text[span[0]:span[1]]
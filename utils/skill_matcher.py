@@ -0,0 +1,105 @@
+import csv
+import os
+import re
+from functools import lru_cache
+
+DEFAULT_TAXONOMY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                'assets', 'skills_taxonomy.csv')
+SKILL_TAXONOMY_PATH = os.environ.get('ATS_SKILL_TAXONOMY', DEFAULT_TAXONOMY)
+
+# Words keep inner dots and +/# so "node.js", "c++" and "c#" stay whole;
+# hyphens and slashes split, so "ci/cd" matches "ci cd" and "ci-cd"
+TOKEN_PATTERN = re.compile(r'[a-z0-9+#]+(?:\.[a-z0-9+#]+)*')
+
+# Trie key marking the end of a phrase; never produced by TOKEN_PATTERN
+_END = ''
+
+
+def tokenize(text):
+    """Split lowercased text into the word tokens the trie is keyed on"""
+    return TOKEN_PATTERN.findall(text)
+
+
+class SkillMatcher:
+    """
+    Word-level trie over a skill taxonomy.
+
+    Matching walks the trie from every token of the text, so the cost per
+    resume depends on the text length and the longest phrase, not on how
+    many skills the taxonomy holds. Only whole words match.
+    """
+    def __init__(self):
+        self.root = {}
+        self.categories = []
+        self.skill_count = 0
+
+    def add(self, skill, category, aliases=()):
+        """Register a canonical skill and the phrases that refer to it"""
+        if category not in self.categories:
+            self.categories.append(category)
+        self.skill_count += 1
+        for phrase in (skill, *aliases):
+            tokens = tokenize(phrase.lower())
+            if not tokens:
+                continue
+            node = self.root
+            for token in tokens:
+                node = node.setdefault(token, {})
+            node.setdefault(_END, set()).add((category, skill))
+
+    def find(self, text):
+        """Return the set of (category, skill) pairs mentioned in lowercased text"""
+        tokens = tokenize(text)
+        root = self.root
+        found = set()
+        for i in range(len(tokens)):
+            node = root.get(tokens[i])
+            j = i + 1
+            while node is not None:
+                hits = node.get(_END)
+                if hits:
+                    found.update(hits)
+                if j == len(tokens):
+                    break
+                node = node.get(tokens[j])
+                j += 1
+        return found
+
+    def canonical(self, phrase):
+        """Return the canonical skill a whole phrase names ("k8s" -> "kubernetes"), or None"""
+        tokens = tokenize(phrase.lower())
+        node = self.root
+        for token in tokens:
+            node = node.get(token)
+            if node is None:
+                return None
+        hits = node.get(_END) if tokens else None
+        # An alias shared by several skills resolves to the first by name
+        return min(skill for _, skill in hits) if hits else None
+
+    def match(self, text):
+        """Return matched canonical skills grouped by category, each list sorted"""
+        skills = {category: set() for category in self.categories}
+        for category, skill in self.find(text):
+            skills[category].add(skill)
+        return {category: sorted(found) for category, found in skills.items()}
+
+
+def read_taxonomy(path):
+    """Yield (skill, category, aliases) rows from a taxonomy CSV file"""
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            skill = row['skill'].strip().lower()
+            if not skill:
+                continue
+            aliases = [a.strip() for a in (row.get('aliases') or '').split('|') if a.strip()]
+            yield skill, row['category'].strip(), aliases
+
+
+@lru_cache(maxsize=4)
+def load_skill_matcher(path=SKILL_TAXONOMY_PATH):
+    """Build the matcher for a taxonomy file once and reuse it"""
+    matcher = SkillMatcher()
+    for skill, category, aliases in read_taxonomy(path):
+        matcher.add(skill, category, aliases)
+    return matcher
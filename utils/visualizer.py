@@ -1,8 +1,9 @@
 import plotly.graph_objects as go
 import streamlit as st
 
-def create_score_chart(score):
-    """Create a gauge chart for overall score"""
+@st.cache_resource(show_spinner=False, max_entries=64)
+def score_chart_figure(score):
+    """Build the overall score gauge; shared across reruns, which only read it"""
     fig = go.Figure(go.Indicator(
         mode = "gauge+number",
         value = score,
@@ -20,10 +21,15 @@ def create_score_chart(score):
     ))
     
     fig.update_layout(height=300)
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
 
-def create_section_breakdown(section_scores):
-    """Create bar chart for section-wise scores"""
+def create_score_chart(score, key=None):
+    """Create a gauge chart for overall score"""
+    st.plotly_chart(score_chart_figure(score), use_container_width=True, key=key)
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def section_breakdown_figure(section_scores):
+    """Build the section score bar chart; shared across reruns, which only read it"""
     fig = go.Figure()
     
     sections = list(section_scores.keys())
@@ -40,5 +46,8 @@ def create_section_breakdown(section_scores):
         height=300,
         showlegend=False
     )
-    
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
+
+def create_section_breakdown(section_scores, key=None):
+    """Create bar chart for section-wise scores"""
+    st.plotly_chart(section_breakdown_figure(section_scores), use_container_width=True, key=key)